@@ -0,0 +1,399 @@
+// Global Search for Homepage
+
+let searchIndex = null;  // Entries, in index order
+let searchTerms = null;  // Inverted index (see scripts/search_index.py)
+
+// Posting flags of a term in an entry's core fields (scripts/search_index.py)
+const NAME_EXACT = 1;
+const NAME_START = 2;
+const NAME_WORD = 4;
+const TAG_EXACT = 8;
+const TAG_START = 16;
+const TAG_WORD = 32;
+const CATEGORY = 64;
+const TYPE = 128;
+
+// Used with search-index.json, which carries no weights of its own
+const DEFAULT_WEIGHTS = {
+    name: [90, 60, 40],
+    tags: [30, 15, 10],
+    description: 20,
+    category: 10,
+    type: 10,
+    name_query: 50
+};
+
+function splitTerms(text) {
+    return (text || '')
+        .toLowerCase()
+        .split(/[^a-z0-9]+/)
+        .filter(term => term.length >= 2);
+}
+
+function tokenizeQuery(query) {
+    return splitTerms(query);
+}
+
+function createSearchTerms(weights) {
+    return {
+        weights,
+        core: new Map(),
+        coreKeys: [],
+        description: new Map(),
+        descriptionKeys: []
+    };
+}
+
+// Merge delta-encoded postings ([entry, ...extra] per posting) into a Map
+function addPostings(target, terms, stride) {
+    Object.entries(terms).forEach(([term, encoded]) => {
+        const postings = target.get(term) || [];
+        let entry = 0;
+        for (let i = 0; i < encoded.length; i += stride) {
+            entry += encoded[i];
+            postings.push(entry);
+            for (let j = 1; j < stride; j++) {
+                postings.push(encoded[i + j]);
+            }
+        }
+        target.set(term, postings);
+    });
+}
+
+function sortedKeys(map) {
+    return [...map.keys()].sort();
+}
+
+// Build the same inverted index as scripts/search_index.py from full entries
+function indexEntries(entries) {
+    const terms = createSearchTerms(DEFAULT_WEIGHTS);
+    const add = (map, term, posting) => {
+        if (!map.has(term)) map.set(term, []);
+        map.get(term).push(...posting);
+    };
+
+    entries.forEach((entry, number) => {
+        const flags = new Map();
+        const flag = (term, value) => flags.set(term, (flags.get(term) || 0) | value);
+
+        const name = entry.name.toLowerCase();
+        splitTerms(name).forEach(term => {
+            flag(term, NAME_WORD);
+            if (name === term) flag(term, NAME_EXACT);
+            if (name.startsWith(term)) flag(term, NAME_START);
+        });
+        (entry.tags || []).forEach(rawTag => {
+            const tag = rawTag.toLowerCase();
+            splitTerms(tag).forEach(term => {
+                flag(term, TAG_WORD);
+                if (tag === term) flag(term, TAG_EXACT);
+                if (tag.startsWith(term)) flag(term, TAG_START);
+            });
+        });
+        splitTerms(entry.category).forEach(term => flag(term, CATEGORY));
+        splitTerms(entry.type).forEach(term => flag(term, TYPE));
+
+        flags.forEach((value, term) => add(terms.core, term, [number, value]));
+        new Set(splitTerms(entry.description)).forEach(term => {
+            add(terms.description, term, [number]);
+        });
+    });
+
+    terms.coreKeys = sortedKeys(terms.core);
+    terms.descriptionKeys = sortedKeys(terms.description);
+    return terms;
+}
+
+async function fetchJson(path) {
+    const response = await fetch(`${window.BASE_URL || ''}/${path}`);
+    if (!response.ok) {
+        throw new Error(`${path}: HTTP ${response.status}`);
+    }
+    return response.json();
+}
+
+// Load the small core shard (names, tags, categories and their terms) so search
+// works right away; descriptions and their terms arrive in the background.
+async function loadShardedIndex(onDetailsLoaded) {
+    const manifest = await fetchJson('search/manifest.json');
+    const core = await fetchJson(`search/${manifest.core.file}`);
+    const titles = core.category_titles;
+
+    searchIndex = core.entries.map(entry => ({
+        ...entry,
+        category_title: titles[entry.is_boilerplate ? 'boilerplate' : 'agent'][entry.category],
+        description: ''
+    }));
+    searchTerms = createSearchTerms(core.weights);
+    addPostings(searchTerms.core, core.terms, 2);
+    searchTerms.coreKeys = sortedKeys(searchTerms.core);
+    console.log('Search index loaded:', searchIndex.length, 'entries');
+
+    Promise.all(manifest.details.map(async shard => {
+        const details = await fetchJson(`search/${shard.file}`);
+        details.descriptions.forEach((description, offset) => {
+            searchIndex[details.start + offset].description = description;
+        });
+        addPostings(searchTerms.description, details.terms, 1);
+        searchTerms.descriptionKeys = sortedKeys(searchTerms.description);
+    }))
+        .then(onDetailsLoaded)
+        .catch(error => console.error('Failed to load search descriptions:', error));
+}
+
+// Load search index, falling back to the single-file index
+async function loadSearchIndex(onDetailsLoaded = () => {}) {
+    try {
+        await loadShardedIndex(onDetailsLoaded);
+        return;
+    } catch (error) {
+        console.warn('Sharded search index unavailable, loading search-index.json:', error);
+    }
+
+    try {
+        searchIndex = await fetchJson('search-index.json');
+        console.log('Search index loaded:', searchIndex.length, 'entries');
+    } catch (error) {
+        console.error('Failed to load search index:', error);
+        searchIndex = [];
+    }
+    searchTerms = indexEntries(searchIndex);
+}
+
+// Terms starting with prefix, by binary search over the sorted term list
+function termsWithPrefix(keys, prefix) {
+    let low = 0;
+    let high = keys.length;
+    while (low < high) {
+        const middle = (low + high) >> 1;
+        if (keys[middle] < prefix) {
+            low = middle + 1;
+        } else {
+            high = middle;
+        }
+    }
+    const terms = [];
+    for (let i = low; i < keys.length && keys[i].startsWith(prefix); i++) {
+        terms.push(keys[i]);
+    }
+    return terms;
+}
+
+// Score of one query token for every entry containing it: Map(entry -> score)
+function scoreToken(token) {
+    const weights = searchTerms.weights;
+    const fields = new Map();
+    const fieldsOf = entry => {
+        let scores = fields.get(entry);
+        if (!scores) {
+            scores = { name: 0, tags: 0, description: 0, category: 0, type: 0 };
+            fields.set(entry, scores);
+        }
+        return scores;
+    };
+
+    termsWithPrefix(searchTerms.coreKeys, token).forEach(term => {
+        const postings = searchTerms.core.get(term);
+        for (let i = 0; i < postings.length; i += 2) {
+            const flags = postings[i + 1];
+            const scores = fieldsOf(postings[i]);
+
+            let name = 0;
+            if ((flags & NAME_EXACT) && term === token) name = weights.name[0];
+            else if (flags & NAME_START) name = weights.name[1];
+            else if (flags & NAME_WORD) name = weights.name[2];
+
+            let tags = 0;
+            if ((flags & TAG_EXACT) && term === token) tags = weights.tags[0];
+            else if (flags & TAG_START) tags = weights.tags[1];
+            else if (flags & TAG_WORD) tags = weights.tags[2];
+
+            scores.name = Math.max(scores.name, name);
+            scores.tags = Math.max(scores.tags, tags);
+            if (flags & CATEGORY) scores.category = weights.category;
+            if (flags & TYPE) scores.type = weights.type;
+        }
+    });
+
+    termsWithPrefix(searchTerms.descriptionKeys, token).forEach(term => {
+        searchTerms.description.get(term).forEach(entry => {
+            fieldsOf(entry).description = weights.description;
+        });
+    });
+
+    const totals = new Map();
+    fields.forEach((scores, entry) => {
+        totals.set(
+            entry,
+            scores.name + scores.tags + scores.description + scores.category + scores.type
+        );
+    });
+    return totals;
+}
+
+// Perform search: only entries matching every token are scored
+function performSearch(query) {
+    if (!searchIndex || searchIndex.length === 0 || !searchTerms) {
+        return [];
+    }
+
+    if (!query || query.trim().length < 2) {
+        return [];
+    }
+
+    const searchTerm = query.toLowerCase().trim();
+    const tokens = tokenizeQuery(query);
+    if (tokens.length === 0) {
+        return [];
+    }
+
+    let totals = null;
+    for (const token of tokens) {
+        const scores = scoreToken(token);
+        if (totals === null) {
+            totals = scores;
+        } else {
+            const matched = new Map();
+            totals.forEach((score, entry) => {
+                if (scores.has(entry)) {
+                    matched.set(entry, score + scores.get(entry));
+                }
+            });
+            totals = matched;
+        }
+        if (totals.size === 0) {
+            return [];
+        }
+    }
+
+    const results = [];
+    totals.forEach((score, entry) => {
+        const item = searchIndex[entry];
+        if (item.name.toLowerCase() === searchTerm) {
+            score += searchTerms.weights.name_query;
+        }
+        results.push({ entry, score });
+    });
+
+    // Sort by score (descending, ties in index order) and return top 10
+    return results
+        .sort((a, b) => b.score - a.score || a.entry - b.entry)
+        .slice(0, 10)
+        .map(({ entry, score }) => ({ ...searchIndex[entry], score }));
+}
+
+// Display search results
+function displaySearchResults(results, query) {
+    const searchResults = document.getElementById('search-results');
+    const resultsContainer = searchResults.querySelector('div');
+
+    if (results.length === 0) {
+        resultsContainer.innerHTML = `
+            <div class="text-center py-8 text-gray-500">
+                <i class="fas fa-search text-4xl mb-3 opacity-50"></i>
+                <p>No results found for "<strong>${window.Utils.escapeHtml(query)}</strong>"</p>
+                <p class="text-sm mt-2">Try different keywords or browse categories below</p>
+            </div>
+        `;
+    } else {
+        const html = results.map(result => {
+            const categoryPath = result.is_boilerplate
+                ? `${window.BASE_URL || ''}/boilerplates/${result.category}/index.html`
+                : `${window.BASE_URL || ''}/categories/${result.category}.html`;
+            return `
+            <div class="border-b border-gray-200 last:border-0 py-3">
+                <div class="flex items-start justify-between gap-4">
+                    <div class="flex-grow">
+                        <h4 class="font-bold text-gray-900 mb-1">
+                            <a href="${result.url}" target="_blank" class="hover:text-blue-600">
+                                ${window.Utils.highlightText(result.name, query)}
+                            </a>
+                        </h4>
+                        <p class="text-sm text-gray-600 mb-2">${window.Utils.escapeHtml(result.description.substring(0, 150))}${result.description.length > 150 ? '...' : ''}</p>
+                        <div class="flex flex-wrap gap-2 text-xs">
+                            <span class="bg-blue-100 text-blue-700 px-2 py-1 rounded">
+                                ${result.category_title || result.category}
+                            </span>
+                            ${result.type ? `<span class="bg-gray-100 text-gray-700 px-2 py-1 rounded">${result.type}</span>` : ''}
+                            ${result.github_stars ? `<span class="bg-yellow-100 text-yellow-700 px-2 py-1 rounded"><i class="fas fa-star mr-1"></i>${result.github_stars}</span>` : ''}
+                        </div>
+                    </div>
+                    <a href="${categoryPath}" class="text-blue-600 hover:underline text-sm whitespace-nowrap">
+                        View Category <i class="fas fa-arrow-right ml-1"></i>
+                    </a>
+                </div>
+            </div>
+        `;
+        }).join('');
+
+        resultsContainer.innerHTML = `
+            <div class="mb-3 text-sm text-gray-600">
+                Found <strong>${results.length}</strong> result${results.length !== 1 ? 's' : ''} for "<strong>${window.Utils.escapeHtml(query)}</strong>"
+            </div>
+            ${html}
+        `;
+    }
+
+    searchResults.classList.remove('hidden');
+}
+
+// Hide search results
+function hideSearchResults() {
+    const searchResults = document.getElementById('search-results');
+    searchResults.classList.add('hidden');
+}
+
+// Initialize search
+document.addEventListener('DOMContentLoaded', async function() {
+    const searchInput = document.getElementById('global-search');
+
+    if (!searchInput) return;
+
+    // Load search index; refresh open results once descriptions are in
+    await loadSearchIndex(() => {
+        const query = searchInput.value;
+        const resultsOpen = !document.getElementById('search-results').classList.contains('hidden');
+        if (resultsOpen && query.trim().length >= 2) {
+            displaySearchResults(performSearch(query), query);
+        }
+    });
+
+    // Search input handler with debounce
+    const debouncedSearch = window.Utils.debounce((query) => {
+        if (query.trim().length < 2) {
+            hideSearchResults();
+            return;
+        }
+
+        const results = performSearch(query);
+        displaySearchResults(results, query);
+    }, 300);
+
+    searchInput.addEventListener('input', function(e) {
+        debouncedSearch(e.target.value);
+    });
+
+    // Hide results when clicking outside
+    document.addEventListener('click', function(e) {
+        if (!searchInput.contains(e.target) && !document.getElementById('search-results').contains(e.target)) {
+            hideSearchResults();
+        }
+    });
+
+    // Show results again when focusing on input with existing query
+    searchInput.addEventListener('focus', function() {
+        if (this.value.trim().length >= 2) {
+            const results = performSearch(this.value);
+            displaySearchResults(results, this.value);
+        }
+    });
+
+    // Clear search on Escape key
+    searchInput.addEventListener('keydown', function(e) {
+        if (e.key === 'Escape') {
+            this.value = '';
+            hideSearchResults();
+            this.blur();
+        }
+    });
+});
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""
+Single-process build orchestrator for Ultimate Agent Directory
+
+Loads the catalog once and runs every build stage against that shared snapshot
+as a dependency graph. Stages whose dependencies have finished run
+concurrently on a thread pool:
+
+    catalog -> validate -> models -> readme, boilerplates, site,
+                                     search-index, sitemap, stats
+    site, search-index, sitemap, stats -> compress
+    catalog -> links
+
+Generation only starts once validation passes, and site outputs whose inputs
+are unchanged since the last build are skipped (see site_manifest.py; --full
+rebuilds everything). Files whose content is unchanged are never rewritten.
+The links stage extracts URLs without touching the network; use
+check_links.py to check them.
+
+Usage:
+    python scripts/build.py
+    python scripts/build.py --only site
+    python scripts/build.py --serial
+    python scripts/build.py --jobs 4 --revalidate
+    python scripts/build.py --full
+    python scripts/build.py --no-compress
+"""
+
+import argparse
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Iterable
+
+from catalog import CatalogSnapshot, load_snapshot
+from check_links import collect_all_urls
+from config import load_site_config
+from generate_boilerplates import build_boilerplates_readme, count_agents
+from generate_readme import build_readme, count_boilerplates
+from generate_site import (
+    SiteData,
+    copy_static_assets,
+    load_site_data,
+    open_site_manifest,
+    render_pages,
+    write_search_index,
+    write_sitemap,
+    write_stats,
+)
+from precompress import precompress_tree, prune_stale_siblings
+from search_index import SEARCH_INDEX_FORMATS
+from site_manifest import SiteManifest, WriteSummary, write_if_changed
+from template_env import TEMPLATE_CACHE_STATS
+from validate import validate_snapshot
+
+
+class BuildError(Exception):
+    """Raised by a stage to fail the build with a summary and detail lines."""
+
+    def __init__(self, summary: str, details: list[str] | None = None):
+        super().__init__(summary)
+        self.details = details or []
+
+
+@dataclass
+class BuildContext:
+    """Shared state handed to every stage; filled in as stages complete."""
+
+    output_dir: Path = Path("_site")
+    jobs: int | None = None
+    trusted: bool = True
+    full: bool = False
+    compress: bool = True
+    search_index_format: str = "sharded"
+    snapshot: CatalogSnapshot | None = None
+    site_data: SiteData | None = None
+    manifest: SiteManifest | None = None
+    writes: WriteSummary = field(default_factory=WriteSummary)  # Files under _site/
+
+    def require_snapshot(self) -> CatalogSnapshot:
+        if self.snapshot is None:
+            raise BuildError("catalog stage has not run")
+        return self.snapshot
+
+    def require_site_data(self) -> SiteData:
+        if self.site_data is None:
+            raise BuildError("models stage has not run")
+        return self.site_data
+
+    def require_manifest(self) -> SiteManifest:
+        if self.manifest is None:
+            raise BuildError("models stage has not run")
+        return self.manifest
+
+
+@dataclass(frozen=True)
+class Stage:
+    name: str
+    run: Callable[[BuildContext], str]  # Returns a one-line summary
+    deps: tuple[str, ...] = ()
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: str  # 'ok', 'failed', 'skipped'
+    seconds: float = 0.0
+    summary: str = ""
+    details: list[str] = field(default_factory=list)
+
+
+def run_catalog(ctx: BuildContext) -> str:
+    ctx.snapshot = load_snapshot(jobs=ctx.jobs)
+    return (
+        f"{len(ctx.snapshot.records)} files "
+        f"({ctx.snapshot.compiled} compiled, {ctx.snapshot.reused} cached)"
+    )
+
+
+def run_validate(ctx: BuildContext) -> str:
+    successes, errors = validate_snapshot(ctx.require_snapshot())
+    if errors:
+        raise BuildError(f"{len(errors)} error(s) found", errors)
+    return f"{len(successes)} files passed"
+
+
+def run_models(ctx: BuildContext) -> str:
+    snapshot = ctx.require_snapshot()
+    ctx.site_data = load_site_data(snapshot, load_site_config(), trusted=ctx.trusted)
+    ctx.manifest = open_site_manifest(snapshot, ctx.output_dir, full=ctx.full)
+    return (
+        f"{len(ctx.site_data.agents)} agents, "
+        f"{len(ctx.site_data.boilerplates)} boilerplates"
+    )
+
+
+def run_readme(ctx: BuildContext) -> str:
+    data = ctx.require_site_data()
+    output = build_readme(
+        data.site_config,
+        data.categories,
+        data.agents,
+        count_boilerplates(ctx.require_snapshot()),
+    )
+    written = write_if_changed(Path("README.md"), output)
+    state = "written" if written else "unchanged"
+    return f"README.md {state} ({len(data.agents)} entries)"
+
+
+def run_boilerplates(ctx: BuildContext) -> str:
+    data = ctx.require_site_data()
+    output = build_boilerplates_readme(
+        data.site_config,
+        data.boilerplate_categories,
+        data.boilerplates,
+        count_agents(ctx.require_snapshot()),
+    )
+    written = write_if_changed(Path("BOILERPLATES.md"), output)
+    state = "written" if written else "unchanged"
+    return f"BOILERPLATES.md {state} ({len(data.boilerplates)} entries)"
+
+
+def run_site(ctx: BuildContext) -> str:
+    ctx.output_dir.mkdir(parents=True, exist_ok=True)
+    rendered, unchanged = render_pages(
+        ctx.require_site_data(),
+        ctx.output_dir,
+        ctx.require_manifest(),
+        log=lambda _: None,
+        summary=ctx.writes,
+        jobs=ctx.jobs,
+    )
+    static = WriteSummary()
+    copy_static_assets(ctx.output_dir, static)
+    ctx.writes.add(static.written, static.unchanged, static.deleted)
+    return (
+        f"{rendered} pages rendered, {unchanged} unchanged; "
+        f"static assets {static}"
+    )
+
+
+def run_search_index(ctx: BuildContext) -> str:
+    ctx.output_dir.mkdir(parents=True, exist_ok=True)
+    written = write_search_index(
+        ctx.require_site_data(),
+        ctx.output_dir,
+        ctx.require_manifest(),
+        ctx.writes,
+        ctx.search_index_format,
+    )
+    if written is None:
+        return "unchanged"
+    path, agents, boilerplates, shards = written
+    return f"{path} ({agents} agents + {boilerplates} boilerplates, {shards} shards)"
+
+
+def run_sitemap(ctx: BuildContext) -> str:
+    ctx.output_dir.mkdir(parents=True, exist_ok=True)
+    path = write_sitemap(
+        ctx.require_site_data(), ctx.output_dir, ctx.require_manifest(), ctx.writes
+    )
+    return str(path) if path else "unchanged"
+
+
+def run_stats(ctx: BuildContext) -> str:
+    ctx.output_dir.mkdir(parents=True, exist_ok=True)
+    path = write_stats(
+        ctx.require_site_data(), ctx.output_dir, ctx.require_manifest(), ctx.writes
+    )
+    return str(path) if path else "unchanged"
+
+
+def run_compress(ctx: BuildContext) -> str:
+    if not ctx.compress:
+        stale = prune_stale_siblings(ctx.output_dir)
+        return f"disabled (--no-compress), {stale} stale sibling(s) deleted"
+    return str(precompress_tree(ctx.output_dir, jobs=ctx.jobs))
+
+
+def run_links(ctx: BuildContext) -> str:
+    url_map = collect_all_urls(snapshot=ctx.require_snapshot(), jobs=ctx.jobs)
+    total = sum(len(urls) for urls in url_map.values())
+    return f"{total} URLs in {len(url_map)} files"
+
+
+STAGES = [
+    Stage("catalog", run_catalog),
+    Stage("validate", run_validate, ("catalog",)),
+    Stage("models", run_models, ("validate",)),
+    Stage("readme", run_readme, ("models",)),
+    Stage("boilerplates", run_boilerplates, ("models",)),
+    Stage("site", run_site, ("models",)),
+    Stage("search-index", run_search_index, ("models",)),
+    Stage("sitemap", run_sitemap, ("models",)),
+    Stage("stats", run_stats, ("models",)),
+    Stage("compress", run_compress, ("site", "search-index", "sitemap", "stats")),
+    Stage("links", run_links, ("catalog",)),
+]
+
+
+def check_graph(stages: list[Stage]) -> None:
+    """Require unique names and deps declared earlier (which rules out cycles)."""
+    seen: set[str] = set()
+    for stage in stages:
+        if stage.name in seen:
+            raise ValueError(f"Duplicate stage '{stage.name}'")
+        for dep in stage.deps:
+            if dep not in seen:
+                raise ValueError(
+                    f"Stage '{stage.name}' depends on unknown or later stage '{dep}'"
+                )
+        seen.add(stage.name)
+
+
+def select_stages(stages: list[Stage], names: Iterable[str]) -> list[Stage]:
+    """Return the named stages plus everything they depend on, in graph order."""
+    by_name = {stage.name: stage for stage in stages}
+    wanted: set[str] = set()
+    todo = list(names)
+    while todo:
+        name = todo.pop()
+        if name not in by_name:
+            raise ValueError(f"Unknown stage '{name}'")
+        if name not in wanted:
+            wanted.add(name)
+            todo.extend(by_name[name].deps)
+    return [stage for stage in stages if stage.name in wanted]
+
+
+def run_stage(stage: Stage, ctx: BuildContext) -> StageResult:
+    start = time.perf_counter()
+    try:
+        summary = stage.run(ctx)
+    except BuildError as e:
+        return StageResult(
+            stage.name, "failed", time.perf_counter() - start, str(e), e.details
+        )
+    except Exception as e:
+        return StageResult(
+            stage.name,
+            "failed",
+            time.perf_counter() - start,
+            f"{type(e).__name__}: {e}",
+        )
+    return StageResult(stage.name, "ok", time.perf_counter() - start, summary)
+
+
+def run_stages(
+    stages: list[Stage],
+    ctx: BuildContext,
+    max_workers: int | None = None,
+    on_done: Callable[[StageResult], None] | None = None,
+) -> list[StageResult]:
+    """Run stages as soon as their dependencies succeed; results in graph order.
+
+    A stage whose dependency failed or was skipped is skipped itself.
+    """
+    check_graph(stages)
+    pending = list(stages)
+    results: dict[str, StageResult] = {}
+    running: dict[Future[StageResult], str] = {}
+
+    def finish(result: StageResult) -> None:
+        results[result.name] = result
+        if on_done is not None:
+            on_done(result)
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(stages) or 1) as executor:
+        while pending or running:
+            # Stages are in dependency order, so one pass settles skip chains
+            for stage in list(pending):
+                deps = [results.get(dep) for dep in stage.deps]
+                if any(dep is not None and dep.status != "ok" for dep in deps):
+                    pending.remove(stage)
+                    finish(StageResult(stage.name, "skipped", summary="dependency failed"))
+                elif all(dep is not None for dep in deps):
+                    pending.remove(stage)
+                    running[executor.submit(run_stage, stage, ctx)] = stage.name
+
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                running.pop(future)
+                finish(future.result())
+
+    return [results[stage.name] for stage in stages]
+
+
+def print_stage_result(result: StageResult) -> None:
+    label = {"ok": "[OK]", "failed": "[FAIL]", "skipped": "[SKIP]"}[result.status]
+    print(f"  {label:<7}{result.name:<14}{result.seconds:>7.2f}s  {result.summary}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Validate and generate all outputs in one process."
+    )
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        metavar="STAGE",
+        choices=[stage.name for stage in STAGES],
+        help="Run only these stages (plus their dependencies)",
+    )
+    parser.add_argument(
+        "--serial",
+        action="store_true",
+        help="Run one stage at a time instead of running independent stages concurrently",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for loading the catalog and rendering pages (default: one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-run full validation instead of trusting stamped snapshot records",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild every site output instead of only those whose inputs changed",
+    )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Skip writing precompressed .gz/.br siblings of site outputs",
+    )
+    parser.add_argument(
+        "--search-index",
+        choices=SEARCH_INDEX_FORMATS,
+        default="sharded",
+        help="Search index format: compact with lazily loaded shards (default) "
+        "or a single indented search-index.json",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    stages = select_stages(STAGES, args.only) if args.only else STAGES
+    ctx = BuildContext(
+        jobs=args.jobs,
+        trusted=not args.revalidate,
+        full=args.full,
+        compress=not args.no_compress,
+        search_index_format=args.search_index,
+    )
+
+    print("=" * 60)
+    print("Ultimate Agent Directory - Build")
+    print("=" * 60)
+    print()
+
+    start = time.perf_counter()
+    results = run_stages(
+        stages, ctx, max_workers=1 if args.serial else None, on_done=print_stage_result
+    )
+    wall = time.perf_counter() - start
+
+    failed = [result for result in results if result.status == "failed"]
+    for result in failed:
+        if result.details:
+            print(f"\n{result.name} errors:")
+            print("\n".join(result.details))
+
+    print("\n" + "=" * 60)
+    print("Stage times:")
+    for result in results:
+        print_stage_result(result)
+    print(
+        f"\nWall time: {wall:.2f}s "
+        f"(stage total {sum(result.seconds for result in results):.2f}s)"
+    )
+    print(f"Site files: {ctx.writes}")
+    print(f"Template cache: {TEMPLATE_CACHE_STATS}")
+
+    if failed:
+        print(f"Build FAILED: {', '.join(result.name for result in failed)}")
+        sys.exit(1)
+    print("Build complete!")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,444 @@
+"""
+Compiled catalog snapshot for Ultimate Agent Directory
+
+Parses and validates every entry and category YAML file under data/ once and
+stores the result in a JSON snapshot keyed by per-file content hash. Later runs
+only re-parse files whose content changed, so the validator, generators and
+maintenance scripts all share one compiled view of the catalog.
+
+Every record that passes validation also carries the validated model dump and
+a validation stamp tying it to the file hash and schema fingerprint. Loaders
+build models from stamped records with model_construct() (trusted mode) and
+only re-run full Pydantic validation when the stamp is missing or stale.
+
+Usage:
+    from catalog import load_snapshot, load_agents
+
+    snapshot = load_snapshot()
+    agents = load_agents(snapshot)
+"""
+
+import hashlib
+import json
+import math
+import os
+import tempfile
+import typing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+import pydantic
+from pydantic import AnyUrl, BaseModel
+
+from models import AgentEntry, BoilerplateCategory, BoilerplateEntry, Category
+from yaml_loader import safe_load
+
+
+SNAPSHOT_VERSION = 3
+SNAPSHOT_FILENAME = "snapshot.json"
+DEFAULT_DATA_DIR = Path("data")
+CACHE_DIRNAME = Path(".cache") / "catalog"
+
+KIND_PATTERNS = {
+    "agent": "agents/**/*.yml",
+    "category": "categories/*.yml",
+    "boilerplate": "boilerplates/**/*.yml",
+    "boilerplate-category": "boilerplate-categories/*.yml",
+}
+
+KIND_MODELS: dict[str, type[BaseModel]] = {
+    "agent": AgentEntry,
+    "category": Category,
+    "boilerplate": BoilerplateEntry,
+    "boilerplate-category": BoilerplateCategory,
+}
+
+# Sources whose changes can change parsed or validated records: the schema and
+# the YAML loader (the installed pydantic version is folded in as well).
+SCHEMA_SOURCES = ("models.py", "yaml_loader.py")
+
+# Below this many dirty files, process start-up costs more than it saves
+PARALLEL_THRESHOLD = 64
+CHUNKS_PER_WORKER = 4
+
+
+class CatalogError(ValueError):
+    """Raised when a catalog file cannot be turned into a model."""
+
+
+@dataclass
+class CatalogRecord:
+    """Compiled result for a single YAML file."""
+
+    path: str  # POSIX path relative to the data directory
+    kind: str  # 'agent', 'category', 'boilerplate', 'boilerplate-category'
+    sha256: str
+    data: dict | None  # Parsed mapping (JSON-compatible), None if unparsable
+    error: str | None  # Parse or validation error, None if valid
+    validated: dict | None = None  # model_dump(mode="json") of the valid model
+    stamp: str | None = None  # validation_stamp() when validated is trustworthy
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class CatalogSnapshot:
+    """All compiled records for a data directory."""
+
+    data_dir: Path
+    records: dict[str, CatalogRecord]
+    compiled: int = 0
+    reused: int = 0
+    fingerprint: str = ""
+    _resolved_dir: Path | None = field(default=None, repr=False)
+
+    def records_for(self, kind: str) -> list[CatalogRecord]:
+        """Return records of one kind in deterministic path order."""
+        return [
+            record
+            for path, record in sorted(self.records.items())
+            if record.kind == kind
+        ]
+
+    def get(self, filepath: Path) -> CatalogRecord | None:
+        """Return the record for a file path, or None if it is not cataloged."""
+        if self._resolved_dir is None:
+            self._resolved_dir = self.data_dir.resolve()
+        try:
+            relative = Path(filepath).resolve().relative_to(self._resolved_dir)
+        except ValueError:
+            return None
+        return self.records.get(relative.as_posix())
+
+    def is_trusted(self, record: CatalogRecord) -> bool:
+        """True if the record was validated against the current schema and content."""
+        return (
+            record.validated is not None
+            and record.stamp is not None
+            and record.stamp == validation_stamp(self.fingerprint, record.sha256)
+        )
+
+    def models(self, kind: str, skip_empty: bool = False, trusted: bool = True) -> list:
+        """Build model instances for every record of a kind.
+
+        With trusted=True, records carrying a current validation stamp are built
+        via model_construct() without re-validating; everything else goes
+        through full Pydantic validation.
+        """
+        model = KIND_MODELS[kind]
+        items = []
+        for record in self.records_for(kind):
+            if record.data is None:
+                if skip_empty and record.error == "Empty YAML file":
+                    continue
+                raise CatalogError(f"{self.data_dir / record.path}: {record.error}")
+            if trusted and record.validated is not None and self.is_trusted(record):
+                items.append(construct_trusted(model, record.validated, record.data))
+            else:
+                items.append(model(**record.data))
+        return items
+
+
+def default_cache_dir(data_dir: Path) -> Path:
+    return data_dir.parent / CACHE_DIRNAME
+
+
+@lru_cache(maxsize=None)
+def models_fingerprint(scripts_dir: Path = Path(__file__).parent) -> str:
+    """
+    Hash of the SCHEMA_SOURCES and the pydantic version; cached parse and
+    validation results depend on them.
+    """
+    digest = hashlib.sha256(f"pydantic {pydantic.VERSION}\0".encode())
+    for name in SCHEMA_SOURCES:
+        source = (scripts_dir / name).read_bytes()
+        digest.update(f"{name}\0{len(source)}\0".encode())
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def validation_stamp(fingerprint: str, digest: str) -> str:
+    """Stamp proving a record validated against this schema and file content."""
+    return hashlib.sha256(f"{fingerprint}:{digest}".encode()).hexdigest()
+
+
+def field_reviver(annotation) -> tuple[str, type] | None:
+    """Describe how to turn a JSON-dumped field back into its validated type."""
+    origin = typing.get_origin(annotation)
+    args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+    if origin is typing.Union and len(args) == 1:
+        return field_reviver(args[0])
+    if annotation is date:
+        return ("date", date)
+    if isinstance(annotation, type) and issubclass(annotation, AnyUrl):
+        return ("url", annotation)
+    if origin is list and args and isinstance(args[0], type):
+        if issubclass(args[0], BaseModel):
+            return ("models", args[0])
+    return None
+
+
+@lru_cache(maxsize=None)
+def model_revivers(model: type[BaseModel]) -> dict[str, tuple[str, type]]:
+    """Fields of a model whose JSON dump differs from the validated value type."""
+    revivers = {}
+    for name, info in model.model_fields.items():
+        reviver = field_reviver(info.annotation)
+        if reviver is not None:
+            revivers[name] = reviver
+    return revivers
+
+
+def construct_trusted(
+    model: type[BaseModel], validated: dict, data: dict | None = None
+) -> BaseModel:
+    """Build a model from an already-validated dump without re-validating.
+
+    ``validated`` must be a complete model_dump(mode="json") of a model with
+    extra="forbid"; dates, URLs and nested models are revived to their
+    validated types. ``data`` is the raw mapping and only determines
+    ``model_fields_set``. This skips model_construct() as well, whose per-field
+    default handling costs about as much as validating these small models.
+    """
+    data = validated if data is None else data
+    values = dict(validated)
+    for name, (how, target) in model_revivers(model).items():
+        value = values[name]
+        if value is None:
+            continue
+        if how == "date":
+            values[name] = date.fromisoformat(value)
+        elif how == "url":
+            values[name] = target(value)
+        else:
+            raw = data.get(name) or []
+            values[name] = [
+                construct_trusted(target, item, raw[i] if i < len(raw) else None)
+                for i, item in enumerate(value)
+            ]
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__pydantic_fields_set__", set(data))
+    object.__setattr__(instance, "__pydantic_extra__", None)
+    object.__setattr__(instance, "__pydantic_private__", None)
+    return instance
+
+
+def to_jsonable(value):
+    """Convert YAML-native values (dates) into JSON-compatible equivalents."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    if isinstance(value, dict):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [to_jsonable(item) for item in value]
+    return value
+
+
+def compile_record(path: str, kind: str, content: bytes, digest: str) -> CatalogRecord:
+    """Parse and validate one file's content into a record."""
+    try:
+        data = safe_load(content.decode("utf-8"))
+    except yaml.YAMLError as e:
+        return CatalogRecord(path, kind, digest, None, f"YAML syntax error: {e}")
+    except Exception as e:
+        return CatalogRecord(path, kind, digest, None, str(e))
+
+    if data is None:
+        return CatalogRecord(path, kind, digest, None, "Empty YAML file")
+    if not isinstance(data, dict):
+        return CatalogRecord(
+            path, kind, digest, None, "YAML content must be a mapping"
+        )
+
+    try:
+        model = KIND_MODELS[kind](**data)
+    except Exception as e:
+        return CatalogRecord(
+            path, kind, digest, to_jsonable(data), f"Validation error: {e}"
+        )
+
+    return CatalogRecord(
+        path,
+        kind,
+        digest,
+        to_jsonable(data),
+        None,
+        validated=model.model_dump(mode="json"),
+        stamp=validation_stamp(models_fingerprint(), digest),
+    )
+
+
+def resolve_jobs(jobs: int | None) -> int:
+    """Translate a --jobs value (None or 0 = one per CPU) into a worker count."""
+    if jobs is None or jobs <= 0:
+        return os.cpu_count() or 1
+    return jobs
+
+
+def compile_chunk(chunk: list[tuple[str, str, bytes, str]]) -> list[CatalogRecord]:
+    """Compile a chunk of (path, kind, content, digest) items; runs in workers."""
+    return [compile_record(*item) for item in chunk]
+
+
+def compile_records(
+    items: list[tuple[str, str, bytes, str]], jobs: int | None = None
+) -> list[CatalogRecord]:
+    """Compile items in input order, fanning out over a process pool when worthwhile.
+
+    Falls back to serial compilation for small batches, jobs=1, or platforms
+    where a process pool cannot be started.
+    """
+    workers = min(resolve_jobs(jobs), len(items))
+    if workers <= 1 or len(items) < PARALLEL_THRESHOLD:
+        return compile_chunk(items)
+
+    chunk_size = math.ceil(len(items) / (workers * CHUNKS_PER_WORKER))
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, keeping results deterministic
+            compiled = list(executor.map(compile_chunk, chunks))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return compile_chunk(items)
+    return [record for chunk in compiled for record in chunk]
+
+
+def read_snapshot(snapshot_path: Path, fingerprint: str) -> dict[str, CatalogRecord]:
+    """Read cached records, returning nothing if the cache is missing or stale."""
+    try:
+        with open(snapshot_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != SNAPSHOT_VERSION
+        or payload.get("models") != fingerprint
+    ):
+        return {}
+
+    try:
+        return {
+            path: CatalogRecord(**record)
+            for path, record in payload.get("files", {}).items()
+        }
+    except TypeError:
+        return {}
+
+
+def write_json_atomic(path: Path, payload: dict) -> None:
+    """Atomically write JSON so concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}-", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f, separators=(",", ":"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def write_snapshot(
+    snapshot_path: Path, records: dict[str, CatalogRecord], fingerprint: str
+) -> None:
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "models": fingerprint,
+        "files": {path: asdict(record) for path, record in sorted(records.items())},
+    }
+    write_json_atomic(snapshot_path, payload)
+
+
+def hash_content(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def collect_catalog_files(data_dir: Path) -> list[tuple[str, str, Path]]:
+    """Return (relative_path, kind, file_path) for every cataloged YAML file."""
+    files = []
+    for kind, pattern in KIND_PATTERNS.items():
+        for file_path in data_dir.glob(pattern):
+            files.append((file_path.relative_to(data_dir).as_posix(), kind, file_path))
+    return sorted(files)
+
+
+def load_snapshot(
+    data_dir: Path = DEFAULT_DATA_DIR,
+    cache_dir: Path | None = None,
+    use_cache: bool = True,
+    jobs: int | None = None,
+) -> CatalogSnapshot:
+    """Load the compiled catalog, re-parsing only files whose content changed."""
+    cache_dir = cache_dir or default_cache_dir(data_dir)
+    snapshot_path = cache_dir / SNAPSHOT_FILENAME
+    fingerprint = models_fingerprint()
+    cached = read_snapshot(snapshot_path, fingerprint) if use_cache else {}
+
+    records: dict[str, CatalogRecord] = {}
+    dirty: list[tuple[str, str, bytes, str]] = []
+    for relative, kind, file_path in collect_catalog_files(data_dir):
+        content = file_path.read_bytes()
+        digest = hash_content(content)
+        previous = cached.get(relative)
+        if previous is not None and previous.sha256 == digest and previous.kind == kind:
+            records[relative] = previous
+        else:
+            dirty.append((relative, kind, content, digest))
+
+    for record in compile_records(dirty, jobs):
+        records[record.path] = record
+    compiled = len(dirty)
+    reused = len(records) - compiled
+
+    if use_cache and (compiled or set(cached) != set(records)):
+        try:
+            write_snapshot(snapshot_path, records, fingerprint)
+        except OSError:
+            pass  # A read-only checkout still works, just without caching
+
+    return CatalogSnapshot(
+        data_dir=data_dir,
+        records=records,
+        compiled=compiled,
+        reused=reused,
+        fingerprint=fingerprint,
+    )
+
+
+def load_categories(snapshot: CatalogSnapshot, trusted: bool = True) -> list[Category]:
+    """Load all category definitions"""
+    categories = snapshot.models("category", trusted=trusted)
+    return sorted(categories, key=lambda c: c.order)
+
+
+def load_agents(snapshot: CatalogSnapshot, trusted: bool = True) -> list[AgentEntry]:
+    """Load all agent entries"""
+    return snapshot.models("agent", trusted=trusted)
+
+
+def load_boilerplate_categories(
+    snapshot: CatalogSnapshot, trusted: bool = True
+) -> list[BoilerplateCategory]:
+    """Load all boilerplate category definitions"""
+    categories = snapshot.models("boilerplate-category", trusted=trusted)
+    return sorted(categories, key=lambda c: c.order)
+
+
+def load_boilerplates(
+    snapshot: CatalogSnapshot, trusted: bool = True
+) -> list[BoilerplateEntry]:
+    """Load all boilerplate entries, skipping empty files"""
+    return snapshot.models("boilerplate", skip_empty=True, trusted=trusted)
@@ -10,36 +10,90 @@ Usage:
     python scripts/check_links.py --yaml-only        # Check only YAML files (fast)
     python scripts/check_links.py --file data/agents/example.yml
     python scripts/check_links.py --file-list changed-files.txt
+    python scripts/check_links.py --since origin/main  # Only URLs changed since
+    python scripts/check_links.py --resume           # Continue an interrupted run
+    python scripts/check_links.py --shard 2/4        # Second of four CI jobs
+    python scripts/check_links.py --merge reports/link-check-shard-*.json
     python scripts/check_links.py --timeout 10       # Custom timeout
     python scripts/check_links.py --create-issues    # Explicitly create GitHub issues
     python scripts/check_links.py --verbose          # Detailed logging
     python scripts/check_links.py --skip-domain localhost
     python scripts/check_links.py --skip-url https://example.com
+    python scripts/check_links.py --no-cache         # Re-check every URL
+    python scripts/check_links.py --cache-ttl-success 24
 """
 
 import asyncio
 import argparse
+import errno
+import hashlib
 import json
+import math
 import os
 import re
+import socket
+import sqlite3
 import sys
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import quote_plus, urlparse
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from urllib.parse import quote_plus, urlparse, urlsplit, urlunsplit
 
 import aiohttp
-import yaml
+import pydantic
+from pydantic import HttpUrl, TypeAdapter, ValidationError
 from tqdm import tqdm
 
 # Import local models for YAML parsing
 try:
-    from models import AgentEntry, BoilerplateEntry
+    from catalog import (
+        CHUNKS_PER_WORKER,
+        PARALLEL_THRESHOLD,
+        CatalogSnapshot,
+        load_snapshot,
+        resolve_jobs,
+    )
+    from host_limiter import THROTTLE_STATUSES, HostLimiter, host_of
+    from link_cache import HOUR, CacheTTLs, CachedLink, LinkCache, default_cache_path
+    from link_checkpoint import LinkCheckpoint, default_checkpoint_path
+    from link_diff import GitDiffError, changed_urls, head_revision
+    from precompress import format_size
+    from url_extract_cache import UrlExtractCache, default_extract_cache_path
+    from yaml_loader import safe_load
 except ImportError:
     sys.path.insert(0, str(Path(__file__).parent))
-    from models import AgentEntry, BoilerplateEntry
+    from catalog import (
+        CHUNKS_PER_WORKER,
+        PARALLEL_THRESHOLD,
+        CatalogSnapshot,
+        load_snapshot,
+        resolve_jobs,
+    )
+    from host_limiter import THROTTLE_STATUSES, HostLimiter, host_of
+    from link_cache import HOUR, CacheTTLs, CachedLink, LinkCache, default_cache_path
+    from link_checkpoint import LinkCheckpoint, default_checkpoint_path
+    from link_diff import GitDiffError, changed_urls, head_revision
+    from precompress import format_size
+    from url_extract_cache import UrlExtractCache, default_extract_cache_path
+    from yaml_loader import safe_load
 
 
 # ANSI color codes for terminal output
@@ -68,6 +122,19 @@ HTTP_HEADERS = {
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+DEFAULT_CONCURRENCY = 50  # URLs checked at once
+DEFAULT_MAX_GET_BYTES = 8192  # Body bytes read by the GET fallback
+
+# Connection errors that mean no URL on the host can be reached this run
+HARD_FAILURE_ERRNOS = {errno.ECONNREFUSED, errno.EHOSTUNREACH, errno.ENETUNREACH}
+# Resolver answers that the name does not exist; EAI_AGAIN and other
+# temporary resolver failures are retried like any other client error.
+HARD_FAILURE_EAI = {
+    getattr(socket, name)
+    for name in ("EAI_NONAME", "EAI_NODATA")
+    if hasattr(socket, name)
+}
+
 GENERATED_MARKDOWN_FILES = {"README.md", "BOILERPLATES.md"}
 LOW_VALUE_DOC_PATHS = {"docs/previous_changelogs"}
 
@@ -83,36 +150,198 @@ class URLCheck:
     source_file: str
     source_type: str  # 'yaml', 'markdown', 'template', 'static'
     field_name: Optional[str]  # For YAML: 'url', 'documentation_url', etc.
+    cached: bool = False  # Reused from the link cache instead of requested
+    bytes_received: int = 0  # Bytes read while checking the URL (not per source)
+    short_circuited: bool = False  # Not requested: its host failed earlier
+
+
+@dataclass
+class CheckOutcome:
+    """What check_url() learned about a URL."""
+
+    status_code: int
+    error_message: Optional[str]
+    final_url: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    retry_after: Optional[float] = None  # Seconds, from a Retry-After header
+    bytes_received: int = 0  # Response headers and (capped) bodies, all requests
+    short_circuited: bool = False  # Answered from HostHealth without a request
+
+
+@dataclass
+class TokenBucket:
+    """Request tokens for one domain, refilled continuously at `rate` per second."""
+
+    rate: float
+    capacity: float
+    tokens: float
+    updated: float
+
+    def refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
 
 
 @dataclass
 class RateLimiter:
-    """Rate limiter for domain-based request throttling."""
+    """Per-domain token buckets: max_per_second requests/s, bursts up to that many.
 
-    max_per_second: int
-    domain_timestamps: Dict[str, List[float]] = field(
-        default_factory=lambda: defaultdict(list)
-    )
+    Both ways of taking a token are O(1) and never await between reading and
+    updating a bucket, so concurrent coroutines cannot act on stale state.
+    """
+
+    max_per_second: float
+    clock: Callable[[], float] = time.monotonic
+    buckets: Dict[str, TokenBucket] = field(default_factory=dict)
+
+    def bucket(self, domain: str) -> TokenBucket:
+        bucket = self.buckets.get(domain)
+        if bucket is None:
+            rate = float(self.max_per_second)
+            bucket = TokenBucket(rate, max(rate, 1.0), max(rate, 1.0), self.clock())
+            self.buckets[domain] = bucket
+        return bucket
+
+    def try_acquire(self, domain: str) -> float:
+        """Take a token if one is available; otherwise seconds until one is."""
+        if self.max_per_second <= 0:
+            return 0.0
+        bucket = self.bucket(domain)
+        bucket.refill(self.clock())
+        if bucket.tokens >= 1:
+            bucket.tokens -= 1
+            return 0.0
+        return (1 - bucket.tokens) / bucket.rate
 
     async def wait_if_needed(self, url: str):
-        """Wait if we've exceeded rate limit for this domain."""
-        domain = urlparse(url).netloc
-        now = time.time()
+        """Take a token for the URL's domain, sleeping until it is due."""
+        if self.max_per_second <= 0:
+            return
+        bucket = self.bucket(host_of(url))
+        bucket.refill(self.clock())
+        # Reserve the token now; a negative balance queues later callers
+        # behind this one
+        bucket.tokens -= 1
+        if bucket.tokens < 0:
+            await asyncio.sleep(-bucket.tokens / bucket.rate)
+
+
+def is_hard_failure(error: aiohttp.ClientError) -> bool:
+    """Whether a client error means the host itself is unreachable.
+
+    Names the resolver says do not exist and refused or unroutable connections
+    fail the same way for every URL on the host; temporary resolver failures
+    (EAI_AGAIN), timeouts, TLS and HTTP errors do not.
+    """
+    if not isinstance(error, aiohttp.ClientConnectorError) or isinstance(
+        error, aiohttp.ClientSSLError
+    ):
+        return False
+    if isinstance(error.os_error, socket.gaierror):
+        return error.os_error.errno in HARD_FAILURE_EAI
+    return error.os_error.errno in HARD_FAILURE_ERRNOS
+
 
-        # Remove timestamps older than 1 second
-        self.domain_timestamps[domain] = [
-            ts for ts in self.domain_timestamps[domain] if now - ts < 1.0
+@dataclass
+class HostHealth:
+    """Hosts whose names do not resolve or that refused connections this run.
+
+    Once a host is down, its remaining URLs are answered with the first
+    failure instead of being requested (and retried with backoff) again.
+    """
+
+    down: Dict[str, str] = field(default_factory=dict)  # Host -> first error
+    short_circuited: Dict[str, int] = field(default_factory=dict)
+
+    def is_down(self, host: str) -> bool:
+        return host in self.down
+
+    def mark_down(self, url: str, error: str) -> None:
+        self.down.setdefault(host_of(url), error)
+
+    def short_circuit(self, url: str) -> Optional[CheckOutcome]:
+        """The outcome for a URL on a host that is down, or None."""
+        host = host_of(url)
+        error = self.down.get(host)
+        if error is None:
+            return None
+        self.short_circuited[host] = self.short_circuited.get(host, 0) + 1
+        return CheckOutcome(
+            0, f"Not requested: {host} failed earlier ({error})", short_circuited=True
+        )
+
+    def report(self) -> List[dict]:
+        """Down hosts with their error and number of short-circuited URLs."""
+        return [
+            {
+                "host": host,
+                "error": error,
+                "short_circuited": self.short_circuited.get(host, 0),
+            }
+            for host, error in sorted(self.down.items())
         ]
 
-        # If we've hit the limit, wait
-        if len(self.domain_timestamps[domain]) >= self.max_per_second:
-            oldest = self.domain_timestamps[domain][0]
-            wait_time = 1.0 - (now - oldest)
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
 
-        # Record this request
-        self.domain_timestamps[domain].append(time.time())
+class DomainScheduler:
+    """Hands out URLs round-robin across the domains that may send a request now.
+
+    A domain is ready when its token bucket has a token and, if a host
+    limiter is given, the host has a free concurrency slot. A host with
+    hundreds of URLs therefore takes one turn per round instead of blocking
+    the workers while other hosts' URLs wait behind it. URLs of hosts that
+    host_health reports down are handed out at once: they are not requested.
+    """
+
+    POLL_SECONDS = 0.05  # Recheck interval while only host slots are full
+
+    def __init__(
+        self,
+        urls: List[str],
+        rate_limiter: RateLimiter,
+        host_limiter: Optional[HostLimiter] = None,
+        host_health: Optional[HostHealth] = None,
+    ):
+        self.rate_limiter = rate_limiter
+        self.host_limiter = host_limiter
+        self.host_health = host_health
+        self.queues: Dict[str, Deque[str]] = {}
+        for url in urls:
+            self.queues.setdefault(host_of(url), deque()).append(url)
+        self.ring: Deque[str] = deque(self.queues)  # Domains with URLs left
+
+    def delay(self, domain: str) -> float:
+        """0 after taking the domain's token, else seconds until it may be ready."""
+        if self.host_limiter is not None and not self.host_limiter.has_capacity(domain):
+            return self.POLL_SECONDS
+        return self.rate_limiter.try_acquire(domain)
+
+    def take_ready(self) -> Tuple[Optional[str], float]:
+        """(next URL of the next ready domain, 0) or (None, seconds to wait)."""
+        wait = float("inf")
+        for _ in range(len(self.ring)):
+            domain = self.ring[0]
+            self.ring.rotate(-1)
+            if self.host_health is None or not self.host_health.is_down(domain):
+                delay = self.delay(domain)
+                if delay > 0:
+                    wait = min(wait, delay)
+                    continue
+            queue = self.queues[domain]
+            url = queue.popleft()
+            if not queue:
+                self.ring.pop()  # The domain was just rotated to the end
+            return url, 0.0
+        return None, wait
+
+    async def next_url(self) -> Optional[str]:
+        """Wait for the next URL to check; None once every URL is handed out."""
+        while self.ring:
+            url, wait = self.take_ready()
+            if url is not None:
+                return url
+            await asyncio.sleep(min(wait, self.POLL_SECONDS))
+        return None
 
 
 def normalize_extracted_url(raw_url: str) -> Optional[str]:
@@ -167,6 +396,54 @@ def is_low_value_doc_path(path: Path, project_root: Path) -> bool:
     )
 
 
+# Validates just the URL fields, not the whole AgentEntry/BoilerplateEntry
+HTTP_URL = TypeAdapter(HttpUrl)
+
+
+def canonical_http_url(value: object) -> str:
+    """
+    A URL field as pydantic's HttpUrl prints it.
+
+    HttpUrl lowercases the scheme and host, IDNA-encodes hosts, drops default
+    ports, percent-encodes the path and query and removes dot segments; using
+    it directly keeps every one of those rules. A value HttpUrl rejects is
+    returned as written.
+    """
+    url = str(value).strip()
+    try:
+        return str(HTTP_URL.validate_python(url))
+    except ValidationError:
+        return url
+
+
+def extract_urls_from_entry(data: dict) -> List[Tuple[str, str]]:
+    """
+    Extract URLs from a parsed agent or boilerplate mapping.
+
+    The URL fields are read straight from the raw mapping rather than by
+    validating an AgentEntry/BoilerplateEntry, and printed the way HttpUrl
+    would print them, so they match the URLs of validated entries.
+
+    Returns:
+        List of (url, field_name) tuples
+    """
+    urls: List[Tuple[str, str]] = []
+
+    # Check if it's an entry file (has url field) vs category file
+    if "url" not in data:
+        return urls
+
+    for field_name in ("url", "documentation_url", "demo_url"):
+        if data.get(field_name):
+            add_normalized_url(urls, canonical_http_url(data[field_name]), field_name)
+    if data.get("github_repo"):
+        add_normalized_url(
+            urls, f"https://github.com/{data['github_repo']}", "github_repo"
+        )
+
+    return urls
+
+
 def extract_urls_from_yaml(file_path: Path) -> List[Tuple[str, str]]:
     """
     Extract URLs from YAML files (agents and boilerplates).
@@ -178,61 +455,12 @@ def extract_urls_from_yaml(file_path: Path) -> List[Tuple[str, str]]:
 
     try:
         with open(file_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = safe_load(f)
 
         if not data:
             return urls
 
-        # Determine if this is a boilerplate or agent file based on path
-        file_path_str = str(file_path)
-        is_boilerplate = "boilerplates" in file_path_str
-
-        # Check if it's an entry file (has url field) vs category file
-        if "url" in data:
-            try:
-                if is_boilerplate:
-                    bp_entry = BoilerplateEntry(**data)
-                    add_normalized_url(urls, str(bp_entry.url), "url")
-                    if bp_entry.documentation_url:
-                        add_normalized_url(
-                            urls, str(bp_entry.documentation_url), "documentation_url"
-                        )
-                    if bp_entry.demo_url:
-                        add_normalized_url(urls, str(bp_entry.demo_url), "demo_url")
-                    if bp_entry.github_repo:
-                        github_url = f"https://github.com/{bp_entry.github_repo}"
-                        add_normalized_url(urls, github_url, "github_repo")
-                else:
-                    agent_entry = AgentEntry(**data)
-                    add_normalized_url(urls, str(agent_entry.url), "url")
-                    if agent_entry.documentation_url:
-                        add_normalized_url(
-                            urls,
-                            str(agent_entry.documentation_url),
-                            "documentation_url",
-                        )
-                    if agent_entry.demo_url:
-                        add_normalized_url(urls, str(agent_entry.demo_url), "demo_url")
-                    if agent_entry.github_repo:
-                        github_url = f"https://github.com/{agent_entry.github_repo}"
-                        add_normalized_url(urls, github_url, "github_repo")
-
-            except Exception:
-                # If Pydantic validation fails, try manual extraction
-                if "url" in data:
-                    add_normalized_url(urls, data["url"], "url")
-                if "documentation_url" in data:
-                    add_normalized_url(
-                        urls, data["documentation_url"], "documentation_url"
-                    )
-                if "demo_url" in data:
-                    add_normalized_url(urls, data["demo_url"], "demo_url")
-                if "github_repo" in data:
-                    add_normalized_url(
-                        urls,
-                        f"https://github.com/{data['github_repo']}",
-                        "github_repo",
-                    )
+        urls = extract_urls_from_entry(data)
 
     except Exception as e:
         print(
@@ -340,6 +568,96 @@ def extract_urls_from_static(file_path: Path) -> List[Tuple[str, str]]:
     return urls
 
 
+def extract_urls_from_file(file_path: Path) -> List[Tuple[str, str]]:
+    """Extract URLs from a file of any scanned type, chosen by its suffix."""
+    if file_path.suffix in {".yml", ".yaml"}:
+        return extract_urls_from_yaml(file_path)
+    if file_path.suffix == ".md":
+        return extract_urls_from_markdown(file_path)
+    if file_path.suffix in {".jinja2", ".html"}:
+        return extract_urls_from_template(file_path)
+    if file_path.suffix in {".css", ".js"}:
+        return extract_urls_from_static(file_path)
+    return []
+
+
+# Sources whose changes can change extracted URLs: this module, the YAML
+# loader, and the models whose HttpUrl fields canonical_http_url mirrors.
+EXTRACTOR_SOURCES = ("check_links.py", "yaml_loader.py", "models.py")
+
+
+@lru_cache(maxsize=None)
+def extractor_fingerprint(scripts_dir: Path = Path(__file__).parent) -> str:
+    """
+    Hash of the EXTRACTOR_SOURCES and the pydantic version (HttpUrl's output);
+    cached extraction results depend on them.
+    """
+    digest = hashlib.sha256(f"pydantic {pydantic.VERSION}\0".encode())
+    for name in EXTRACTOR_SOURCES:
+        source = (scripts_dir / name).read_bytes()
+        digest.update(f"{name}\0{len(source)}\0".encode())
+        digest.update(source)
+    return digest.hexdigest()
+
+
+def extract_chunk(paths: List[str]) -> List[List[Tuple[str, str]]]:
+    """Extract URLs from a chunk of files; runs in workers."""
+    return [extract_urls_from_file(Path(path)) for path in paths]
+
+
+def extract_in_pool(
+    paths: List[str], jobs: Optional[int] = None
+) -> List[List[Tuple[str, str]]]:
+    """Extract URLs from files in input order, over a process pool when worthwhile.
+
+    Falls back to serial extraction for small batches, jobs=1, or platforms
+    where a process pool cannot be started.
+    """
+    workers = min(resolve_jobs(jobs), len(paths))
+    if workers <= 1 or len(paths) < PARALLEL_THRESHOLD:
+        return extract_chunk(paths)
+
+    chunk_size = math.ceil(len(paths) / (workers * CHUNKS_PER_WORKER))
+    chunks = [paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            extracted = list(executor.map(extract_chunk, chunks))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return extract_chunk(paths)
+    return [urls for chunk in extracted for urls in chunk]
+
+
+def extract_files(
+    files: List[Path],
+    project_root: Path,
+    cache: Optional[UrlExtractCache] = None,
+    jobs: Optional[int] = None,
+) -> Dict[Path, List[Tuple[str, str]]]:
+    """URLs of each file, from the cache when its content is unchanged."""
+    found: Dict[Path, List[Tuple[str, str]]] = {}
+    missing: List[Tuple[Path, str, str]] = []
+    for file_path in files:
+        try:
+            content = file_path.read_bytes()
+        except OSError:
+            found[file_path] = extract_urls_from_file(file_path)  # Warns
+            continue
+        relative = file_path.relative_to(project_root).as_posix()
+        digest = hashlib.sha256(content).hexdigest()
+        cached = cache.get(relative, digest) if cache is not None else None
+        if cached is not None:
+            found[file_path] = cached
+        else:
+            missing.append((file_path, relative, digest))
+
+    extracted = extract_in_pool([str(path) for path, _, _ in missing], jobs)
+    for (file_path, relative, digest), urls in zip(missing, extracted):
+        found[file_path] = urls
+        if cache is not None:
+            cache.put(relative, digest, urls)
+    return found
+
+
 def should_skip_url(url: str, skip_domains: set[str], skip_urls: set[str]) -> bool:
     if url in skip_urls:
         return True
@@ -395,50 +713,11 @@ def resolve_selected_files(
     return sorted(selected_files)
 
 
-def collect_all_urls(
-    yaml_only: bool = False,
-    verbose: bool = False,
-    files: Optional[List[str]] = None,
-) -> Dict[str, List[Tuple[str, str]]]:
-    """
-    Collect all URLs from repository files.
-
-    Returns:
-        Dict mapping file paths to list of (url, field_name/context) tuples
-    """
-    project_root = Path(__file__).parent.parent.resolve()
-    selected_files = resolve_selected_files(project_root, files, verbose=verbose)
-    url_map: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
-
-    if verbose:
-        print(f"\n{Colors.BOLD}Collecting URLs...{Colors.RESET}")
-        if selected_files is not None:
-            print(f"  Scanning selected files only ({len(selected_files)} files)...")
-
-    # 1. YAML files (highest priority)
-    if selected_files is None:
-        yaml_pattern = "data/**/*.yml"
-        yaml_files = list(project_root.glob(yaml_pattern))
-    else:
-        yaml_files = [
-            file_path
-            for file_path in selected_files
-            if file_path.suffix in {".yml", ".yaml"}
-        ]
-    if verbose:
-        print(f"  Scanning {len(yaml_files)} YAML files...")
-
-    for yaml_file in yaml_files:
-        urls = extract_urls_from_yaml(yaml_file)
-        if urls:
-            url_map[str(yaml_file.relative_to(project_root))] = [
-                (url, field) for url, field in urls
-            ]
-
-    if yaml_only:
-        return url_map
-
-    # 2. Markdown files (documentation)
+def list_non_yaml_files(
+    project_root: Path, selected_files: Optional[List[Path]]
+) -> Tuple[List[Path], List[Path], List[Path]]:
+    """Markdown, template and static files to scan: all, or those selected."""
+    # Markdown files (documentation)
     if selected_files is None:
         md_files = []
         # Root level markdown
@@ -457,15 +736,7 @@ def collect_all_urls(
     else:
         md_files = [file_path for file_path in selected_files if file_path.suffix == ".md"]
 
-    if verbose:
-        print(f"  Scanning {len(md_files)} Markdown files...")
-
-    for md_file in md_files:
-        urls = extract_urls_from_markdown(md_file)
-        if urls:
-            url_map[str(md_file.relative_to(project_root))] = urls
-
-    # 3. Jinja2 templates
+    # Jinja2 templates
     if selected_files is None:
         templates_dir = project_root / "templates"
         template_files = []
@@ -480,15 +751,7 @@ def collect_all_urls(
             if file_path.suffix in {".jinja2", ".html"}
         ]
 
-    if verbose:
-        print(f"  Scanning {len(template_files)} template files...")
-
-    for template_file in template_files:
-        urls = extract_urls_from_template(template_file)
-        if urls:
-            url_map[str(template_file.relative_to(project_root))] = urls
-
-    # 4. Static assets (CSS, JS)
+    # Static assets (CSS, JS)
     if selected_files is None:
         static_dir = project_root / "static"
         static_files = []
@@ -503,25 +766,157 @@ def collect_all_urls(
             if file_path.suffix in {".css", ".js"}
         ]
 
+    return md_files, template_files, static_files
+
+
+def collect_all_urls(
+    yaml_only: bool = False,
+    verbose: bool = False,
+    files: Optional[List[str]] = None,
+    snapshot: Optional[CatalogSnapshot] = None,
+    use_cache: bool = True,
+    jobs: Optional[int] = None,
+) -> Dict[str, List[Tuple[str, str]]]:
+    """
+    Collect all URLs from repository files.
+
+    Cataloged YAML entries are read from the catalog snapshot. Every other
+    file is looked up in the URL extraction cache by content hash, and only
+    new or changed files are parsed, in a process pool when there are many.
+
+    Args:
+        snapshot: Already loaded catalog snapshot to reuse (loaded on demand
+            otherwise)
+        use_cache: Reuse URLs extracted from unchanged files by earlier runs
+        jobs: Worker processes for extraction (None = one per CPU)
+
+    Returns:
+        Dict mapping file paths to list of (url, field_name/context) tuples
+    """
+    project_root = Path(__file__).parent.parent.resolve()
+    selected_files = resolve_selected_files(project_root, files, verbose=verbose)
+    url_map: Dict[str, List[Tuple[str, str]]] = defaultdict(list)
+
     if verbose:
-        print(f"  Scanning {len(static_files)} static files...")
+        print(f"\n{Colors.BOLD}Collecting URLs...{Colors.RESET}")
+        if selected_files is not None:
+            print(f"  Scanning selected files only ({len(selected_files)} files)...")
 
-    for static_file in static_files:
-        urls = extract_urls_from_static(static_file)
+    # 1. YAML files (highest priority)
+    if selected_files is None:
+        yaml_pattern = "data/**/*.yml"
+        yaml_files = list(project_root.glob(yaml_pattern))
+        if snapshot is None:
+            snapshot = load_snapshot(project_root / "data")
+    else:
+        yaml_files = [
+            file_path
+            for file_path in selected_files
+            if file_path.suffix in {".yml", ".yaml"}
+        ]
+    if verbose:
+        print(f"  Scanning {len(yaml_files)} YAML files...")
+
+    # Entries in the catalog snapshot are already parsed
+    cataloged: Dict[Path, List[Tuple[str, str]]] = {}
+    for yaml_file in yaml_files:
+        record = snapshot.get(yaml_file) if snapshot is not None else None
+        if record is not None and record.data is not None:
+            cataloged[yaml_file] = extract_urls_from_entry(record.data)
+    scan_files = list(yaml_files)
+
+    # 2.-4. Markdown, templates and static assets
+    if not yaml_only:
+        md_files, template_files, static_files = list_non_yaml_files(
+            project_root, selected_files
+        )
+        if verbose:
+            print(f"  Scanning {len(md_files)} Markdown files...")
+            print(f"  Scanning {len(template_files)} template files...")
+            print(f"  Scanning {len(static_files)} static files...")
+        scan_files.extend(md_files + template_files + static_files)
+
+    cache = None
+    if use_cache:
+        cache = UrlExtractCache(
+            default_extract_cache_path(project_root), extractor_fingerprint()
+        )
+    uncataloged = [file_path for file_path in scan_files if file_path not in cataloged]
+    extracted = extract_files(uncataloged, project_root, cache, jobs)
+    if cache is not None:
+        if verbose:
+            print(f"  Reused extracted URLs of {cache.hits} unchanged files")
+        # Only a full scan sees every file, so only it drops deleted ones
+        cache.save(prune=selected_files is None and not yaml_only)
+
+    for file_path in scan_files:
+        urls = cataloged.get(file_path) or extracted.get(file_path)
         if urls:
-            url_map[str(static_file.relative_to(project_root))] = urls
+            url_map[str(file_path.relative_to(project_root))] = urls
 
     return url_map
 
 
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an --shard value "i/N" (1 <= i <= N) into (i, N)."""
+    index, sep, count = value.partition("/")
+    if not sep or not index.isdigit() or not count.isdigit():
+        raise ValueError(f"expected i/N, got {value!r}")
+    if not 1 <= int(index) <= int(count):
+        raise ValueError(f"shard {index} is not between 1 and {count}")
+    return int(index), int(count)
+
+
+def assign_shards(urls: Iterable[str], count: int) -> Dict[str, int]:
+    """
+    Map each host to one of count shards (1-based), balancing unique URLs.
+
+    Every URL of a host lands in the same shard, so per-host rate and
+    concurrency limits stay within one process. Hosts are placed largest
+    first on the least loaded shard, ties broken by name, so every shard job
+    computes the same assignment from the same set of URLs.
+    """
+    per_host: Dict[str, int] = defaultdict(int)
+    for url in set(urls):
+        per_host[host_of(url)] += 1
+    loads = [0] * count
+    assignment = {}
+    for host, urls_on_host in sorted(per_host.items(), key=lambda kv: (-kv[1], kv[0])):
+        shard = min(range(count), key=lambda i: (loads[i], i))
+        loads[shard] += urls_on_host
+        assignment[host] = shard + 1
+    return assignment
+
+
+def select_shard(
+    url_map: Dict[str, List[Tuple[str, str]]], index: int, count: int
+) -> Dict[str, List[Tuple[str, str]]]:
+    """The part of url_map whose URLs' hosts are assigned to shard index."""
+    assignment = assign_shards(
+        (url for urls in url_map.values() for url, _ in urls), count
+    )
+    shard_map = {}
+    for file_path, urls in url_map.items():
+        selected = [
+            (url, field) for url, field in urls if assignment[host_of(url)] == index
+        ]
+        if selected:
+            shard_map[file_path] = selected
+    return shard_map
+
+
 async def check_url(
     session: aiohttp.ClientSession,
     url: str,
     timeout: int,
     retries: int,
-    rate_limiter: RateLimiter,
+    rate_limiter: Optional[RateLimiter],
     verbose: bool = False,
-) -> Tuple[int, Optional[str]]:
+    validators: Optional[Dict[str, str]] = None,
+    host_limiter: Optional[HostLimiter] = None,
+    max_get_bytes: int = DEFAULT_MAX_GET_BYTES,
+    host_health: Optional[HostHealth] = None,
+) -> CheckOutcome:
     """
     Check a single URL asynchronously.
 
@@ -530,54 +925,148 @@ async def check_url(
     - retries: 3 attempts with exponential backoff
     - rate_limit: 5 requests/second per domain
 
+    validators are conditional request headers (see revalidation_headers());
+    an unchanged resource then answers 304 Not Modified without a body.
+
+    Every request holds a slot of host_limiter, which adapts the host's
+    concurrency to its responses. A 429/503 answer is retried once the
+    host's Retry-After has passed (or after the usual backoff).
+
+    The GET fallback asks for the first max_get_bytes bytes with a Range
+    header and never reads more than that, whatever the server sends.
+
+    A DNS failure or refused connection is not retried: it marks the host
+    down in host_health, and later URLs on that host are short-circuited.
+
     Returns:
-        Tuple of (status_code, error_message)
+        CheckOutcome with the status code (0 if no response), the bytes
+        received and, for responses, the final URL and validators
     """
-    # Wait for rate limiter
-    await rate_limiter.wait_if_needed(url)
-
-    async def request(method: str) -> Tuple[int, Optional[str]]:
-        async with session.request(
-            method,
-            url,
-            timeout=aiohttp.ClientTimeout(total=timeout),
-            allow_redirects=True,
-            ssl=False,
-        ) as response:
-            return response.status, None
-
-    for attempt in range(retries):
-        try:
-            status_code, error = await request("HEAD")
-            if status_code < 400:
-                return status_code, error
+    health = host_health or HostHealth()
+    # Wait for rate limiter (None when the caller already took a token, as
+    # check_all_urls() does through its DomainScheduler)
+    if rate_limiter is not None:
+        await rate_limiter.wait_if_needed(url)
+    limiter = host_limiter or HostLimiter()
+    received = 0
+
+    async def request(method: str, ranged: bool = True) -> CheckOutcome:
+        nonlocal received
+        headers = dict(validators or {})
+        if method == "GET" and ranged:
+            headers["Range"] = f"bytes=0-{max_get_bytes - 1}"
+        async with limiter.slot(url) as slot:
+            async with session.request(
+                method,
+                url,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                allow_redirects=True,
+                ssl=False,
+                headers=headers,
+            ) as response:
+                slot.record(response.status, response.headers.get("Retry-After"))
+                received += sum(
+                    len(name) + len(value) + 4 for name, value in response.raw_headers
+                )
+                if method == "GET":
+                    received += await read_capped(response, max_get_bytes)
+                return CheckOutcome(
+                    status_code=response.status,
+                    error_message=None,
+                    final_url=str(response.url),
+                    etag=response.headers.get("ETag"),
+                    last_modified=response.headers.get("Last-Modified"),
+                    retry_after=slot.retry_after,
+                )
+
+    async def get() -> CheckOutcome:
+        outcome = await request("GET")
+        if outcome.status_code == 416:
+            # Range Not Satisfiable (e.g. an empty body): ask without a Range;
+            # the read is still capped
+            outcome = await request("GET", ranged=False)
+        return outcome
+
+    async def attempts() -> CheckOutcome:
+        for attempt in range(retries):
+            # Another URL on the host may have failed during our backoff
+            short_circuited = health.short_circuit(url)
+            if short_circuited is not None:
+                return short_circuited
+            try:
+                outcome = await request("HEAD")
+                if outcome.status_code < 400:
+                    return outcome
+
+                # Many sites reject or mis-handle HEAD. Verify any failed HEAD
+                # result with GET before reporting it.
+                outcome = await get()
+                if outcome.status_code in THROTTLE_STATUSES and attempt < retries - 1:
+                    # The host limiter holds the next request until Retry-After
+                    if outcome.retry_after is None:
+                        await asyncio.sleep(2**attempt)
+                    continue
+                return outcome
 
-            # Many sites reject or mis-handle HEAD. Verify any failed HEAD
-            # result with GET before reporting it.
-            return await request("GET")
+            except asyncio.TimeoutError:
+                if attempt == retries - 1:
+                    return CheckOutcome(0, "Timeout")
+                await asyncio.sleep(2**attempt)  # Exponential backoff
 
-        except asyncio.TimeoutError:
-            if attempt == retries - 1:
-                return 0, "Timeout"
-            await asyncio.sleep(2**attempt)  # Exponential backoff
+            except aiohttp.ClientError as e:
+                if is_hard_failure(e):
+                    health.mark_down(url, str(e))
+                    return CheckOutcome(0, str(e))
 
-        except aiohttp.ClientError as e:
-            # Try GET request if HEAD fails at the client/protocol layer.
-            try:
-                return await request("GET")
-            except Exception:
-                pass
+                # Try GET request if HEAD fails at the client/protocol layer.
+                try:
+                    return await get()
+                except Exception:
+                    pass
 
-            if attempt == retries - 1:
-                return 0, str(e)
-            await asyncio.sleep(2**attempt)
+                if attempt == retries - 1:
+                    return CheckOutcome(0, str(e))
+                await asyncio.sleep(2**attempt)
 
-        except Exception as e:
-            if attempt == retries - 1:
-                return 0, f"Unexpected error: {str(e)}"
-            await asyncio.sleep(2**attempt)
+            except Exception as e:
+                if attempt == retries - 1:
+                    return CheckOutcome(0, f"Unexpected error: {str(e)}")
+                await asyncio.sleep(2**attempt)
 
-    return 0, "Max retries exceeded"
+        return CheckOutcome(0, "Max retries exceeded")
+
+    outcome = await attempts()
+    outcome.bytes_received = received
+    return outcome
+
+
+async def read_capped(response: aiohttp.ClientResponse, limit: int) -> int:
+    """Read at most limit body bytes; returns how many were read.
+
+    A body read to the end leaves the connection reusable; otherwise the
+    connection is closed instead of draining the rest.
+    """
+    read = 0
+    while read < limit:
+        chunk = await response.content.read(limit - read)
+        if not chunk:
+            return read
+        read += len(chunk)
+    if not response.content.at_eof():
+        response.close()
+    return read
+
+
+def revalidation_headers(cached: Optional[CachedLink]) -> Dict[str, str]:
+    """Conditional request headers from a previous successful check."""
+    if cached is None or cached.status != "success":
+        return {}
+    headers = {}
+    if cached.etag:
+        headers["If-None-Match"] = cached.etag
+    if cached.last_modified:
+        headers["If-Modified-Since"] = cached.last_modified
+    return headers
 
 
 def classify_link_result(status_code: int, error_msg: Optional[str]) -> str:
@@ -596,6 +1085,136 @@ def classify_link_result(status_code: int, error_msg: Optional[str]) -> str:
     return "warning"
 
 
+async def stream_checks(
+    urls: List[str],
+    check: Callable[[str], Awaitable[CheckOutcome]],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    rate_limiter: Optional[RateLimiter] = None,
+    host_limiter: Optional[HostLimiter] = None,
+    host_health: Optional[HostHealth] = None,
+) -> AsyncIterator[Tuple[str, CheckOutcome]]:
+    """
+    Check URLs with a fixed pool of workers, yielding results as they complete.
+
+    Each worker takes the next URL as soon as its previous one finishes, so a
+    slow URL only holds up its own slot. URLs are handed out by a
+    DomainScheduler, which takes the rate limiter's token for each URL and
+    rotates between domains. Results pass through a queue bounded by the
+    worker count, so memory does not grow with the number of URLs.
+    """
+    scheduler = DomainScheduler(
+        urls, rate_limiter or RateLimiter(max_per_second=0), host_limiter, host_health
+    )
+    done: asyncio.Queue = asyncio.Queue(maxsize=max(concurrency, 1))
+
+    async def worker() -> None:
+        while (url := await scheduler.next_url()) is not None:
+            try:
+                outcome = await check(url)
+            except Exception as e:
+                outcome = CheckOutcome(0, f"Unexpected error: {str(e)}")
+            await done.put((url, outcome))
+        await done.put(None)
+
+    workers = [
+        asyncio.create_task(worker())
+        for _ in range(max(min(concurrency, len(urls)), 1))
+    ]
+    running = len(workers)
+    try:
+        while running:
+            item = await done.get()
+            if item is None:
+                running -= 1
+            else:
+                yield item
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+
+def source_type_for(file_path: str) -> str:
+    """Kind of repository file a URL was found in."""
+    if file_path.endswith(".yml") or file_path.endswith(".yaml"):
+        return "yaml"
+    if file_path.endswith(".md"):
+        return "markdown"
+    if ".jinja" in file_path or file_path.endswith(".html"):
+        return "template"
+    return "static"
+
+
+def url_checks_for(
+    url: str,
+    sources: List[Tuple[str, str]],
+    status: str,
+    status_code: Optional[int],
+    error_msg: Optional[str],
+    cached: bool = False,
+    bytes_received: int = 0,
+    short_circuited: bool = False,
+) -> List[URLCheck]:
+    """One URLCheck per file/field the URL was found in."""
+    return [
+        URLCheck(
+            url=url,
+            status=status,
+            status_code=status_code,
+            error_message=error_msg,
+            source_file=file_path,
+            source_type=source_type_for(file_path),
+            field_name=field,
+            cached=cached,
+            bytes_received=bytes_received,
+            short_circuited=short_circuited,
+        )
+        for file_path, field in sources
+    ]
+
+
+class CheckpointResults:
+    """URLCheck results kept in a LinkCheckpoint instead of in memory.
+
+    extend() takes one URL's results, as url_checks_for() returns them, and
+    appends them as a single record; iterating streams them back from disk,
+    so the results can be read any number of times.
+    """
+
+    def __init__(self, checkpoint: LinkCheckpoint):
+        self.checkpoint = checkpoint
+
+    def extend(self, checks: List[URLCheck]) -> None:
+        if not checks:
+            return
+        first = checks[0]
+        self.checkpoint.append(
+            {
+                "url": first.url,
+                "status": first.status,
+                "status_code": first.status_code,
+                "error_message": first.error_message,
+                "cached": first.cached,
+                "bytes_received": first.bytes_received,
+                "short_circuited": first.short_circuited,
+                "sources": [[check.source_file, check.field_name] for check in checks],
+            }
+        )
+
+    def __iter__(self) -> Iterator[URLCheck]:
+        for record in self.checkpoint.records():
+            yield from url_checks_for(
+                record["url"],
+                [(file_path, field) for file_path, field in record["sources"]],
+                record["status"],
+                record["status_code"],
+                record["error_message"],
+                cached=record["cached"],
+                bytes_received=record["bytes_received"],
+                short_circuited=record["short_circuited"],
+            )
+
+
 async def check_all_urls(
     url_map: Dict[str, List[Tuple[str, str]]],
     timeout: int,
@@ -604,15 +1223,44 @@ async def check_all_urls(
     skip_domains: set[str],
     skip_urls: set[str],
     verbose: bool = False,
-) -> List[URLCheck]:
+    cache: Optional[LinkCache] = None,
+    cache_ttls: Optional[CacheTTLs] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    host_limiter: Optional[HostLimiter] = None,
+    max_get_bytes: int = DEFAULT_MAX_GET_BYTES,
+    host_health: Optional[HostHealth] = None,
+    changed: Optional[Set[str]] = None,
+    checkpoint: Optional[LinkCheckpoint] = None,
+) -> Iterable[URLCheck]:
     """
     Check all URLs asynchronously with rate limiting.
 
+    Args:
+        concurrency: Number of URLs checked at once
+        host_limiter: Adaptive per-host concurrency; pass one in to read its
+            report() after the run
+        max_get_bytes: Body bytes read by the GET fallback
+        host_health: Hosts found unreachable; pass one in to read its
+            report() after the run
+        cache: Link cache to reuse fresh results from and store new ones in
+        cache_ttls: How long cached results stay fresh, by status
+        changed: Incremental mode (--since): only these URLs are requested,
+            cached or not; every other URL reuses its cached result whatever
+            its age, and is left out if it has none
+        checkpoint: Append each URL's results here as soon as they are known
+            instead of keeping them in memory; URLs already in it (from an
+            interrupted run being resumed) are not checked again
+
     Returns:
-        List of URLCheck results
+        URLCheck results: a list, or with a checkpoint, a CheckpointResults
+        that streams them from the checkpoint file
     """
-    results = []
+    results: Union[List[URLCheck], CheckpointResults] = (
+        CheckpointResults(checkpoint) if checkpoint is not None else []
+    )
     rate_limiter = RateLimiter(max_per_second=rate_limit)
+    host_limiter = host_limiter or HostLimiter()
+    host_health = host_health or HostHealth()
     skip_domains = {domain.lower() for domain in skip_domains}
     skip_urls = {url.strip() for url in skip_urls if url.strip()}
 
@@ -633,75 +1281,169 @@ async def check_all_urls(
             continue
         url_to_sources[url].append((file_path, field_name))
 
-    unique_urls = list(url_to_sources.keys())
-
-    print(f"\n{Colors.BOLD}Checking {len(unique_urls)} unique URLs...{Colors.RESET}")
+    done = checkpoint.checked_urls() if checkpoint is not None else set()
+    unique_urls = [url for url in url_to_sources if url not in done]
+
+    # Reuse results that are still within their TTL; stale ones are
+    # revalidated with their validators
+    known: Dict[str, CachedLink] = {}
+    fresh: Dict[str, CachedLink] = {}
+    if cache is not None:
+        known = cache.lookup(unique_urls)
+        if changed is not None:
+            fresh = {url: c for url, c in known.items() if url not in changed}
+        else:
+            ttls = cache_ttls or CacheTTLs()
+            now = time.time()
+            fresh = {url: c for url, c in known.items() if c.is_fresh(ttls, now)}
+        for url, cached in fresh.items():
+            results.extend(
+                url_checks_for(
+                    url,
+                    url_to_sources[url],
+                    cached.status,
+                    cached.status_code,
+                    cached.error_message,
+                    cached=True,
+                )
+            )
+    pending_urls = [url for url in unique_urls if url not in fresh]
+    unchecked = 0
+    if changed is not None:
+        unchecked = sum(1 for url in pending_urls if url not in changed)
+        pending_urls = [url for url in pending_urls if url in changed]
+
+    print(f"\n{Colors.BOLD}Checking {len(pending_urls)} unique URLs...{Colors.RESET}")
+    if fresh:
+        print(f"Reusing {len(fresh)} cached results")
+    if unchecked:
+        print(f"Not checking {unchecked} unchanged URLs without a cached result")
+    if done:
+        print(f"Resuming: {len(done)} URLs already checked by the interrupted run")
     if skipped:
         print(f"Skipping {skipped} URLs due to skip rules")
 
-    # Create aiohttp session
-    connector = aiohttp.TCPConnector(limit=100, limit_per_host=10)
+    if not pending_urls:
+        return results
+
+    # Create aiohttp session; host_limiter caps connections per host, and
+    # resolved addresses are cached for the whole run (failures are
+    # remembered by host_health instead)
+    connector = aiohttp.TCPConnector(
+        limit=concurrency, limit_per_host=0, use_dns_cache=True, ttl_dns_cache=None
+    )
     async with aiohttp.ClientSession(
         connector=connector,
         headers=HTTP_HEADERS,
+        auto_decompress=False,  # Bodies are only counted, never parsed
         max_line_size=65536,
         max_field_size=65536,
     ) as session:
         # Create progress bar
-        with tqdm(total=len(unique_urls), desc="Progress", unit="url") as pbar:
-            # Check URLs in batches to avoid overwhelming the system
-            batch_size = 50
-            for i in range(0, len(unique_urls), batch_size):
-                batch = unique_urls[i : i + batch_size]
-
-                # Create tasks for this batch
-                tasks = [
-                    check_url(session, url, timeout, retries, rate_limiter, verbose)
-                    for url in batch
-                ]
-
-                # Wait for all tasks in batch to complete
-                batch_results = await asyncio.gather(*tasks)
-
-                # Process results
-                for url, (status_code, error_msg) in zip(batch, batch_results):
-                    status = classify_link_result(status_code, error_msg)
-
-                    # Create URLCheck for each source
-                    for file_path, field in url_to_sources[url]:
-                        # Determine source type
-                        if file_path.endswith(".yml") or file_path.endswith(".yaml"):
-                            source_type = "yaml"
-                        elif file_path.endswith(".md"):
-                            source_type = "markdown"
-                        elif ".jinja" in file_path or file_path.endswith(".html"):
-                            source_type = "template"
-                        else:
-                            source_type = "static"
-
-                        results.append(
-                            URLCheck(
-                                url=url,
-                                status=status,
-                                status_code=status_code,
-                                error_message=error_msg,
-                                source_file=file_path,
-                                source_type=source_type,
-                                field_name=field,
-                            )
-                        )
-
-                pbar.update(len(batch))
+        with tqdm(total=len(pending_urls), desc="Progress", unit="url") as pbar:
+
+            def check(url: str) -> Awaitable[CheckOutcome]:
+                return check_url(
+                    session,
+                    url,
+                    timeout,
+                    retries,
+                    None,  # The scheduler already took this URL's token
+                    verbose,
+                    validators=revalidation_headers(known.get(url)),
+                    host_limiter=host_limiter,
+                    max_get_bytes=max_get_bytes,
+                    host_health=host_health,
+                )
+
+            # Consume results in completion order while workers keep
+            # `concurrency` requests in flight
+            async for url, outcome in stream_checks(
+                pending_urls,
+                check,
+                concurrency,
+                rate_limiter,
+                host_limiter,
+                host_health,
+            ):
+                status = classify_link_result(
+                    outcome.status_code, outcome.error_message
+                )
+                results.extend(
+                    url_checks_for(
+                        url,
+                        url_to_sources[url],
+                        status,
+                        outcome.status_code,
+                        outcome.error_message,
+                        bytes_received=outcome.bytes_received,
+                        short_circuited=outcome.short_circuited,
+                    )
+                )
+                # Short-circuited URLs were never requested, so there is
+                # nothing to cache for them
+                if cache is not None and not outcome.short_circuited:
+                    cache.store(cached_link(url, status, outcome, known.get(url)))
+                pbar.update(1)
 
     return results
 
 
-def print_results(results: List[URLCheck], verbose: bool = False):
-    """Print check results to terminal with color coding."""
+def cached_link(
+    url: str, status: str, outcome: CheckOutcome, previous: Optional[CachedLink]
+) -> CachedLink:
+    """Cache entry for a fresh outcome; a 304 keeps the previous URL and validators."""
+    if outcome.status_code == 304 and previous is not None:
+        final_url = outcome.final_url or previous.final_url
+        etag = outcome.etag or previous.etag
+        last_modified = outcome.last_modified or previous.last_modified
+    else:
+        final_url, etag, last_modified = (
+            outcome.final_url,
+            outcome.etag,
+            outcome.last_modified,
+        )
+    return CachedLink(
+        url=url,
+        status=status,
+        status_code=outcome.status_code,
+        error_message=outcome.error_message,
+        final_url=final_url,
+        checked_at=time.time(),
+        etag=etag,
+        last_modified=last_modified,
+    )
+
+
+def bytes_transferred(results: Iterable[URLCheck]) -> int:
+    """Bytes received for the URLs requested in this run."""
+    return sum({r.url: r.bytes_received for r in results if not r.cached}.values())
+
+
+def not_modified_share(results: Iterable[URLCheck]) -> Tuple[int, int]:
+    """(URLs answered 304 Not Modified, URLs requested) in this run."""
+    requested = {r.url: r.status_code for r in results if not r.cached}
+    not_modified = sum(1 for code in requested.values() if code == 304)
+    return not_modified, len(requested)
+
+
+def print_results(results: Iterable[URLCheck], verbose: bool = False):
+    """Print check results to terminal with color coding.
+
+    results may be read more than once (a list or CheckpointResults); only
+    warnings and errors are held in memory.
+    """
     # Group by status
-    success = [r for r in results if r.status == "success"]
-    warnings = [r for r in results if r.status == "warning"]
-    errors = [r for r in results if r.status == "error"]
+    success = 0
+    warnings: List[URLCheck] = []
+    errors: List[URLCheck] = []
+    for result in results:
+        if result.status == "success":
+            success += 1
+        elif result.status == "warning":
+            warnings.append(result)
+        elif result.status == "error":
+            errors.append(result)
 
     # Deduplicate for display (same URL may appear in multiple files)
     unique_errors = {}
@@ -716,16 +1458,39 @@ def print_results(results: List[URLCheck], verbose: bool = False):
 
     print(f"\n{Colors.BOLD}=== Link Check Results ==={Colors.RESET}\n")
 
-    print(f"{Colors.GREEN}[OK] Passed:{Colors.RESET} {len(success)}")
+    print(f"{Colors.GREEN}[OK] Passed:{Colors.RESET} {success}")
     print(f"{Colors.YELLOW}[WARN] Warnings:{Colors.RESET} {len(warnings)}")
-    print(f"{Colors.RED}[FAIL] Failed:{Colors.RESET} {len(errors)}\n")
+    print(f"{Colors.RED}[FAIL] Failed:{Colors.RESET} {len(errors)}")
+    cached = len({r.url for r in results if r.cached})
+    if cached:
+        print(f"{Colors.BLUE}[CACHE] Reused:{Colors.RESET} {cached} unique URLs")
+    not_modified, requested = not_modified_share(results)
+    if requested:
+        print(
+            f"{Colors.BLUE}[NET] Transferred:{Colors.RESET} "
+            f"{format_size(bytes_transferred(results))} for {requested} requested URLs"
+        )
+    if not_modified:
+        print(
+            f"{Colors.BLUE}[304] Not modified:{Colors.RESET} {not_modified} of "
+            f"{requested} requested URLs ({not_modified / requested:.0%})"
+        )
+    short_circuited = {r.url for r in results if r.short_circuited}
+    if short_circuited:
+        hosts = {host_of(url) for url in short_circuited}
+        print(
+            f"{Colors.BLUE}[SKIP] Short-circuited:{Colors.RESET} "
+            f"{len(short_circuited)} URLs on {len(hosts)} unreachable hosts"
+        )
+    print()
 
     # Show errors
     if unique_errors:
         print(f"{Colors.RED}{Colors.BOLD}Failed Links:{Colors.RESET}")
         for url, result in unique_errors.items():
             sources = [r.source_file for r in errors if r.url == url]
-            print(f"  {Colors.RED}[FAIL]{Colors.RESET} {url}")
+            tag = "[FAIL, not requested]" if result.short_circuited else "[FAIL]"
+            print(f"  {Colors.RED}{tag}{Colors.RESET} {url}")
             print(f"    Status: {result.status_code or 'N/A'}")
             if result.error_message:
                 print(f"    Error: {result.error_message}")
@@ -743,45 +1508,196 @@ def print_results(results: List[URLCheck], verbose: bool = False):
             print()
 
 
+def print_host_report(host_report: List[dict], verbose: bool = False):
+    """Print per-host request counts, throttling and adaptive limits."""
+    if not host_report:
+        return
+    rows = host_report if verbose else host_report[:10]
+    print(f"{Colors.BOLD}Per-host concurrency:{Colors.RESET}")
+    print(
+        f"  {'Host':<40} {'Requests':>8} {'Throttled':>9} "
+        f"{'Limit':>6} {'Peak':>6} {'Req/s':>7}"
+    )
+    for row in rows:
+        rate = row["requests_per_second"]
+        print(
+            f"  {row['host'][:40]:<40} {row['requests']:>8} {row['throttled']:>9} "
+            f"{row['final_limit']:>6g} {row['peak_limit']:>6g} "
+            f"{(f'{rate:.2f}' if rate is not None else '-'):>7}"
+        )
+    if len(rows) < len(host_report):
+        print(f"  ... {len(host_report) - len(rows)} more hosts (--verbose lists all)")
+    print()
+
+
+def report_summary(results: Iterable[URLCheck]) -> dict:
+    """Summary counts for the JSON report."""
+    counts = {"success": 0, "warning": 0, "error": 0}
+    total = cached = 0
+    short_circuited = set()
+    for r in results:
+        total += 1
+        counts[r.status] = counts.get(r.status, 0) + 1
+        cached += r.cached
+        if r.short_circuited:
+            short_circuited.add(r.url)
+    not_modified, requested = not_modified_share(results)
+    return {
+        "total": total,
+        "success": counts["success"],
+        "warnings": counts["warning"],
+        "errors": counts["error"],
+        "cached": cached,
+        "requested_urls": requested,
+        "not_modified": not_modified,
+        "not_modified_share": (
+            round(not_modified / requested, 4) if requested else 0.0
+        ),
+        "bytes_transferred": bytes_transferred(results),
+        "short_circuited": len(short_circuited),
+    }
+
+
+def report_row(r: URLCheck) -> dict:
+    """One entry of the JSON report's results."""
+    return {
+        "url": r.url,
+        "status": r.status,
+        "status_code": r.status_code,
+        "error_message": r.error_message,
+        "source_file": r.source_file,
+        "source_type": r.source_type,
+        "field_name": r.field_name,
+        "cached": r.cached,
+        "short_circuited": r.short_circuited,
+        "bytes_received": r.bytes_received,
+    }
+
+
 def save_report(
-    results: List[URLCheck], output_file: str = "reports/link-check-report.json"
+    results: Iterable[URLCheck],
+    output_file: str = "reports/link-check-report.json",
+    host_report: Optional[List[dict]] = None,
+    unreachable_hosts: Optional[List[dict]] = None,
+    shard: Optional[Tuple[int, int]] = None,
 ):
-    """Save detailed results to JSON file."""
+    """Save detailed results to JSON file.
+
+    results may be read more than once (a list or CheckpointResults). Result
+    rows are written one at a time, so a checkpointed run never holds the
+    whole report in memory. A --shard run records its (i, N) as "shard", which
+    --merge checks.
+    """
     project_root = Path(__file__).parent.parent
     output_path = project_root / output_file
 
     # Create reports directory if it doesn't exist
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    report = {
+    header: Dict[str, object] = {
         "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "summary": {
-            "total": len(results),
-            "success": len([r for r in results if r.status == "success"]),
-            "warnings": len([r for r in results if r.status == "warning"]),
-            "errors": len([r for r in results if r.status == "error"]),
-        },
-        "results": [
-            {
-                "url": r.url,
-                "status": r.status,
-                "status_code": r.status_code,
-                "error_message": r.error_message,
-                "source_file": r.source_file,
-                "source_type": r.source_type,
-                "field_name": r.field_name,
-            }
-            for r in results
-        ],
     }
+    if shard is not None:
+        header["shard"] = list(shard)
+    header["summary"] = report_summary(results)
+    if host_report is not None:
+        header["hosts"] = host_report
+    if unreachable_hosts is not None:
+        header["unreachable_hosts"] = unreachable_hosts
 
     with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(report, f, indent=2)
+        f.write("{\n")
+        for key, value in header.items():
+            f.write(f"  {json.dumps(key)}: ")
+            f.write(json.dumps(value, indent=2).replace("\n", "\n  ") + ",\n")
+        f.write('  "results": [')
+        for i, r in enumerate(results):
+            f.write(",\n    " if i else "\n    ")
+            f.write(json.dumps(report_row(r)))
+        f.write("\n  ]\n}\n")
 
     print(f"{Colors.BLUE}Report saved to: {output_file}{Colors.RESET}")
 
 
-def create_github_issues(results: List[URLCheck], verbose: bool = False):
+def check_shard_set(paths: List[str], shards: List[Optional[list]]) -> None:
+    """Raise ValueError unless shards (the "shard" of each report) are 1..N."""
+    counts = set()
+    indexes: Dict[int, str] = {}
+    for path, shard in zip(paths, shards):
+        if not shard:
+            raise ValueError(f"{path} is not the report of a --shard run")
+        index, count = shard
+        counts.add(count)
+        if index in indexes:
+            raise ValueError(
+                f"shard {index}/{count} given twice: {indexes[index]}, {path}"
+            )
+        indexes[index] = path
+    if len(counts) != 1:
+        raise ValueError(f"reports of different shard counts: {sorted(counts)}")
+    count = counts.pop()
+    missing = sorted(set(range(1, count + 1)) - set(indexes))
+    if missing:
+        listed = ", ".join(f"{index}/{count}" for index in missing)
+        raise ValueError(f"missing shard reports: {listed}")
+
+
+def load_shard_reports(
+    paths: List[str],
+) -> Tuple[List[URLCheck], List[dict], List[dict]]:
+    """
+    Read the JSON reports of --shard runs back for --merge.
+
+    Returns:
+        (results, per-host rows, unreachable hosts) of all the reports; a
+        result or host found in several reports is kept once
+
+    Raises:
+        ValueError: Unless the reports are exactly shards 1..N of one N, so a
+            shard that crashed or was cancelled cannot silently drop its hosts
+    """
+    reports = []
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            reports.append(json.load(f))
+    check_shard_set(paths, [report.get("shard") for report in reports])
+
+    results: List[URLCheck] = []
+    seen = set()
+    hosts: Dict[str, dict] = {}
+    unreachable: Dict[str, dict] = {}
+    for report in reports:
+        for row in report["results"]:
+            key = (row["url"], row["source_file"], row["field_name"])
+            if key in seen:
+                continue
+            seen.add(key)
+            results.append(
+                URLCheck(
+                    url=row["url"],
+                    status=row["status"],
+                    status_code=row["status_code"],
+                    error_message=row["error_message"],
+                    source_file=row["source_file"],
+                    source_type=row["source_type"],
+                    field_name=row["field_name"],
+                    cached=row.get("cached", False),
+                    bytes_received=row.get("bytes_received", 0),
+                    short_circuited=row.get("short_circuited", False),
+                )
+            )
+        for row in report.get("hosts", []):
+            hosts.setdefault(row["host"], row)
+        for row in report.get("unreachable_hosts", []):
+            unreachable.setdefault(row["host"], row)
+    return (
+        results,
+        sorted(hosts.values(), key=lambda row: (-row["requests"], row["host"])),
+        sorted(unreachable.values(), key=lambda row: row["host"]),
+    )
+
+
+def create_github_issues(results: Iterable[URLCheck], verbose: bool = False):
     """Create GitHub issues for broken links."""
     errors = [r for r in results if r.status == "error"]
 
@@ -885,6 +1801,57 @@ This issue was automatically created by the link checker.
             print(f"  {Colors.RED}[FAIL]{Colors.RESET} Error creating issue for {url}: {e}")
 
 
+def exit_with_status(errors: List[URLCheck]):
+    """Exit 1 if there are broken links, 0 otherwise."""
+    if errors:
+        print(
+            f"\n{Colors.RED}{Colors.BOLD}Link check FAILED: {len(errors)} broken links found{Colors.RESET}"
+        )
+        sys.exit(1)
+    else:
+        print(f"\n{Colors.GREEN}{Colors.BOLD}All links are valid!{Colors.RESET}")
+        sys.exit(0)
+
+
+def merge_link_caches(paths: List[str], cache_path: Path) -> None:
+    """--merge-cache: fold the link caches at paths into the one at cache_path."""
+    with LinkCache(cache_path) as cache:
+        for path in paths:
+            if not Path(path).is_file():
+                print(f"{Colors.YELLOW}No link cache at {path}{Colors.RESET}")
+                continue
+            try:
+                taken = cache.merge(Path(path))
+            except sqlite3.DatabaseError as exc:
+                print(f"{Colors.YELLOW}Skipped link cache {path}: {exc}{Colors.RESET}")
+                continue
+            print(f"Merged {taken} cached results from {path}")
+
+
+def merge_reports(
+    paths: List[str], output_file: str, create_issues: bool, verbose: bool = False
+):
+    """--merge: print, save and file issues for the union of shard reports."""
+    try:
+        results, host_report, unreachable_hosts = load_shard_reports(paths)
+    except (OSError, ValueError, KeyError) as exc:
+        print(f"{Colors.RED}Could not read shard reports: {exc}{Colors.RESET}")
+        sys.exit(2)
+    print(f"Merging {len(paths)} shard reports ({len(results)} results)")
+
+    print_results(results, verbose=verbose)
+    print_host_report(host_report, verbose=verbose)
+    save_report(
+        results,
+        output_file,
+        host_report=host_report,
+        unreachable_hosts=unreachable_hosts,
+    )
+    if create_issues:
+        create_github_issues(results, verbose=verbose)
+    exit_with_status([r for r in results if r.status == "error"])
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -896,6 +1863,11 @@ Examples:
   %(prog)s --yaml-only              # Check only YAML files (fast)
   %(prog)s --file data/agents/example.yml
   %(prog)s --file-list changed-files.txt
+  %(prog)s --since origin/main      # URLs changed since a revision, cache for the rest
+  %(prog)s --resume                 # Continue a run that was interrupted
+  %(prog)s --shard 2/4              # Check the second of four host partitions
+  %(prog)s --merge reports/link-check-shard-*.json
+  %(prog)s --merge-cache shard-caches/*/link-results.sqlite3
   %(prog)s --timeout 10             # Custom timeout (10 seconds)
   %(prog)s --create-issues          # Create GitHub issues for confirmed failures
   %(prog)s --verbose                # Show detailed output
@@ -920,6 +1892,35 @@ Examples:
         help="Max requests per second per domain (default: 5, prevents rate limiting on home connection)",
     )
 
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help=f"URLs checked at once (default: {DEFAULT_CONCURRENCY})",
+    )
+
+    parser.add_argument(
+        "--max-get-bytes",
+        type=int,
+        default=DEFAULT_MAX_GET_BYTES,
+        metavar="BYTES",
+        help=(
+            "Body bytes requested (Range) and read by the GET fallback "
+            f"(default: {DEFAULT_MAX_GET_BYTES})"
+        ),
+    )
+
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        metavar="N",
+        help=(
+            "Worker processes for extracting URLs from new or changed files "
+            "(default: one per CPU, 1 = serial)"
+        ),
+    )
+
     parser.add_argument(
         "--skip-domain",
         action="append",
@@ -954,6 +1955,55 @@ Examples:
         help="File containing newline-separated repository paths to scan (repeatable)",
     )
 
+    parser.add_argument(
+        "--since",
+        metavar="REV",
+        help=(
+            "Only request URLs added or changed since this git revision; "
+            "report cached results for the rest"
+        ),
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Skip URLs already checked by an interrupted run of the same commit "
+            "within the success TTL (results are checkpointed to "
+            ".cache/links/checkpoint.jsonl)"
+        ),
+    )
+
+    parser.add_argument(
+        "--shard",
+        metavar="I/N",
+        help=(
+            "Check only the I-th of N partitions of the URLs, split by host, "
+            "and write reports/link-check-shard-I-of-N.json"
+        ),
+    )
+
+    parser.add_argument(
+        "--merge",
+        nargs="+",
+        metavar="REPORT",
+        help=(
+            "Combine the reports of shards 1..N of one --shard N into the full "
+            "report (no URLs are checked)"
+        ),
+    )
+
+    parser.add_argument(
+        "--merge-cache",
+        nargs="+",
+        default=[],
+        metavar="DB",
+        help=(
+            "Merge other link cache files (e.g. of each --shard run) into the "
+            "local link cache first, keeping the newer result of each URL"
+        ),
+    )
+
     parser.add_argument(
         "--no-issues",
         action="store_true",
@@ -970,9 +2020,54 @@ Examples:
         "--verbose", action="store_true", help="Show detailed output including warnings"
     )
 
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Check every URL instead of reusing recent results from the link cache",
+    )
+
+    default_ttls = CacheTTLs()
+    for status in ("success", "warning", "error"):
+        parser.add_argument(
+            f"--cache-ttl-{status}",
+            type=float,
+            default=getattr(default_ttls, status) / HOUR,
+            metavar="HOURS",
+            help=(
+                f"Reuse cached {status} results younger than this "
+                f"(default: {getattr(default_ttls, status) / HOUR:g})"
+            ),
+        )
+
     args = parser.parse_args()
+    if args.concurrency < 1:
+        parser.error("--concurrency must be at least 1")
+    if args.max_get_bytes < 1:
+        parser.error("--max-get-bytes must be at least 1")
+
+    shard = None
+    if args.shard:
+        try:
+            shard = parse_shard(args.shard)
+        except ValueError as exc:
+            parser.error(f"--shard: {exc}")
+    report_file = "reports/link-check-report.json"
+    if shard is not None:
+        report_file = f"reports/link-check-shard-{shard[0]}-of-{shard[1]}.json"
+
+    if args.merge_cache:
+        merge_link_caches(
+            args.merge_cache, default_cache_path(Path(__file__).parent.parent.resolve())
+        )
+    if args.merge:
+        merge_reports(args.merge, report_file, args.create_issues, args.verbose)
+        return
 
     selected_mode = bool(args.file or args.file_list)
+    if args.since and selected_mode:
+        parser.error("--since cannot be combined with --file or --file-list")
+    if args.since and args.no_cache:
+        parser.error("--since reports cached results and cannot run with --no-cache")
     selected_files = list(args.file)
     for file_list in args.file_list:
         try:
@@ -991,6 +2086,7 @@ Examples:
         yaml_only=args.yaml_only,
         verbose=args.verbose,
         files=selected_files if selected_mode else None,
+        jobs=args.jobs,
     )
 
     if not url_map:
@@ -999,29 +2095,101 @@ Examples:
 
     total_urls = sum(len(urls) for urls in url_map.values())
     print(f"Found {total_urls} URLs in {len(url_map)} files")
+    if shard is not None:
+        url_map = select_shard(url_map, *shard)
+        print(
+            f"Shard {shard[0]}/{shard[1]}: "
+            f"{sum(len(urls) for urls in url_map.values())} URLs"
+        )
+
+    project_root = Path(__file__).parent.parent.resolve()
+    changed = None
+    if args.since:
+        try:
+            changed, changed_files = changed_urls(
+                project_root, args.since, url_map, extract_urls_from_file
+            )
+        except GitDiffError as exc:
+            parser.error(f"--since {args.since}: {exc}")
+        print(
+            f"{len(changed)} URLs added or changed since {args.since} "
+            f"in {len(changed_files)} files"
+        )
 
     skip_domains = set(DEFAULT_SKIP_DOMAINS)
     skip_domains.update(args.skip_domain)
     skip_urls = set(args.skip_url)
 
-    # Check URLs
-    results = asyncio.run(
-        check_all_urls(
-            url_map,
-            timeout=args.timeout,
-            retries=args.retries,
-            rate_limit=args.rate_limit,
-            skip_domains=skip_domains,
-            skip_urls=skip_urls,
-            verbose=args.verbose,
+    cache = None
+    if not args.no_cache:
+        cache = LinkCache(default_cache_path(project_root))
+    cache_ttls = CacheTTLs(
+        success=args.cache_ttl_success * HOUR,
+        warning=args.cache_ttl_warning * HOUR,
+        error=args.cache_ttl_error * HOUR,
+    )
+
+    host_limiter = HostLimiter()
+    host_health = HostHealth()
+    # Results go to the checkpoint as they complete; it is removed once the
+    # run has finished, so only an interrupted run leaves one to resume
+    checkpoint_path = default_checkpoint_path(project_root)
+    if shard is not None:
+        checkpoint_path = checkpoint_path.with_name(
+            f"checkpoint-{shard[0]}-of-{shard[1]}.jsonl"
         )
+    # A checkpoint left by a run of another commit, or past the success TTL,
+    # is not resumed
+    checkpoint = LinkCheckpoint(
+        checkpoint_path,
+        resume=args.resume,
+        revision=head_revision(project_root),
+        max_age=cache_ttls.success,
     )
+    if checkpoint.discarded:
+        print(
+            f"{Colors.YELLOW}Not resuming {checkpoint_path.name}: "
+            f"{checkpoint.discarded}{Colors.RESET}"
+        )
+
+    # Check URLs
+    try:
+        results = asyncio.run(
+            check_all_urls(
+                url_map,
+                timeout=args.timeout,
+                retries=args.retries,
+                rate_limit=args.rate_limit,
+                skip_domains=skip_domains,
+                skip_urls=skip_urls,
+                verbose=args.verbose,
+                cache=cache,
+                cache_ttls=cache_ttls,
+                concurrency=args.concurrency,
+                host_limiter=host_limiter,
+                max_get_bytes=args.max_get_bytes,
+                host_health=host_health,
+                changed=changed,
+                checkpoint=checkpoint,
+            )
+        )
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Print results
     print_results(results, verbose=args.verbose)
+    host_report = host_limiter.report()
+    print_host_report(host_report, verbose=args.verbose)
 
     # Save report
-    save_report(results)
+    save_report(
+        results,
+        report_file,
+        host_report=host_report,
+        unreachable_hosts=host_health.report(),
+        shard=shard,
+    )
 
     # Create GitHub issues only when explicitly requested.
     if args.create_issues:
@@ -1034,14 +2202,12 @@ Examples:
 
     # Exit with appropriate code
     errors = [r for r in results if r.status == "error"]
-    if errors:
-        print(
-            f"\n{Colors.RED}{Colors.BOLD}Link check FAILED: {len(errors)} broken links found{Colors.RESET}"
-        )
-        sys.exit(1)
-    else:
-        print(f"\n{Colors.GREEN}{Colors.BOLD}All links are valid!{Colors.RESET}")
-        sys.exit(0)
+    if changed is not None:
+        # Cached failures elsewhere in the tree are reported, not blamed on
+        # the diff
+        errors = [r for r in errors if r.url in changed]
+    checkpoint.remove()
+    exit_with_status(errors)
 
 
 if __name__ == "__main__":
@@ -1,7 +1,6 @@
 from pathlib import Path
-import yaml
-
 from models import SiteConfig
+from yaml_loader import safe_load
 
 
 DEFAULT_METADATA_PATH = Path("data/metadata.yml")
@@ -11,7 +10,7 @@ def load_site_config(path: Path = DEFAULT_METADATA_PATH) -> SiteConfig:
     if not path.exists():
         raise FileNotFoundError(f"Missing site metadata file: {path}")
     with open(path, "r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle)
+        data = safe_load(handle)
     if not isinstance(data, dict):
         raise ValueError("Site metadata must be a mapping")
     return SiteConfig(**data)
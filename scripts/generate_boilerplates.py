@@ -4,49 +4,29 @@ Generate BOILERPLATES.md from YAML data files
 
 Usage:
     python scripts/generate_boilerplates.py
+    python scripts/generate_boilerplates.py --jobs 4
+    python scripts/generate_boilerplates.py --revalidate
 """
 
+import argparse
 from pathlib import Path
 from collections import defaultdict
 from datetime import date
 import re
-import yaml
-from jinja2 import Environment, FileSystemLoader
-from models import BoilerplateEntry, BoilerplateCategory
+from models import BoilerplateEntry, BoilerplateCategory, SiteConfig
+from catalog import (
+    CatalogSnapshot,
+    load_boilerplate_categories,
+    load_boilerplates,
+    load_snapshot,
+)
 from config import load_site_config
+from template_env import TEMPLATE_CACHE_STATS, create_environment
 
 
-def load_boilerplate_categories() -> list[BoilerplateCategory]:
-    """Load all boilerplate category definitions from data/boilerplate-categories/*.yml"""
-    categories = []
-    category_dir = Path("data/boilerplate-categories")
-
-    for yml_file in sorted(category_dir.glob("*.yml")):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        categories.append(BoilerplateCategory(**data))
-
-    return sorted(categories, key=lambda c: c.order)
-
-
-def load_boilerplates() -> list[BoilerplateEntry]:
-    """Load all boilerplate entries from data/boilerplates/**/*.yml"""
-    boilerplates = []
-    boilerplates_dir = Path("data/boilerplates")
-
-    for yml_file in boilerplates_dir.rglob("*.yml"):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        if data:  # Skip empty files
-            boilerplates.append(BoilerplateEntry(**data))
-
-    return boilerplates
-
-
-def count_agents() -> int:
+def count_agents(snapshot: CatalogSnapshot) -> int:
     """Count total agent entries for cross-reference"""
-    agents_dir = Path("data/agents")
-    return len(list(agents_dir.rglob("*.yml")))
+    return len(snapshot.records_for("agent"))
 
 
 def format_stars(count: int | None) -> str:
@@ -157,14 +137,14 @@ def render_boilerplates_readme(
     site_links,
 ) -> str:
     """Render BOILERPLATES.md content from template and data."""
-    env = Environment(
-        loader=FileSystemLoader("templates"), trim_blocks=True, lstrip_blocks=True
+    env = create_environment(
+        filters={
+            "format_stars": format_stars,
+            "slugify": slugify,
+            "truncate_desc": truncate_description,
+        }
     )
 
-    env.filters["format_stars"] = format_stars
-    env.filters["slugify"] = slugify
-    env.filters["truncate_desc"] = truncate_description
-
     template = env.get_template("boilerplates_readme.jinja2")
     return template.render(
         total_entries=total_entries,
@@ -178,19 +158,32 @@ def render_boilerplates_readme(
     )
 
 
-def generate_boilerplates_readme():
-    """Main function: load data, render template, write output"""
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate BOILERPLATES.md from YAML data."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for loading the catalog (default: one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-run full validation instead of trusting stamped snapshot records",
+    )
+    return parser.parse_args()
 
-    print("Loading boilerplate data...")
-    site_config = load_site_config()
-    categories = load_boilerplate_categories()
-    boilerplates = load_boilerplates()
-    entries_by_category = group_by_category(boilerplates)
-    categories_by_ecosystem = group_by_ecosystem(categories)
-    agent_count = count_agents()
 
-    print(f"Loaded {len(categories)} categories and {len(boilerplates)} boilerplates")
-    print(f"Found {agent_count} agents for cross-reference")
+def build_boilerplates_readme(
+    site_config: SiteConfig,
+    categories: list[BoilerplateCategory],
+    boilerplates: list[BoilerplateEntry],
+    agent_count: int,
+) -> str:
+    """Build BOILERPLATES.md content from loaded models."""
+    categories_by_ecosystem = group_by_ecosystem(categories)
 
     # Build ordered ecosystems list (only those with categories)
     ecosystem_order = get_ecosystem_order()
@@ -203,25 +196,43 @@ def generate_boilerplates_readme():
         if eco not in ordered_ecosystems:
             ordered_ecosystems.append(eco)
 
-    # Render
-    print("Rendering BOILERPLATES.md...")
-    output = render_boilerplates_readme(
+    return render_boilerplates_readme(
         total_entries=len(boilerplates),
         last_generated=date.today(),
         ecosystems=ordered_ecosystems,
         categories_by_ecosystem=categories_by_ecosystem,
-        entries_by_category=entries_by_category,
+        entries_by_category=group_by_category(boilerplates),
         categories=categories,
         agent_count=agent_count,
         site_links=site_config.links,
     )
 
+
+def generate_boilerplates_readme(jobs: int | None = None, trusted: bool = True):
+    """Main function: load data, render template, write output"""
+
+    print("Loading boilerplate data...")
+    site_config = load_site_config()
+    snapshot = load_snapshot(jobs=jobs)
+    categories = load_boilerplate_categories(snapshot, trusted=trusted)
+    boilerplates = load_boilerplates(snapshot, trusted=trusted)
+    agent_count = count_agents(snapshot)
+
+    print(f"Loaded {len(categories)} categories and {len(boilerplates)} boilerplates")
+    print(f"Found {agent_count} agents for cross-reference")
+
+    # Render
+    print("Rendering BOILERPLATES.md...")
+    output = build_boilerplates_readme(site_config, categories, boilerplates, agent_count)
+
     # Write
     output_path = Path("BOILERPLATES.md")
     output_path.write_text(output)
 
     print(f"Generated {output_path} with {len(boilerplates)} entries")
+    print(f"Template cache: {TEMPLATE_CACHE_STATS}")
 
 
 if __name__ == "__main__":
-    generate_boilerplates_readme()
+    args = parse_args()
+    generate_boilerplates_readme(jobs=args.jobs, trusted=not args.revalidate)
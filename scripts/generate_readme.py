@@ -4,47 +4,23 @@ Generate README.md from YAML data files
 
 Usage:
     python scripts/generate_readme.py
+    python scripts/generate_readme.py --jobs 4
+    python scripts/generate_readme.py --revalidate
 """
 
+import argparse
 from pathlib import Path
 from collections import defaultdict
 from datetime import date
-import yaml
-from jinja2 import Environment, FileSystemLoader
-from models import AgentEntry, Category, DirectoryMetadata
+from models import AgentEntry, Category, DirectoryMetadata, SiteConfig
+from catalog import CatalogSnapshot, load_agents, load_categories, load_snapshot
 from config import load_site_config
+from template_env import TEMPLATE_CACHE_STATS, create_environment
 
 
-def load_categories() -> list[Category]:
-    """Load all category definitions"""
-    categories = []
-    category_dir = Path("data/categories")
-
-    for yml_file in sorted(category_dir.glob("*.yml")):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        categories.append(Category(**data))
-
-    return sorted(categories, key=lambda c: c.order)
-
-
-def load_agents() -> list[AgentEntry]:
-    """Load all agent entries"""
-    agents = []
-    agents_dir = Path("data/agents")
-
-    for yml_file in agents_dir.rglob("*.yml"):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        agents.append(AgentEntry(**data))
-
-    return agents
-
-
-def count_boilerplates() -> int:
+def count_boilerplates(snapshot: CatalogSnapshot) -> int:
     """Count total boilerplate entries for cross-reference"""
-    boilerplates_dir = Path("data/boilerplates")
-    return len(list(boilerplates_dir.rglob("*.yml")))
+    return len(snapshot.records_for("boilerplate"))
 
 
 def markdown_table_cell(value) -> str:
@@ -75,10 +51,7 @@ def render_readme(
     boilerplate_count: int,
 ) -> str:
     """Render README content from template and data."""
-    env = Environment(
-        loader=FileSystemLoader("templates"), trim_blocks=True, lstrip_blocks=True
-    )
-    env.filters["markdown_table_cell"] = markdown_table_cell
+    env = create_environment(filters={"markdown_table_cell": markdown_table_cell})
     template = env.get_template("readme.jinja2")
 
     return template.render(
@@ -89,20 +62,31 @@ def render_readme(
     )
 
 
-def generate_readme():
-    """Generate README.md from templates and data"""
-
-    print("Loading data...")
-    site_config = load_site_config()
-    categories = load_categories()
-    agents = load_agents()
-    entries_by_category = group_by_category(agents)
-    boilerplate_count = count_boilerplates()
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate README.md from YAML data."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for loading the catalog (default: one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-run full validation instead of trusting stamped snapshot records",
+    )
+    return parser.parse_args()
 
-    print(f"Loaded {len(categories)} categories and {len(agents)} agents")
-    print(f"Found {boilerplate_count} boilerplates for cross-reference")
 
-    # Build metadata
+def build_readme(
+    site_config: SiteConfig,
+    categories: list[Category],
+    agents: list[AgentEntry],
+    boilerplate_count: int,
+) -> str:
+    """Build README content from loaded models."""
     metadata = DirectoryMetadata(
         title=site_config.title,
         version=site_config.version,
@@ -112,21 +96,39 @@ def generate_readme():
         links=site_config.links,
     )
 
-    # Render
-    print("Rendering README...")
-    output = render_readme(
+    return render_readme(
         metadata=metadata,
         categories=categories,
-        entries_by_category=entries_by_category,
+        entries_by_category=group_by_category(agents),
         boilerplate_count=boilerplate_count,
     )
 
+
+def generate_readme(jobs: int | None = None, trusted: bool = True):
+    """Generate README.md from templates and data"""
+
+    print("Loading data...")
+    site_config = load_site_config()
+    snapshot = load_snapshot(jobs=jobs)
+    categories = load_categories(snapshot, trusted=trusted)
+    agents = load_agents(snapshot, trusted=trusted)
+    boilerplate_count = count_boilerplates(snapshot)
+
+    print(f"Loaded {len(categories)} categories and {len(agents)} agents")
+    print(f"Found {boilerplate_count} boilerplates for cross-reference")
+
+    # Render
+    print("Rendering README...")
+    output = build_readme(site_config, categories, agents, boilerplate_count)
+
     # Write
     readme_path = Path("README.md")
     readme_path.write_text(output)
 
     print(f"[OK] Generated {readme_path} with {len(agents)} entries")
+    print(f"Template cache: {TEMPLATE_CACHE_STATS}")
 
 
 if __name__ == "__main__":
-    generate_readme()
+    args = parse_args()
+    generate_readme(jobs=args.jobs, trusted=not args.revalidate)
@@ -4,75 +4,96 @@ Generate static HTML website from YAML data files
 
 Usage:
     python scripts/generate_site.py
+    python scripts/generate_site.py --jobs 4
+    python scripts/generate_site.py --jobs 1  # Render pages serially
+    python scripts/generate_site.py --revalidate
+    python scripts/generate_site.py --full
+    python scripts/generate_site.py --no-compress
+    python scripts/generate_site.py --search-index full
 """
 
+import argparse
+import math
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
 from datetime import date
-import yaml
+import hashlib
 import json
-import shutil
-from jinja2 import Environment, FileSystemLoader
+from typing import Callable, Iterator
+from jinja2 import Environment
 from models import (
     AgentEntry,
     Category,
     DirectoryMetadata,
     BoilerplateEntry,
     BoilerplateCategory,
+    SiteConfig,
+)
+from catalog import (
+    CHUNKS_PER_WORKER,
+    CatalogRecord,
+    CatalogSnapshot,
+    default_cache_dir,
+    load_agents,
+    load_boilerplate_categories,
+    load_boilerplates,
+    load_categories,
+    load_snapshot,
+    models_fingerprint,
+    resolve_jobs,
 )
 from config import load_site_config
+from precompress import BROTLI_AVAILABLE, precompress_tree, prune_stale_siblings
+from search_index import (
+    SEARCH_DIRNAME,
+    SEARCH_INDEX_FILENAME,
+    SEARCH_INDEX_FORMATS,
+    build_search_files,
+)
+from template_env import TEMPLATE_CACHE_STATS, CacheStats, create_environment
+from site_manifest import (
+    SITE_MANIFEST_FILENAME,
+    OutputDeps,
+    SiteManifest,
+    WriteSummary,
+    prune_tree,
+    sync_tree,
+    write_if_changed,
+)
 
 
-def load_categories() -> list[Category]:
-    """Load all category definitions"""
-    categories = []
-    category_dir = Path("data/categories")
-
-    for yml_file in sorted(category_dir.glob("*.yml")):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        categories.append(Category(**data))
-
-    return sorted(categories, key=lambda c: c.order)
-
-
-def load_agents() -> list[AgentEntry]:
-    """Load all agent entries"""
-    agents = []
-    agents_dir = Path("data/agents")
-
-    for yml_file in agents_dir.rglob("*.yml"):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        agents.append(AgentEntry(**data))
-
-    return agents
-
-
-def load_boilerplate_categories() -> list[BoilerplateCategory]:
-    """Load all boilerplate category definitions"""
-    categories = []
-    category_dir = Path("data/boilerplate-categories")
+# Below this many pages to render, starting worker processes costs more than it saves
+PARALLEL_RENDER_THRESHOLD = 8
 
-    for yml_file in sorted(category_dir.glob("*.yml")):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        categories.append(BoilerplateCategory(**data))
 
-    return sorted(categories, key=lambda c: c.order)
+@dataclass
+class SiteData:
+    """Everything the site pages, search index, sitemap and stats are built from."""
 
+    site_config: SiteConfig
+    metadata: DirectoryMetadata
+    categories: list[Category]
+    agents: list[AgentEntry]
+    entries_by_category: dict[str, list[AgentEntry]]
+    boilerplate_categories: list[BoilerplateCategory]
+    boilerplates: list[BoilerplateEntry]
+    boilerplates_by_category: dict[str, list[BoilerplateEntry]]
+    ecosystems_by_category: dict[str, list[BoilerplateCategory]]
+    snapshot: CatalogSnapshot
 
-def load_boilerplates() -> list[BoilerplateEntry]:
-    """Load all boilerplate entries"""
-    boilerplates = []
-    boilerplates_dir = Path("data/boilerplates")
 
-    for yml_file in boilerplates_dir.rglob("*.yml"):
-        with open(yml_file) as f:
-            data = yaml.safe_load(f)
-        boilerplates.append(BoilerplateEntry(**data))
+@dataclass
+class Page:
+    """One HTML page: where it goes, how it renders and what it depends on."""
 
-    return boilerplates
+    output: str  # POSIX path relative to the output directory
+    template: str
+    context: dict
+    label: str
+    deps: OutputDeps
 
 
 def group_by_category(agents: list[AgentEntry]) -> dict:
@@ -170,13 +191,12 @@ def create_search_index(
     return index
 
 
-def generate_sitemap(
+def create_sitemap(
     categories: list[Category],
     boilerplate_categories: list[BoilerplateCategory],
-    output_dir: Path,
     site_url: str,
-):
-    """Generate sitemap.xml for SEO"""
+) -> str:
+    """Build sitemap.xml content for SEO"""
     base_url = str(site_url).rstrip("/")
     today = date.today().isoformat()
 
@@ -220,10 +240,24 @@ def generate_sitemap(
         sitemap.append("  </url>")
 
     sitemap.append("</urlset>")
+    return "\n".join(sitemap)
 
+
+def generate_sitemap(
+    categories: list[Category],
+    boilerplate_categories: list[BoilerplateCategory],
+    output_dir: Path,
+    site_url: str,
+    summary: WriteSummary | None = None,
+) -> Path:
+    """Generate sitemap.xml for SEO"""
     sitemap_path = output_dir / "sitemap.xml"
-    sitemap_path.write_text("\n".join(sitemap))
-    print(f"[OK] Generated {sitemap_path}")
+    write_if_changed(
+        sitemap_path,
+        create_sitemap(categories, boilerplate_categories, site_url),
+        summary,
+    )
+    return sitemap_path
 
 
 def create_boilerplate_search_index(
@@ -261,202 +295,640 @@ def create_boilerplate_search_index(
     return index
 
 
-def copy_static_assets(output_dir: Path):
-    """Copy static assets to output directory"""
+def copy_static_assets(output_dir: Path, summary: WriteSummary | None = None) -> Path:
+    """Sync static assets to output directory
+
+    Only new or modified files are copied and only files removed from static/
+    are deleted, so unchanged assets keep their mtime.
+    """
     static_src = Path("static")
     static_dst = output_dir / "static"
+    sync_tree(static_src, static_dst, summary)
+    return static_dst
+
+
+def load_site_data(
+    snapshot: CatalogSnapshot, site_config: SiteConfig, trusted: bool = True
+) -> SiteData:
+    """Load models from the catalog snapshot and group them for rendering"""
+    categories = load_categories(snapshot, trusted=trusted)
+    agents = load_agents(snapshot, trusted=trusted)
+    boilerplate_categories = load_boilerplate_categories(snapshot, trusted=trusted)
+    boilerplates = load_boilerplates(snapshot, trusted=trusted)
+    boilerplates_by_category = group_boilerplates_by_category(boilerplates)
 
-    if static_dst.exists():
-        shutil.rmtree(static_dst)
-
-    shutil.copytree(static_src, static_dst)
-    print(f"[OK] Copied static assets to {static_dst}")
-
-
-def generate_site():
-    """Generate complete static website"""
+    return SiteData(
+        site_config=site_config,
+        metadata=DirectoryMetadata(
+            title=site_config.title,
+            tagline=site_config.tagline,
+            total_entries=len(agents),
+            last_generated=date.today(),
+            links=site_config.links,
+        ),
+        categories=categories,
+        agents=agents,
+        entries_by_category=group_by_category(agents),
+        boilerplate_categories=boilerplate_categories,
+        boilerplates=boilerplates,
+        boilerplates_by_category=boilerplates_by_category,
+        ecosystems_by_category=group_boilerplates_by_ecosystem(
+            boilerplate_categories, boilerplates_by_category
+        ),
+        snapshot=snapshot,
+    )
 
-    print("=" * 60)
-    print("Ultimate Agent Directory - Website Generator")
-    print("=" * 60)
 
-    # Create output directory
-    output_dir = Path("_site")
-    output_dir.mkdir(exist_ok=True)
+def site_build_key() -> str:
+    """Changes whenever the generator code or schema changes, forcing a full build"""
+    scripts_dir = Path(__file__).parent
+    source = b"".join(
+        (scripts_dir / name).read_bytes() for name in ("generate_site.py", "search_index.py")
+    )
+    return hashlib.sha256(source + models_fingerprint().encode()).hexdigest()
 
-    # Load AI agents data
-    print("\nLoading data...")
-    site_config = load_site_config()
-    categories = load_categories()
-    agents = load_agents()
-    entries_by_category = group_by_category(agents)
 
-    print(f"  Loaded {len(categories)} AI agent categories")
-    print(f"  Loaded {len(agents)} AI agents")
+def open_site_manifest(
+    snapshot: CatalogSnapshot, output_dir: Path, full: bool = False
+) -> SiteManifest:
+    """Load the output manifest kept next to the catalog snapshot"""
+    path = default_cache_dir(snapshot.data_dir) / SITE_MANIFEST_FILENAME
+    return SiteManifest.load(path, output_dir, site_build_key(), full=full)
 
-    # Load boilerplate data
-    boilerplate_categories = load_boilerplate_categories()
-    boilerplates = load_boilerplates()
-    boilerplates_by_category = group_boilerplates_by_category(boilerplates)
-    ecosystems_by_category = group_boilerplates_by_ecosystem(
-        boilerplate_categories, boilerplates_by_category
-    )
 
-    print(f"  Loaded {len(boilerplate_categories)} boilerplate categories")
-    print(f"  Loaded {len(boilerplates)} boilerplates")
+def format_date(d) -> str:
+    return d.strftime("%B %d, %Y") if d else "N/A"
 
-    # Build metadata
-    metadata = DirectoryMetadata(
-        title=site_config.title,
-        tagline=site_config.tagline,
-        total_entries=len(agents),
-        last_generated=date.today(),
-        links=site_config.links,
-    )
 
-    # Base URL for GitHub Pages (repo name)
-    base_url = site_config.base_url
+def create_jinja_env(stats: CacheStats = TEMPLATE_CACHE_STATS) -> Environment:
+    """Jinja2 environment for the HTML templates"""
+    return create_environment(filters={"formatdate": format_date}, stats=stats)
 
-    # Setup Jinja2 environment
-    env = Environment(
-        loader=FileSystemLoader("templates"), trim_blocks=True, lstrip_blocks=True
-    )
 
-    # Add custom filters
-    env.filters["formatdate"] = lambda d: d.strftime("%B %d, %Y") if d else "N/A"
+def record_values(record: CatalogRecord) -> dict:
+    """Validated field values of a record (raw data if it was never validated)"""
+    return record.validated or record.data or {}
 
-    # Generate homepage
-    print("\nGenerating pages...")
-    print("  Homepage (index.html)")
-    index_template = env.get_template("index.html.jinja2")
-    index_html = index_template.render(
-        metadata=metadata,
-        categories=categories,
-        entries_by_category=entries_by_category,
-        base_url=base_url,
-    )
-    (output_dir / "index.html").write_text(index_html)
 
-    # Generate category pages
-    categories_dir = output_dir / "categories"
-    categories_dir.mkdir(exist_ok=True)
+def plan_pages(data: SiteData) -> list[Page]:
+    """List every HTML page with its render context and inputs.
 
-    category_template = env.get_template("category.html.jinja2")
+    Every page shows the directory metadata (including the agent count) and
+    base URL, so those are inputs of all pages. Beyond that:
+    - a category page depends on its category file and its agents' files
+    - the homepage depends on every category file, the per-category counts
+      and the files of featured agents only
+    - the boilerplate pages mirror the same split
+    """
+    base_url = data.site_config.base_url
+    site_values = {
+        "metadata": data.metadata.model_dump(mode="json"),
+        "base_url": base_url,
+    }
 
-    for category in categories:
-        category_agents = entries_by_category.get(category.id, [])
-        print(f"  {category.title} ({len(category_agents)} entries)")
-
-        category_html = category_template.render(
-            metadata=metadata,
-            category=category,
-            agents=category_agents,
-            base_url=base_url,
+    category_records: dict[str, CatalogRecord] = {}
+    for record in data.snapshot.records_for("category"):
+        category_records[record_values(record).get("id", "")] = record
+    agent_records: dict[str, list[CatalogRecord]] = defaultdict(list)
+    for record in data.snapshot.records_for("agent"):
+        agent_records[record_values(record).get("category", "")].append(record)
+
+    bp_category_records: dict[str, CatalogRecord] = {}
+    for record in data.snapshot.records_for("boilerplate-category"):
+        bp_category_records[record_values(record).get("id", "")] = record
+    boilerplate_records: dict[str, list[CatalogRecord]] = defaultdict(list)
+    for record in data.snapshot.records_for("boilerplate"):
+        if record.data is not None:
+            values = record_values(record)
+            boilerplate_records[values.get("category", "")].append(record)
+
+    def featured(records: dict[str, list[CatalogRecord]]) -> list[CatalogRecord]:
+        return [
+            record
+            for group in records.values()
+            for record in group
+            if record_values(record).get("featured")
+        ]
+
+    pages = [
+        Page(
+            output="index.html",
+            template="index.html.jinja2",
+            context={
+                "metadata": data.metadata,
+                "categories": data.categories,
+                "entries_by_category": data.entries_by_category,
+                "base_url": base_url,
+            },
+            label="Homepage (index.html)",
+            deps=OutputDeps(
+                templates=["index.html.jinja2"],
+                records=list(category_records.values()) + featured(agent_records),
+                values={
+                    **site_values,
+                    "counts": {
+                        category_id: len(entries)
+                        for category_id, entries in data.entries_by_category.items()
+                    },
+                },
+            ),
         )
+    ]
 
-        category_file = categories_dir / f"{category.id}.html"
-        category_file.write_text(category_html)
-
-    # Generate boilerplate pages
-    print("\nGenerating boilerplate pages...")
-    boilerplates_dir = output_dir / "boilerplates"
-    boilerplates_dir.mkdir(exist_ok=True)
+    for category in data.categories:
+        category_agents = data.entries_by_category.get(category.id, [])
+        category_record = category_records.get(category.id)
+        pages.append(
+            Page(
+                output=f"categories/{category.id}.html",
+                template="category.html.jinja2",
+                context={
+                    "metadata": data.metadata,
+                    "category": category,
+                    "agents": category_agents,
+                    "base_url": base_url,
+                },
+                label=f"{category.title} ({len(category_agents)} entries)",
+                deps=OutputDeps(
+                    templates=["category.html.jinja2"],
+                    records=([category_record] if category_record else [])
+                    + agent_records.get(category.id, []),
+                    values=site_values,
+                ),
+            )
+        )
 
-    # Boilerplate index page
-    print("  Boilerplates index")
-    bp_index_template = env.get_template("boilerplate_index.html.jinja2")
-    bp_index_html = bp_index_template.render(
-        metadata=metadata,
-        boilerplate_categories=boilerplate_categories,
-        boilerplates_by_category=boilerplates_by_category,
-        ecosystems_by_category=ecosystems_by_category,
-        total_boilerplates=len(boilerplates),
-        base_url=base_url,
+    pages.append(
+        Page(
+            output="boilerplates/index.html",
+            template="boilerplate_index.html.jinja2",
+            context={
+                "metadata": data.metadata,
+                "boilerplate_categories": data.boilerplate_categories,
+                "boilerplates_by_category": data.boilerplates_by_category,
+                "ecosystems_by_category": data.ecosystems_by_category,
+                "total_boilerplates": len(data.boilerplates),
+                "base_url": base_url,
+            },
+            label="Boilerplates index",
+            deps=OutputDeps(
+                templates=["boilerplate_index.html.jinja2"],
+                records=list(bp_category_records.values())
+                + featured(boilerplate_records),
+                values={
+                    **site_values,
+                    "counts": {
+                        category_id: len(entries)
+                        for category_id, entries in data.boilerplates_by_category.items()
+                    },
+                },
+            ),
+        )
     )
-    (boilerplates_dir / "index.html").write_text(bp_index_html)
 
-    # Boilerplate category pages
-    bp_category_template = env.get_template("boilerplate_category.html.jinja2")
-
-    for category in boilerplate_categories:
-        category_boilerplates = boilerplates_by_category.get(category.id, [])
-        if category_boilerplates:
-            print(f"  {category.title} ({len(category_boilerplates)} entries)")
-
-            # Create category directory
-            category_dir = boilerplates_dir / category.id
-            category_dir.mkdir(exist_ok=True)
-
-            bp_category_html = bp_category_template.render(
-                metadata=metadata,
-                category=category,
-                boilerplates=category_boilerplates,
-                base_url=base_url,
+    for bp_category in data.boilerplate_categories:
+        category_boilerplates = data.boilerplates_by_category.get(bp_category.id, [])
+        if not category_boilerplates:
+            continue
+        bp_category_record = bp_category_records.get(bp_category.id)
+        pages.append(
+            Page(
+                output=f"boilerplates/{bp_category.id}/index.html",
+                template="boilerplate_category.html.jinja2",
+                context={
+                    "metadata": data.metadata,
+                    "category": bp_category,
+                    "boilerplates": category_boilerplates,
+                    "base_url": base_url,
+                },
+                label=f"{bp_category.title} ({len(category_boilerplates)} entries)",
+                deps=OutputDeps(
+                    templates=["boilerplate_category.html.jinja2"],
+                    records=([bp_category_record] if bp_category_record else [])
+                    + boilerplate_records.get(bp_category.id, []),
+                    values=site_values,
+                ),
             )
+        )
 
-            category_file = category_dir / "index.html"
-            category_file.write_text(bp_category_html)
-
-    # Generate search index (includes both agents and boilerplates)
-    print("\nGenerating search index...")
-    agent_search_index = create_search_index(agents, categories)
+    return pages
+
+
+def render_page(env: Environment, page: Page) -> str:
+    return env.get_template(page.template).render(**page.context)
+
+
+# Per-process state of page rendering workers, set up by init_render_worker()
+_worker_env: Environment | None = None
+_worker_pages: dict[str, Page] = {}
+_worker_cache_stats = CacheStats()
+
+
+def init_render_worker(data: SiteData) -> None:
+    """Give a worker process its own Jinja2 environment and page plan"""
+    global _worker_env, _worker_pages, _worker_cache_stats
+    _worker_cache_stats = CacheStats()
+    _worker_env = create_jinja_env(_worker_cache_stats)
+    _worker_pages = {page.output: page for page in plan_pages(data)}
+
+
+def render_page_chunk(outputs: list[str]) -> tuple[list[str], tuple[int, int]]:
+    """Render pages by output path; runs in workers
+
+    Returns:
+        (html per output, template cache (hits, misses) since the last chunk)
+    """
+    assert _worker_env is not None, "init_render_worker() has not run"
+    htmls = [render_page(_worker_env, _worker_pages[output]) for output in outputs]
+    return htmls, _worker_cache_stats.drain()
+
+
+def render_html(
+    data: SiteData, pages: list[Page], jobs: int | None = None
+) -> Iterator[tuple[Page, str]]:
+    """Yield (page, html) in page order, rendering over a process pool when worthwhile
+
+    Workers rebuild the page plan from the same SiteData, so their output is
+    byte-identical to rendering serially. Falls back to serial rendering for
+    few pages, jobs=1, or platforms where a process pool cannot be started.
+    """
+    workers = min(resolve_jobs(jobs), len(pages))
+    done = 0
+    if workers > 1 and len(pages) >= PARALLEL_RENDER_THRESHOLD:
+        chunk_size = math.ceil(len(pages) / (workers * CHUNKS_PER_WORKER))
+        chunks = [pages[i : i + chunk_size] for i in range(0, len(pages), chunk_size)]
+        try:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=init_render_worker,
+                initargs=(data,),
+            ) as executor:
+                # map() yields in submission order, so pages are written in order
+                outputs = [[page.output for page in chunk] for chunk in chunks]
+                results = executor.map(render_page_chunk, outputs)
+                for chunk, (htmls, (hits, misses)) in zip(chunks, results):
+                    TEMPLATE_CACHE_STATS.add(hits, misses)
+                    for page, html in zip(chunk, htmls):
+                        yield page, html
+                        done += 1
+            return
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # Render whatever is left serially
+
+    env = create_jinja_env()
+    for page in pages[done:]:
+        yield page, render_page(env, page)
+
+
+def render_pages(
+    data: SiteData,
+    output_dir: Path,
+    manifest: SiteManifest | None = None,
+    log: Callable[[str], None] = print,
+    summary: WriteSummary | None = None,
+    jobs: int | None = None,
+) -> tuple[int, int]:
+    """Render every page whose inputs changed since the last build
+
+    Without a manifest every page is rendered. Pages are rendered in up to
+    `jobs` worker processes (None or 0 = one per CPU) and written by this
+    process. A rendered page is only written if its HTML differs from the
+    file on disk. Pages that are no longer produced (e.g. a removed category)
+    are deleted.
+
+    Returns:
+        (rendered page count, unchanged page count)
+    """
+    unchanged = 0
+    pages = plan_pages(data)
+    todo: list[Page] = []
+    fingerprints: dict[str, str] = {}
+
+    for page in pages:
+        fingerprint = manifest.fingerprint(page.deps) if manifest else ""
+        if manifest is not None and manifest.is_current(page.output, fingerprint):
+            unchanged += 1
+            if summary is not None:
+                summary.add(unchanged=1)
+            continue
+        fingerprints[page.output] = fingerprint
+        todo.append(page)
+
+    for page, html in render_html(data, todo, jobs):
+        log(f"  {page.label}")
+        write_if_changed(output_dir / page.output, html, summary)
+        if manifest is not None:
+            manifest.record(page.output, "pages", fingerprints[page.output], page.deps)
+
+    if manifest is not None:
+        removed = manifest.remove_stale("pages", {page.output for page in pages})
+        for output in removed:
+            log(f"  Removed {output}")
+        if summary is not None:
+            summary.add(deleted=len(removed))
+        manifest.save()
+
+    return len(todo), unchanged
+
+
+def write_search_index(
+    data: SiteData,
+    output_dir: Path,
+    manifest: SiteManifest | None = None,
+    summary: WriteSummary | None = None,
+    index_format: str = "sharded",
+) -> tuple[Path, int, int, int] | None:
+    """Write the combined agent + boilerplate search index
+
+    "full" writes only search-index.json, indented. "sharded" writes only
+    the search/ shards loaded by search.js (see search_index.py); the
+    single-file index is not needed alongside them. The index depends on
+    every catalog file, so any data change rebuilds it; files of the other
+    format and shards no longer produced are deleted.
+
+    Returns:
+        (path of search-index.json or search/manifest.json, agent entry count,
+        boilerplate entry count, shard file count), or None if the index was
+        already up to date
+    """
+    if index_format not in SEARCH_INDEX_FORMATS:
+        raise ValueError(f"Unknown search index format '{index_format}'")
+
+    deps = OutputDeps(
+        records=[
+            record
+            for kind in ("category", "agent", "boilerplate-category", "boilerplate")
+            for record in data.snapshot.records_for(kind)
+        ],
+        values={"format": index_format},
+    )
+    fingerprint = manifest.fingerprint(deps) if manifest else ""
+    if manifest is not None:
+        outputs = manifest.group_outputs("search-index")
+        if outputs and all(manifest.is_current(output, fingerprint) for output in outputs):
+            if summary is not None:
+                summary.add(unchanged=len(outputs))
+            return None
+
+    agent_search_index = create_search_index(data.agents, data.categories)
     boilerplate_search_index = create_boilerplate_search_index(
-        boilerplates, boilerplate_categories
+        data.boilerplates, data.boilerplate_categories
     )
     combined_search_index = agent_search_index + boilerplate_search_index
-    search_index_path = output_dir / "search-index.json"
-    search_index_path.write_text(json.dumps(combined_search_index, indent=2))
-    print(
-        f"  Generated {search_index_path} ({len(agent_search_index)} agents + {len(boilerplate_search_index)} boilerplates)"
+    if index_format == "full":
+        index_output = SEARCH_INDEX_FILENAME
+        files = {index_output: json.dumps(combined_search_index, indent=2)}
+    else:
+        index_output = f"{SEARCH_DIRNAME}/manifest.json"
+        files = build_search_files(combined_search_index)
+
+    for output, content in files.items():
+        write_if_changed(output_dir / output, content, summary)
+    # search/ only ever holds the current shards
+    shards = {
+        Path(output).relative_to(SEARCH_DIRNAME)
+        for output in files
+        if output.startswith(f"{SEARCH_DIRNAME}/")
+    }
+    removed = prune_tree(output_dir / SEARCH_DIRNAME, shards)
+    if summary is not None:
+        summary.add(deleted=removed)
+    if manifest is not None:
+        for output in files:
+            # The catalog inputs are listed once, on the index or shard manifest
+            output_deps = deps if output == index_output else OutputDeps()
+            manifest.record(output, "search-index", fingerprint, output_deps)
+        manifest.remove_stale("search-index", set(files))
+        manifest.save()
+    return (
+        output_dir / index_output,
+        len(agent_search_index),
+        len(boilerplate_search_index),
+        len(shards),
     )
 
-    # Copy static assets
-    print("\nCopying static assets...")
-    copy_static_assets(output_dir)
 
-    # Generate sitemap (includes both agents and boilerplates)
-    print("\nGenerating sitemap...")
-    generate_sitemap(categories, boilerplate_categories, output_dir, site_config.site_url)
-
-    # Generate stats file
-    stats = {
-        "total_agents": len(agents),
-        "total_agent_categories": len(categories),
-        "total_boilerplates": len(boilerplates),
-        "total_boilerplate_categories": len(boilerplate_categories),
+def write_sitemap(
+    data: SiteData,
+    output_dir: Path,
+    manifest: SiteManifest | None = None,
+    summary: WriteSummary | None = None,
+) -> Path | None:
+    """Write sitemap.xml; returns None if it was already up to date"""
+    sitemap_path = output_dir / "sitemap.xml"
+    deps = OutputDeps(
+        values={
+            "categories": [category.id for category in data.categories],
+            "boilerplate_categories": [
+                category.id for category in data.boilerplate_categories
+            ],
+            "site_url": str(data.site_config.site_url),
+            "today": date.today().isoformat(),
+        }
+    )
+    fingerprint = manifest.fingerprint(deps) if manifest else ""
+    if manifest is not None and manifest.is_current(sitemap_path.name, fingerprint):
+        if summary is not None:
+            summary.add(unchanged=1)
+        return None
+
+    generate_sitemap(
+        data.categories,
+        data.boilerplate_categories,
+        output_dir,
+        str(data.site_config.site_url),
+        summary,
+    )
+    if manifest is not None:
+        manifest.record(sitemap_path.name, "sitemap", fingerprint, deps)
+        manifest.save()
+    return sitemap_path
+
+
+def create_stats(data: SiteData) -> dict:
+    """Summary counts published as stats.json"""
+    stats: dict = {
+        "total_agents": len(data.agents),
+        "total_agent_categories": len(data.categories),
+        "total_boilerplates": len(data.boilerplates),
+        "total_boilerplate_categories": len(data.boilerplate_categories),
         "agents_by_category": {
-            cat.id: len(entries_by_category.get(cat.id, [])) for cat in categories
+            cat.id: len(data.entries_by_category.get(cat.id, []))
+            for cat in data.categories
         },
         "boilerplates_by_category": {
-            cat.id: len(boilerplates_by_category.get(cat.id, []))
-            for cat in boilerplate_categories
+            cat.id: len(data.boilerplates_by_category.get(cat.id, []))
+            for cat in data.boilerplate_categories
         },
         "agents_by_type": {},
         "last_generated": date.today().isoformat(),
     }
 
     # Count agents by type
-    for agent in agents:
+    for agent in data.agents:
         stats["agents_by_type"][agent.type] = (
             stats["agents_by_type"].get(agent.type, 0) + 1
         )
 
+    return stats
+
+
+def write_stats(
+    data: SiteData,
+    output_dir: Path,
+    manifest: SiteManifest | None = None,
+    summary: WriteSummary | None = None,
+) -> Path | None:
+    """Write stats.json; returns None if it was already up to date"""
     stats_path = output_dir / "stats.json"
-    stats_path.write_text(json.dumps(stats, indent=2))
-    print(f"  Generated {stats_path}")
+    stats = create_stats(data)
+    deps = OutputDeps(values=stats)
+    fingerprint = manifest.fingerprint(deps) if manifest else ""
+    if manifest is not None and manifest.is_current(stats_path.name, fingerprint):
+        if summary is not None:
+            summary.add(unchanged=1)
+        return None
+
+    write_if_changed(stats_path, json.dumps(stats, indent=2), summary)
+    if manifest is not None:
+        manifest.record(stats_path.name, "stats", fingerprint, deps)
+        manifest.save()
+    return stats_path
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate the static website in _site/ from YAML data."
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for loading the catalog and rendering pages (default: one per CPU, 1 = serial)",
+    )
+    parser.add_argument(
+        "--revalidate",
+        action="store_true",
+        help="Re-run full validation instead of trusting stamped snapshot records",
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Rebuild every page instead of only those whose inputs changed",
+    )
+    parser.add_argument(
+        "--no-compress",
+        action="store_true",
+        help="Skip writing precompressed .gz/.br siblings of text outputs",
+    )
+    parser.add_argument(
+        "--search-index",
+        choices=SEARCH_INDEX_FORMATS,
+        default="sharded",
+        help="Search index format: compact with lazily loaded shards (default) "
+        "or a single indented search-index.json",
+    )
+    return parser.parse_args()
+
+
+def generate_site(
+    jobs: int | None = None,
+    trusted: bool = True,
+    full: bool = False,
+    compress: bool = True,
+    search_index_format: str = "sharded",
+):
+    """Generate complete static website
+
+    Only outputs whose templates, data files or derived values changed since
+    the last build are rendered again, unless full=True. With compress=True,
+    text outputs get precompressed .gz (and .br) siblings; otherwise siblings
+    of outputs rewritten since they were compressed are deleted.
+    """
+
+    print("=" * 60)
+    print("Ultimate Agent Directory - Website Generator")
+    print("=" * 60)
+
+    # Create output directory
+    output_dir = Path("_site")
+    output_dir.mkdir(exist_ok=True)
+
+    # Load AI agents and boilerplate data
+    print("\nLoading data...")
+    site_config = load_site_config()
+    snapshot = load_snapshot(jobs=jobs)
+    data = load_site_data(snapshot, site_config, trusted=trusted)
+    manifest = open_site_manifest(snapshot, output_dir, full=full)
+    writes = WriteSummary()
+
+    print(f"  Loaded {len(data.categories)} AI agent categories")
+    print(f"  Loaded {len(data.agents)} AI agents")
+    print(f"  Loaded {len(data.boilerplate_categories)} boilerplate categories")
+    print(f"  Loaded {len(data.boilerplates)} boilerplates")
+
+    # Generate pages
+    print("\nGenerating pages...")
+    rendered, unchanged = render_pages(
+        data, output_dir, manifest, summary=writes, jobs=jobs
+    )
+    print(f"  {rendered} page(s) rendered, {unchanged} unchanged")
+
+    # Generate search index (includes both agents and boilerplates)
+    print("\nGenerating search index...")
+    search_index = write_search_index(
+        data, output_dir, manifest, writes, search_index_format
+    )
+    if search_index is None:
+        print("  Search index unchanged")
+    else:
+        search_index_path, agent_count, boilerplate_count, shards = search_index
+        print(
+            f"  Generated {search_index_path} ({agent_count} agents + {boilerplate_count} boilerplates)"
+        )
+        if shards:
+            print(f"  Generated {shards} search shard file(s) in {output_dir / 'search'}")
+
+    # Copy static assets
+    print("\nSyncing static assets...")
+    static_writes = WriteSummary()
+    static_dst = copy_static_assets(output_dir, static_writes)
+    writes.add(static_writes.written, static_writes.unchanged, static_writes.deleted)
+    print(f"[OK] Synced static assets to {static_dst} ({static_writes})")
+
+    # Generate sitemap (includes both agents and boilerplates)
+    print("\nGenerating sitemap...")
+    sitemap_path = write_sitemap(data, output_dir, manifest, writes)
+    print(f"[OK] Generated {sitemap_path}" if sitemap_path else "  Sitemap unchanged")
+
+    # Generate stats file
+    stats_path = write_stats(data, output_dir, manifest, writes)
+    print(f"  Generated {stats_path}" if stats_path else "  Stats unchanged")
+
+    # Precompress text outputs for servers that serve .gz/.br files directly
+    if compress:
+        formats = "gzip + brotli" if BROTLI_AVAILABLE else "gzip"
+        print(f"\nPrecompressing outputs ({formats})...")
+        print(f"  {precompress_tree(output_dir, jobs=jobs)}")
+    else:
+        stale = prune_stale_siblings(output_dir)
+        if stale:
+            print(f"\nDeleted {stale} stale precompressed file(s)")
 
     # Summary
     print("\n" + "=" * 60)
     print("Website generation complete!")
     print("=" * 60)
     print(f"\nOutput directory: {output_dir.absolute()}")
+    print(f"Files: {writes}")
+    print(f"Template cache: {TEMPLATE_CACHE_STATS}")
     print(f"Homepage: {output_dir / 'index.html'}")
     print("\nAI Agents:")
-    print(f"  Categories: {len(categories)} pages")
-    print(f"  Entries: {len(agents)}")
+    print(f"  Categories: {len(data.categories)} pages")
+    print(f"  Entries: {len(data.agents)}")
     print("\nBoilerplates:")
-    print(f"  Categories: {len(boilerplate_categories)} pages")
-    print(f"  Entries: {len(boilerplates)}")
+    print(f"  Categories: {len(data.boilerplate_categories)} pages")
+    print(f"  Entries: {len(data.boilerplates)}")
     print("\nTo preview locally, run:")
     print(f"  cd {output_dir} && python -m http.server 8001")
     print("  Then visit: http://localhost:8001")
@@ -464,4 +936,11 @@ def generate_site():
 
 
 if __name__ == "__main__":
-    generate_site()
+    args = parse_args()
+    generate_site(
+        jobs=args.jobs,
+        trusted=not args.revalidate,
+        full=args.full,
+        compress=not args.no_compress,
+        search_index_format=args.search_index,
+    )
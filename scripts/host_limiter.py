@@ -0,0 +1,205 @@
+"""
+Per-host adaptive concurrency for check_links.py
+
+A fixed per-host connection cap is too slow for hosts like github.com and too
+aggressive for small sites that answer 429. HostLimiter keeps a concurrency
+limit per host and adjusts it AIMD-style, like TCP congestion control:
+
+- every fast 2xx response adds 1/limit (about +1 per round of requests)
+- a 429 or 503 response, or a timeout, halves the limit (once per round:
+  responses to requests sent before the last decrease do not count again)
+- a Retry-After header blocks new requests to the host until it expires
+
+Per-host request counts, throttling, limits and throughput are kept for the
+end-of-run report.
+
+Usage:
+    from host_limiter import HostLimiter
+
+    limiter = HostLimiter()
+    async with limiter.slot(url) as slot:
+        async with session.get(url) as response:
+            slot.record(response.status, response.headers.get("Retry-After"))
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Callable, Dict, List, Optional
+from urllib.parse import urlparse
+
+
+INITIAL_HOST_LIMIT = 4.0
+MIN_HOST_LIMIT = 1.0
+MAX_HOST_LIMIT = 32.0
+FAST_RESPONSE_SECONDS = 2.0  # Slower successes do not raise the limit
+MAX_RETRY_AFTER = 120.0  # Seconds; longer Retry-After values are capped
+THROTTLE_STATUSES = {429, 503}
+
+
+def parse_retry_after(
+    value: Optional[str], now: Optional[float] = None
+) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        return None
+    now = time.time() if now is None else now
+    return max(when.timestamp() - now, 0.0)
+
+
+def host_of(url: str) -> str:
+    return (urlparse(url).hostname or "").lower()
+
+
+@dataclass
+class HostState:
+    limit: float
+    peak_limit: float
+    in_flight: int = 0
+    blocked_until: float = 0.0
+    last_decrease: float = 0.0
+    requests: int = 0
+    throttled: int = 0
+    first_started: Optional[float] = None
+    last_finished: Optional[float] = None
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition)
+
+    def can_start(self, now: float) -> bool:
+        return now >= self.blocked_until and self.in_flight < int(self.limit)
+
+
+class HostSlot:
+    """One request's claim on its host's concurrency; see HostLimiter.slot()."""
+
+    def __init__(self, limiter: "HostLimiter", host: str):
+        self.limiter = limiter
+        self.host = host
+        self.status: Optional[int] = None
+        self.retry_after: Optional[float] = None
+        self.started = 0.0
+
+    def record(self, status: int, retry_after: Optional[str] = None) -> None:
+        """Note the response status (and Retry-After header) for feedback."""
+        self.status = status
+        self.retry_after = parse_retry_after(retry_after)
+
+    async def __aenter__(self) -> "HostSlot":
+        await self.limiter.acquire(self.host)
+        self.started = self.limiter.clock()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        timed_out = exc_type is not None and issubclass(exc_type, asyncio.TimeoutError)
+        await self.limiter.release(self, timed_out)
+
+
+class HostLimiter:
+    """AIMD concurrency limit per host."""
+
+    def __init__(
+        self,
+        initial: float = INITIAL_HOST_LIMIT,
+        minimum: float = MIN_HOST_LIMIT,
+        maximum: float = MAX_HOST_LIMIT,
+        fast_seconds: float = FAST_RESPONSE_SECONDS,
+        max_retry_after: float = MAX_RETRY_AFTER,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.initial = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.fast_seconds = fast_seconds
+        self.max_retry_after = max_retry_after
+        self.clock = clock
+        self.hosts: Dict[str, HostState] = {}
+
+    def state(self, host: str) -> HostState:
+        if host not in self.hosts:
+            self.hosts[host] = HostState(limit=self.initial, peak_limit=self.initial)
+        return self.hosts[host]
+
+    def has_capacity(self, host: str) -> bool:
+        """Whether a request to host could start right now."""
+        state = self.hosts.get(host)
+        return state is None or state.can_start(self.clock())
+
+    def slot(self, url: str) -> HostSlot:
+        return HostSlot(self, host_of(url))
+
+    async def acquire(self, host: str) -> None:
+        state = self.state(host)
+        async with state.condition:
+            while not state.can_start(self.clock()):
+                wait = state.blocked_until - self.clock()
+                try:
+                    await asyncio.wait_for(
+                        state.condition.wait(), wait if wait > 0 else None
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            state.in_flight += 1
+            state.requests += 1
+            if state.first_started is None:
+                state.first_started = self.clock()
+
+    async def release(self, slot: HostSlot, timed_out: bool = False) -> None:
+        state = self.state(slot.host)
+        now = self.clock()
+        async with state.condition:
+            state.in_flight -= 1
+            state.last_finished = now
+
+            if timed_out or slot.status in THROTTLE_STATUSES:
+                state.throttled += 1
+                # Responses to requests sent before the last decrease reflect
+                # the old limit, so each round of requests halves it only once
+                if slot.started >= state.last_decrease:
+                    state.limit = max(self.minimum, state.limit / 2)
+                    state.last_decrease = now
+                if slot.retry_after is not None:
+                    state.blocked_until = max(
+                        state.blocked_until,
+                        now + min(slot.retry_after, self.max_retry_after),
+                    )
+            elif (
+                slot.status is not None
+                and 200 <= slot.status < 300
+                and now - slot.started <= self.fast_seconds
+            ):
+                state.limit = min(self.maximum, state.limit + 1 / state.limit)
+                state.peak_limit = max(state.peak_limit, state.limit)
+
+            state.condition.notify_all()
+
+    def report(self) -> List[dict]:
+        """Per-host statistics, busiest hosts first."""
+        rows = []
+        for host, state in self.hosts.items():
+            elapsed = (
+                (state.last_finished or 0.0) - state.first_started
+                if state.first_started is not None
+                else 0.0
+            )
+            rows.append(
+                {
+                    "host": host,
+                    "requests": state.requests,
+                    "throttled": state.throttled,
+                    "final_limit": round(state.limit, 2),
+                    "peak_limit": round(state.peak_limit, 2),
+                    "requests_per_second": (
+                        round(state.requests / elapsed, 2) if elapsed > 0 else None
+                    ),
+                }
+            )
+        return sorted(rows, key=lambda row: (-row["requests"], row["host"]))
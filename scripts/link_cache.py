@@ -0,0 +1,186 @@
+"""
+Persistent result cache for check_links.py
+
+Stores the outcome of every checked URL in a SQLite database under
+.cache/links/, keyed by URL: the classified status, status code, error,
+final URL after redirects, check time and the response validators (ETag and
+Last-Modified). check_all_urls() reuses a cached result while it is younger
+than the TTL for its status, so a nightly run only re-requests links that are
+stale or were failing last time.
+
+Usage:
+    from link_cache import CacheTTLs, LinkCache
+
+    with LinkCache(path) as cache:
+        fresh = cache.fresh(urls, CacheTTLs())
+        ...
+        cache.store(CachedLink(url=url, status="success", ...))
+
+The caches of parallel --shard runs are combined with LinkCache.merge().
+"""
+
+import sqlite3
+import time
+from dataclasses import astuple, dataclass, fields
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+
+LINK_CACHE_VERSION = 1
+CACHE_DIRNAME = Path(".cache") / "links"
+LINK_CACHE_FILENAME = "link-results.sqlite3"
+COMMIT_EVERY = 50  # Results stored between commits
+
+HOUR = 3600
+
+
+@dataclass
+class CacheTTLs:
+    """How long a cached result is reused, in seconds, by status."""
+
+    success: float = 72 * HOUR
+    warning: float = 12 * HOUR
+    error: float = 1 * HOUR
+
+    def for_status(self, status: str) -> float:
+        return getattr(self, status, 0.0)
+
+
+@dataclass
+class CachedLink:
+    """Last known outcome of checking a URL."""
+
+    url: str
+    status: str  # 'success', 'error', 'warning'
+    status_code: Optional[int]
+    error_message: Optional[str]
+    final_url: Optional[str]
+    checked_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def is_fresh(self, ttls: CacheTTLs, now: float) -> bool:
+        return now - self.checked_at < ttls.for_status(self.status)
+
+
+COLUMNS = [f.name for f in fields(CachedLink)]
+
+
+def default_cache_path(project_root: Path) -> Path:
+    return project_root / CACHE_DIRNAME / LINK_CACHE_FILENAME
+
+
+class LinkCache:
+    """SQLite-backed table of CachedLink rows.
+
+    Used from a single thread (the link checker's event loop). Writes are
+    committed in batches and on close().
+    """
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.pending = 0
+        self._create_schema()
+
+    def _create_schema(self) -> None:
+        (version,) = self.connection.execute("PRAGMA user_version").fetchone()
+        if version != LINK_CACHE_VERSION:
+            # Results written by another format version are simply dropped.
+            self.connection.execute("DROP TABLE IF EXISTS links")
+            self.connection.execute(f"PRAGMA user_version = {LINK_CACHE_VERSION}")
+        self.connection.execute(
+            """
+            CREATE TABLE IF NOT EXISTS links (
+                url TEXT PRIMARY KEY,
+                status TEXT NOT NULL,
+                status_code INTEGER,
+                error_message TEXT,
+                final_url TEXT,
+                checked_at REAL NOT NULL,
+                etag TEXT,
+                last_modified TEXT
+            )
+            """
+        )
+        self.connection.commit()
+
+    def __enter__(self) -> "LinkCache":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def get(self, url: str) -> Optional[CachedLink]:
+        row = self.connection.execute(
+            f"SELECT {', '.join(COLUMNS)} FROM links WHERE url = ?", (url,)
+        ).fetchone()
+        return CachedLink(*row) if row else None
+
+    def lookup(self, urls: Iterable[str]) -> Dict[str, CachedLink]:
+        """Cached results for the given URLs, whatever their age."""
+        wanted = set(urls)
+        found: Dict[str, CachedLink] = {}
+        for row in self.connection.execute(f"SELECT {', '.join(COLUMNS)} FROM links"):
+            if row[0] in wanted:
+                found[row[0]] = CachedLink(*row)
+        return found
+
+    def fresh(
+        self, urls: Iterable[str], ttls: CacheTTLs, now: Optional[float] = None
+    ) -> Dict[str, CachedLink]:
+        """Cached results for the given URLs that are still within their TTL."""
+        now = time.time() if now is None else now
+        return {
+            url: cached
+            for url, cached in self.lookup(urls).items()
+            if cached.is_fresh(ttls, now)
+        }
+
+    def store(self, link: CachedLink) -> None:
+        self.connection.execute(
+            f"INSERT OR REPLACE INTO links ({', '.join(COLUMNS)}) "
+            f"VALUES ({', '.join('?' for _ in COLUMNS)})",
+            astuple(link),
+        )
+        self.pending += 1
+        if self.pending >= COMMIT_EVERY:
+            self.commit()
+
+    def merge(self, path: Path) -> int:
+        """
+        Take the results of another link cache file, e.g. of one --shard run.
+
+        A URL found in both keeps the more recently checked result. A file of
+        another format version is ignored. Returns the number of rows taken.
+        """
+        self.commit()
+        self.connection.execute("ATTACH DATABASE ? AS other", (str(path),))
+        try:
+            (version,) = self.connection.execute("PRAGMA other.user_version").fetchone()
+            has_links = self.connection.execute(
+                "SELECT 1 FROM other.sqlite_master "
+                "WHERE type = 'table' AND name = 'links'"
+            ).fetchone()
+            if version != LINK_CACHE_VERSION or not has_links:
+                return 0
+            columns = ", ".join(COLUMNS)
+            taken = self.connection.execute(
+                f"INSERT OR REPLACE INTO links ({columns}) "
+                f"SELECT {columns} FROM other.links AS theirs WHERE NOT EXISTS ("
+                "SELECT 1 FROM links AS ours WHERE ours.url = theirs.url "
+                "AND ours.checked_at >= theirs.checked_at)"
+            ).rowcount
+            self.connection.commit()
+            return taken
+        finally:
+            self.connection.execute("DETACH DATABASE other")
+
+    def commit(self) -> None:
+        self.connection.commit()
+        self.pending = 0
+
+    def close(self) -> None:
+        self.commit()
+        self.connection.close()
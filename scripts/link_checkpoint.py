@@ -0,0 +1,139 @@
+"""
+Resumable run checkpoint for check_links.py
+
+check_all_urls() appends one JSON line per URL to the checkpoint as soon as
+the URL's result is known (the result plus every file and field it was found
+in), flushing each line. A run killed part way, e.g. by a CI timeout, keeps
+everything it finished: `check_links.py --resume` skips the URLs already in
+the checkpoint, and the final report is built by streaming the file rather
+than from results held in memory. A line cut short by the kill is ignored
+and its URL is checked again.
+
+The first line is a header with the git revision the run checked and the
+time it started. A checkpoint restored from an older run (e.g. from a CI
+cache) is only resumed if it is for the same revision and younger than
+max_age; otherwise it is discarded and the run starts over.
+
+Usage:
+    from link_checkpoint import LinkCheckpoint
+
+    with LinkCheckpoint(path, resume=True, revision=sha, max_age=ttl) as checkpoint:
+        done = checkpoint.checked_urls()
+        checkpoint.append({"url": url, ...})
+        for record in checkpoint.records():
+            ...
+"""
+
+import json
+import time
+from pathlib import Path
+from typing import Iterator, Optional, Set
+
+from link_cache import CACHE_DIRNAME, HOUR
+
+
+CHECKPOINT_FILENAME = "checkpoint.jsonl"
+
+
+def default_checkpoint_path(project_root: Path) -> Path:
+    return project_root / CACHE_DIRNAME / CHECKPOINT_FILENAME
+
+
+class LinkCheckpoint:
+    """Append-only JSON Lines file of per-URL result records.
+
+    Args:
+        resume: Keep the records of an interrupted run instead of starting over
+        revision: Commit being checked; a checkpoint of another one is not resumed
+        max_age: Seconds after which a checkpoint is too old to resume
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        resume: bool = False,
+        revision: Optional[str] = None,
+        max_age: Optional[float] = None,
+    ):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self.revision = revision
+        self.discarded: Optional[str] = None  # Why an old checkpoint was dropped
+        if resume and path.exists() and path.stat().st_size > 0:
+            self._drop_partial_line()
+            self.discarded = self._stale_reason(max_age)
+            resume = self.discarded is None
+        else:
+            resume = False
+        # A new run starts from an empty checkpoint; a resumed one appends
+        self.file = open(path, "a" if resume else "w", encoding="utf-8")
+        if not resume:
+            self.append({"revision": revision, "created_at": time.time()})
+
+    def _header(self) -> Optional[dict]:
+        with open(self.path, "r", encoding="utf-8") as f:
+            try:
+                header = json.loads(f.readline())
+            except json.JSONDecodeError:
+                return None
+        if not isinstance(header, dict) or "created_at" not in header:
+            return None
+        return header
+
+    def _stale_reason(self, max_age: Optional[float]) -> Optional[str]:
+        """Why the existing checkpoint must not be resumed, if it must not."""
+        header = self._header()
+        if header is None:
+            return "it has no header"
+        revision = header.get("revision")
+        if self.revision and revision and revision != self.revision:
+            return f"it is for revision {revision[:12]}, not {self.revision[:12]}"
+        age = time.time() - header["created_at"]
+        if max_age is not None and age > max_age:
+            return f"it is {age / HOUR:.0f}h old (limit {max_age / HOUR:.0f}h)"
+        return None
+
+    def _drop_partial_line(self) -> None:
+        """Cut a line left unfinished by a killed run, so appends start clean."""
+        if not self.path.exists() or self.path.stat().st_size == 0:
+            return
+        with open(self.path, "r+b") as f:
+            f.seek(-1, 2)
+            if f.read(1) == b"\n":
+                return
+            f.seek(0)
+            f.truncate(f.read().rfind(b"\n") + 1)
+
+    def __enter__(self) -> "LinkCheckpoint":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def append(self, record: dict) -> None:
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+    def records(self) -> Iterator[dict]:
+        """Stream the complete result records written so far."""
+        if not self.file.closed:
+            self.file.flush()
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(record, dict) and "url" in record:  # Not the header
+                    yield record
+
+    def checked_urls(self) -> Set[str]:
+        return {record["url"] for record in self.records()}
+
+    def close(self) -> None:
+        self.file.close()
+
+    def remove(self) -> None:
+        """Close and delete the checkpoint once its run is complete."""
+        self.close()
+        self.path.unlink(missing_ok=True)
@@ -0,0 +1,111 @@
+"""
+Incremental link checking from a git revision for check_links.py
+
+`check_links.py --since REV` only requests the URLs that were added or
+changed since REV: files changed between the merge base of REV and HEAD and
+the working tree (plus untracked files) are extracted twice, at the merge
+base and as they are now, and only URLs that are new in a file count as
+changed. Every other URL is answered from the link cache.
+
+Usage:
+    from link_diff import changed_urls
+
+    changed = changed_urls(project_root, "origin/main", url_map, extract)
+"""
+
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+Extractor = Callable[[Path], List[Tuple[str, str]]]
+
+
+class GitDiffError(ValueError):
+    """Raised when the revision or the repository cannot be read with git."""
+
+
+def git(project_root: Path, *args: str) -> str:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=project_root,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except FileNotFoundError as e:
+        raise GitDiffError("git is not installed") from e
+    except subprocess.CalledProcessError as e:
+        raise GitDiffError(e.stderr.strip() or f"git {args[0]} failed") from e
+    return result.stdout
+
+
+def head_revision(project_root: Path) -> Optional[str]:
+    """Commit checked out in project_root, or None outside a git checkout."""
+    try:
+        return git(project_root, "rev-parse", "HEAD").strip()
+    except GitDiffError:
+        return None
+
+
+def merge_base(project_root: Path, rev: str) -> str:
+    """Commit where HEAD's history joined rev (rev itself if HEAD is ahead)."""
+    return git(project_root, "merge-base", rev, "HEAD").strip()
+
+
+def changed_paths(project_root: Path, base: str) -> List[str]:
+    """Paths added or modified since base, uncommitted and untracked included."""
+    diffed = git(project_root, "diff", "--name-only", "--diff-filter=d", base)
+    untracked = git(project_root, "ls-files", "--others", "--exclude-standard")
+    return sorted({path for path in (diffed + untracked).splitlines() if path})
+
+
+def urls_at(project_root: Path, base: str, path: str, extract: Extractor) -> Set[str]:
+    """URLs a file contained at base; empty if it did not exist there."""
+    try:
+        content = subprocess.run(
+            ["git", "show", f"{base}:{path}"],
+            cwd=project_root,
+            capture_output=True,
+            check=True,
+        ).stdout
+    except subprocess.CalledProcessError:
+        return set()  # Added (or renamed) since base
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep the repository path, whose suffix picks the extractor
+        old_file = Path(tmp) / path
+        old_file.parent.mkdir(parents=True, exist_ok=True)
+        old_file.write_bytes(content)
+        return {url for url, _ in extract(old_file)}
+
+
+def changed_urls(
+    project_root: Path,
+    rev: str,
+    url_map: Dict[str, List[Tuple[str, str]]],
+    extract: Extractor,
+) -> Tuple[Set[str], List[str]]:
+    """
+    URLs added or changed since rev, and the scanned files they came from.
+
+    Args:
+        url_map: URLs of the current tree by repository path, as returned by
+            collect_all_urls(); files it does not scan are ignored
+        extract: Extracts (url, context) pairs from a file of any scanned type
+
+    Raises:
+        GitDiffError: If rev cannot be resolved
+    """
+    base = merge_base(project_root, rev)
+    urls: Set[str] = set()
+    files = []
+    for path in changed_paths(project_root, base):
+        current = {url for url, _ in url_map.get(path, [])}
+        if not current:
+            continue
+        added = current - urls_at(project_root, base, path, extract)
+        if added:
+            urls |= added
+            files.append(path)
+    return urls, files
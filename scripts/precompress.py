@@ -0,0 +1,239 @@
+"""
+Precompressed .gz and .br siblings for text outputs in _site/
+
+CDNs and static servers configured for precompressed files (nginx
+gzip_static/brotli_static, Caddy precompressed, ...) serve page.html.gz or
+page.html.br directly instead of compressing on every request. Every text
+output of at least MIN_COMPRESS_SIZE bytes gets a gzip sibling, plus a brotli
+sibling when the optional brotli module is installed.
+
+Siblings carry the mtime of the file they were compressed from. Generators
+never rewrite unchanged outputs (see site_manifest.write_if_changed), so a
+sibling whose mtime matches its source is current and is not compressed again,
+provided the source size still matches the one recorded in the gzip trailer
+(filesystems with coarse timestamps can give a rewritten file its old mtime).
+Siblings whose source was removed or fell below the threshold are deleted.
+With compression off, prune_stale_siblings() deletes the siblings of outputs
+rewritten since they were compressed, so no stale .gz/.br is left to serve.
+
+Usage:
+    from precompress import precompress_tree
+
+    report = precompress_tree(Path("_site"), jobs=4)
+    print(report)
+"""
+
+import gzip
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+
+from catalog import CHUNKS_PER_WORKER, resolve_jobs
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    brotli = None
+    BROTLI_AVAILABLE = False
+
+
+TEXT_SUFFIXES = {".html", ".json", ".js", ".css", ".xml", ".svg", ".txt"}
+COMPRESSED_SUFFIXES = (".gz", ".br")
+MIN_COMPRESS_SIZE = 1024  # Smaller responses gain little and fit in one packet
+PARALLEL_THRESHOLD = 16  # Files; fewer are compressed in-process
+
+
+@dataclass
+class CompressResult:
+    path: str
+    size: int
+    gzip_size: int
+    brotli_size: int | None
+    compressed: bool  # False if the existing siblings were already current
+
+
+@dataclass
+class CompressionReport:
+    compressed: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    original_bytes: int = 0
+    gzip_bytes: int = 0
+    brotli_bytes: int = 0
+
+    def add(self, result: CompressResult) -> None:
+        if result.compressed:
+            self.compressed += 1
+        else:
+            self.unchanged += 1
+        self.original_bytes += result.size
+        self.gzip_bytes += result.gzip_size
+        self.brotli_bytes += result.brotli_size or 0
+
+    def __str__(self) -> str:
+        line = (
+            f"{self.compressed} compressed, {self.unchanged} unchanged, "
+            f"{self.deleted} deleted; {format_size(self.original_bytes)} -> "
+            f"{format_size(self.gzip_bytes)} gzip"
+        )
+        if self.brotli_bytes:
+            line += f", {format_size(self.brotli_bytes)} brotli"
+        return line
+
+
+def format_size(size: int) -> str:
+    if size < 1024:
+        return f"{size} B"
+    if size < 1024 * 1024:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1024 * 1024):.1f} MB"
+
+
+def sibling_suffixes() -> tuple[str, ...]:
+    """Compressed formats produced in this environment."""
+    return (".gz", ".br") if BROTLI_AVAILABLE else (".gz",)
+
+
+def is_compressible(path: Path, size: int, min_size: int = MIN_COMPRESS_SIZE) -> bool:
+    return path.suffix in TEXT_SUFFIXES and size >= min_size
+
+
+def write_sibling(target: Path, data: bytes, mtime_ns: int) -> None:
+    """Atomically write a compressed sibling stamped with its source's mtime."""
+    tmp = target.with_name(target.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, target)
+    os.utime(target, ns=(mtime_ns, mtime_ns))
+
+
+def gzip_source_size(path: Path) -> int:
+    """Uncompressed size (mod 2**32) recorded in the trailer of a gzip file."""
+    with open(path, "rb") as f:
+        f.seek(-4, os.SEEK_END)
+        return int.from_bytes(f.read(4), "little")
+
+
+def current_sibling_size(sibling: Path, source: os.stat_result) -> int | None:
+    """Size of sibling if it was compressed from source as it is now, else None."""
+    try:
+        sibling_stat = sibling.stat()
+    except OSError:
+        return None
+    if sibling_stat.st_mtime_ns != source.st_mtime_ns:
+        return None
+    if sibling.suffix == ".gz" and gzip_source_size(sibling) != source.st_size % 2**32:
+        return None
+    return sibling_stat.st_size
+
+
+def compress(data: bytes, suffix: str) -> bytes:
+    if suffix == ".br":
+        assert brotli is not None
+        return brotli.compress(data, quality=11)
+    # mtime=0 keeps the output byte-identical between builds
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def compress_file(path: str) -> CompressResult:
+    """Write missing or outdated siblings of one file; runs in workers."""
+    source = Path(path)
+    stat = source.stat()
+    siblings = {
+        suffix: source.with_name(source.name + suffix) for suffix in sibling_suffixes()
+    }
+
+    sizes: dict[str, int] = {}
+    for suffix, sibling in siblings.items():
+        size = current_sibling_size(sibling, stat)
+        if size is None:
+            break
+        sizes[suffix] = size
+
+    compressed = len(sizes) != len(siblings)
+    if compressed:
+        data = source.read_bytes()
+        for suffix, sibling in siblings.items():
+            packed = compress(data, suffix)
+            write_sibling(sibling, packed, stat.st_mtime_ns)
+            sizes[suffix] = len(packed)
+
+    return CompressResult(
+        path, stat.st_size, sizes[".gz"], sizes.get(".br"), compressed
+    )
+
+
+def compress_chunk(paths: list[str]) -> list[CompressResult]:
+    return [compress_file(path) for path in paths]
+
+
+def compress_files(paths: list[str], jobs: int | None = None) -> list[CompressResult]:
+    """Compress files in input order, fanning out over a process pool when worthwhile."""
+    workers = min(resolve_jobs(jobs), len(paths))
+    if workers <= 1 or len(paths) < PARALLEL_THRESHOLD:
+        return compress_chunk(paths)
+
+    chunk_size = math.ceil(len(paths) / (workers * CHUNKS_PER_WORKER))
+    chunks = [paths[i : i + chunk_size] for i in range(0, len(paths), chunk_size)]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(compress_chunk, chunks))
+    except (OSError, NotImplementedError, BrokenProcessPool):
+        return compress_chunk(paths)
+    return [result for chunk in results for result in chunk]
+
+
+def precompress_tree(
+    output_dir: Path, jobs: int | None = None, min_size: int = MIN_COMPRESS_SIZE
+) -> CompressionReport:
+    """Bring the compressed siblings of every text output in output_dir up to date."""
+    report = CompressionReport()
+    sources: list[str] = []
+    existing: list[Path] = []
+
+    for dirpath, _, filenames in os.walk(output_dir):
+        for filename in sorted(filenames):
+            path = Path(dirpath) / filename
+            if path.suffix in COMPRESSED_SUFFIXES:
+                existing.append(path)
+            elif is_compressible(path, path.stat().st_size, min_size):
+                sources.append(str(path))
+
+    wanted = {
+        source + suffix for source in sources for suffix in sibling_suffixes()
+    }
+    for sibling in existing:
+        if str(sibling) not in wanted:
+            sibling.unlink()
+            report.deleted += 1
+
+    for result in compress_files(sources, jobs):
+        report.add(result)
+    return report
+
+
+def prune_stale_siblings(output_dir: Path) -> int:
+    """
+    Delete compressed siblings that no longer match their source.
+
+    Used when compression is off: a page rewritten by this build must not
+    keep serving its old .gz/.br file. Returns the number of files deleted.
+    """
+    deleted = 0
+    for dirpath, _, filenames in os.walk(output_dir):
+        for filename in filenames:
+            sibling = Path(dirpath) / filename
+            if sibling.suffix not in COMPRESSED_SUFFIXES:
+                continue
+            try:
+                source = sibling.with_suffix("").stat()
+            except OSError:
+                source = None
+            if source is None or current_sibling_size(sibling, source) is None:
+                sibling.unlink()
+                deleted += 1
+    return deleted
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+Query the catalog search index from Python
+
+Loads the compiled search index (the search/ shards written by
+generate_site.py, or a single search-index.json) into in-memory inverted
+indexes and ranks results exactly like performSearch() in static/js/search.js:
+the query is split on whitespace, the inverted indexes narrow down the
+candidate entries, and each token is matched against the fields as a
+substring, scored per field with SEARCH_WEIGHTS. Every token must match.
+
+Usage:
+    python scripts/search_engine.py "code review"
+    python scripts/search_engine.py --catalog "rag framework"   # Straight from data/
+    python scripts/search_engine.py --batch queries.txt > results.jsonl
+    python scripts/search_engine.py --batch - --limit 3 < queries.txt
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import time
+from dataclasses import dataclass
+from itertools import accumulate
+from pathlib import Path
+from typing import TextIO
+
+from search_index import (
+    MIN_TERM_LENGTH,
+    SEARCH_DIRNAME,
+    SEARCH_INDEX_FILENAME,
+    SEARCH_WEIGHTS,
+    WORD_SEPARATOR,
+    core_terms,
+    split_terms,
+)
+
+
+DEFAULT_LIMIT = 10  # search.js shows the top 10
+
+
+@dataclass
+class SearchResult:
+    entry: dict
+    score: int
+
+    def to_dict(self) -> dict:
+        return {"name": self.entry["name"], "url": self.entry["url"], "score": self.score}
+
+
+def decode_postings(encoded: list[int]) -> list[int]:
+    """Undo search_index.delta_encode()."""
+    return list(accumulate(encoded))
+
+
+def tokenize_query(query: str) -> list[str]:
+    """Whitespace-separated lowercase tokens, as tokenizeQuery() splits them."""
+    return [token for token in query.lower().split() if len(token) >= MIN_TERM_LENGTH]
+
+
+def longest_run(token: str) -> str:
+    """Longest [a-z0-9] run of a token; a field containing the token has an
+    indexed word containing it."""
+    return max(WORD_SEPARATOR.split(token), key=len)
+
+
+class SearchEngine:
+    """In-memory inverted indexes over the search entries.
+
+    core maps a word to the entries whose name, tags, category or type contain
+    it; description maps a word to the entries whose description contains it.
+    """
+
+    def __init__(
+        self,
+        entries: list[dict],
+        core: dict[str, list[int]],
+        description: dict[str, list[int]],
+        weights: dict = SEARCH_WEIGHTS,
+    ):
+        self.entries = entries
+        self.core = core
+        self.description = description
+        self.weights = weights
+        self.core_terms = sorted(core)
+        self.description_terms = sorted(description)
+        self._candidates: dict[str, set[int] | None] = {}
+
+    @classmethod
+    def from_entries(cls, entries: list[dict]) -> "SearchEngine":
+        """Index full entries (the search-index.json format)."""
+        core: dict[str, list[int]] = {}
+        description: dict[str, list[int]] = {}
+        for number, entry in enumerate(entries):
+            for term in core_terms(entry):
+                core.setdefault(term, []).append(number)
+            for term in dict.fromkeys(split_terms(entry.get("description"))):
+                description.setdefault(term, []).append(number)
+        return cls(entries, core, description)
+
+    @classmethod
+    def from_shards(cls, output_dir: Path) -> "SearchEngine":
+        """Load the search/ shards, checking each against its manifest hash."""
+        shard_dir = output_dir / SEARCH_DIRNAME
+
+        def read_shard(meta: dict) -> dict:
+            content = (shard_dir / meta["file"]).read_bytes()
+            if hashlib.sha256(content).hexdigest() != meta["sha256"]:
+                raise ValueError(f"{meta['file']} does not match its manifest hash")
+            return json.loads(content)
+
+        manifest = json.loads((shard_dir / "manifest.json").read_text(encoding="utf-8"))
+        core_shard = read_shard(manifest["core"])
+        titles = core_shard["category_titles"]
+        entries = [
+            {
+                **entry,
+                "category_title": titles[
+                    "boilerplate" if entry.get("is_boilerplate") else "agent"
+                ][entry["category"]],
+                "description": "",
+            }
+            for entry in core_shard["entries"]
+        ]
+        core = {
+            term: decode_postings(encoded) for term, encoded in core_shard["terms"].items()
+        }
+
+        description: dict[str, list[int]] = {}
+        for meta in manifest["details"]:
+            details = read_shard(meta)
+            for offset, text in enumerate(details["descriptions"]):
+                entries[details["start"] + offset]["description"] = text
+            for term, encoded in details["terms"].items():
+                description.setdefault(term, []).extend(decode_postings(encoded))
+
+        return cls(entries, core, description, core_shard["weights"])
+
+    @classmethod
+    def from_site(cls, output_dir: Path = Path("_site")) -> "SearchEngine":
+        """Load a generated site's index: shards if present, else search-index.json."""
+        if (output_dir / SEARCH_DIRNAME / "manifest.json").exists():
+            return cls.from_shards(output_dir)
+        index_path = output_dir / SEARCH_INDEX_FILENAME
+        return cls.from_entries(json.loads(index_path.read_text(encoding="utf-8")))
+
+    @classmethod
+    def from_catalog(cls, data_dir: Path | None = None) -> "SearchEngine":
+        """Index the catalog directly, without generating the site."""
+        from catalog import DEFAULT_DATA_DIR, load_snapshot
+        from config import load_site_config
+        from generate_site import (
+            create_boilerplate_search_index,
+            create_search_index,
+            load_site_data,
+        )
+
+        data = load_site_data(load_snapshot(data_dir or DEFAULT_DATA_DIR), load_site_config())
+        return cls.from_entries(
+            create_search_index(data.agents, data.categories)
+            + create_boilerplate_search_index(
+                data.boilerplates, data.boilerplate_categories
+            )
+        )
+
+    def candidates(self, token: str) -> set[int] | None:
+        """Entries with an indexed word containing the token's longest run,
+        the only ones that can contain the token; None if the run is too short
+        to be indexed and every entry has to be checked."""
+        if token in self._candidates:
+            return self._candidates[token]
+        run = longest_run(token)
+        found: set[int] | None = None
+        if len(run) >= MIN_TERM_LENGTH:
+            found = set()
+            for index, terms in (
+                (self.core, self.core_terms),
+                (self.description, self.description_terms),
+            ):
+                for term in terms:
+                    if run in term:
+                        found.update(index[term])
+        self._candidates[token] = found
+        return found
+
+    def score_token(self, entry: dict, token: str) -> int:
+        """Score of one query token in an entry's fields, 0 if it matches none."""
+        weights = self.weights
+        name = entry["name"].lower()
+        tags = [tag.lower() for tag in entry.get("tags") or []]
+        score = 0
+
+        if name == token:
+            score += weights["name"][0]
+        elif name.startswith(token):
+            score += weights["name"][1]
+        elif token in name:
+            score += weights["name"][2]
+
+        if token in (entry.get("description") or "").lower():
+            score += weights["description"]
+
+        if token in tags:
+            score += weights["tags"][0]
+        elif any(tag.startswith(token) for tag in tags):
+            score += weights["tags"][1]
+        elif any(token in tag for tag in tags):
+            score += weights["tags"][2]
+
+        if token in (entry.get("category") or "").lower():
+            score += weights["category"]
+        if token in (entry.get("type") or "").lower():
+            score += weights["type"]
+        return score
+
+    def search(self, query: str, limit: int = DEFAULT_LIMIT) -> list[SearchResult]:
+        """Rank entries matching every token of query, best first."""
+        if not query or len(query.strip()) < 2:
+            return []
+        tokens = tokenize_query(query)
+        if not tokens:
+            return []
+
+        candidates: set[int] | None = None  # None: every entry
+        for token in tokens:
+            found = self.candidates(token)
+            if found is not None:
+                candidates = found if candidates is None else candidates & found
+            if candidates is not None and not candidates:
+                return []
+        numbers = range(len(self.entries)) if candidates is None else sorted(candidates)
+
+        search_term = query.lower().strip()
+        ranked: list[tuple[int, int]] = []
+        for number in numbers:
+            entry = self.entries[number]
+            scores = [self.score_token(entry, token) for token in tokens]
+            if not all(scores):
+                continue
+            score = sum(scores)
+            if entry["name"].lower() == search_term:
+                score += self.weights["name_query"]
+            ranked.append((number, score))
+
+        ranked.sort(key=lambda item: (-item[1], item[0]))
+        return [SearchResult(self.entries[number], score) for number, score in ranked[:limit]]
+
+
+def run_batch(engine: SearchEngine, queries: TextIO, out: TextIO, limit: int) -> int:
+    """Answer one query per line as JSON lines; returns the number of queries."""
+    count = 0
+    for line in queries:
+        query = line.rstrip("\n")
+        results = [result.to_dict() for result in engine.search(query, limit)]
+        out.write(json.dumps({"query": query, "results": results}) + "\n")
+        count += 1
+    return count
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Search the catalog with the same ranking as the website."
+    )
+    parser.add_argument("query", nargs="?", help="Query to run")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        help="Run one query per line of FILE ('-' for stdin), printing JSON lines",
+    )
+    parser.add_argument(
+        "--site",
+        type=Path,
+        default=Path("_site"),
+        help="Generated site to load the index from (default: _site)",
+    )
+    parser.add_argument(
+        "--catalog",
+        action="store_true",
+        help="Index data/ directly instead of a generated site",
+    )
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=DEFAULT_LIMIT,
+        help=f"Results per query (default: {DEFAULT_LIMIT})",
+    )
+    args = parser.parse_args()
+    if (args.query is None) == (args.batch is None):
+        parser.error("give either a query or --batch FILE")
+    return args
+
+
+def main() -> None:
+    args = parse_args()
+    try:
+        engine = (
+            SearchEngine.from_catalog() if args.catalog else SearchEngine.from_site(args.site)
+        )
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Error: could not load search index: {e}", file=sys.stderr)
+        print("Run 'make site' first or use --catalog", file=sys.stderr)
+        sys.exit(1)
+
+    if args.batch is not None:
+        start = time.perf_counter()
+        if args.batch == "-":
+            count = run_batch(engine, sys.stdin, sys.stdout, args.limit)
+        else:
+            with open(args.batch, "r", encoding="utf-8") as f:
+                count = run_batch(engine, f, sys.stdout, args.limit)
+        seconds = time.perf_counter() - start
+        rate = count / seconds if seconds else 0.0
+        print(f"{count} queries in {seconds:.2f}s ({rate:,.0f}/s)", file=sys.stderr)
+        return
+
+    results = engine.search(args.query, args.limit)
+    if not results:
+        print(f'No results for "{args.query}"')
+        return
+    for rank, result in enumerate(results, 1):
+        entry = result.entry
+        kind = "boilerplate" if entry.get("is_boilerplate") else "agent"
+        print(f"{rank:>2}. {entry['name']}  [{result.score}]")
+        print(f"    {entry['category_title']} ({kind}) - {entry['url']}")
+
+
+if __name__ == "__main__":
+    main()
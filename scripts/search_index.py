@@ -0,0 +1,186 @@
+"""
+Sharded client-side search index
+
+search-index.json holds every field of every agent and boilerplate, so the
+homepage search could not answer anything until all of it was downloaded.
+The sharded format splits the entries into:
+
+    search/manifest.json            shard list with sha256 hashes (tiny)
+    search/core.<hash>.json         names, tags, categories and links,
+                                    loaded before the first search
+    search/details-<n>.<hash>.json  descriptions, fetched in the background
+
+Shard filenames embed a prefix of their content hash, so browsers and CDNs can
+cache them indefinitely; only the manifest changes between builds. Entry i of
+the core shard is entry i of the combined index; a details shard covers the
+entries [start, start + count). Category titles are looked up in the core
+shard's category_titles by kind ("agent" or "boilerplate") and category id.
+
+Both kinds of shard also carry an inverted index, so search.js scores only
+candidate entries instead of scanning the whole catalog. Terms are the
+lowercase [a-z0-9] words of each field (two characters or more). The index
+only finds candidates: a field that contains a query token as a substring has
+a word containing the token's longest [a-z0-9] run, so the entries of the
+terms containing that run are the only ones that can match. Whether and how
+well they match is still decided on the fields themselves.
+- core "terms": {term: [entry, ...]} for the name, tags, category and type
+- details "terms": {term: [entry, ...]} for the descriptions in that shard
+Entry numbers in each posting list are delta-encoded (each number is the
+difference from the previous one). SEARCH_WEIGHTS is published in the core
+shard.
+
+Usage:
+    from search_index import build_search_files
+
+    files = build_search_files(entries)  # {relative path: content}
+"""
+
+import hashlib
+import json
+import re
+
+
+SEARCH_INDEX_FORMATS = ("sharded", "full")
+SEARCH_INDEX_FILENAME = "search-index.json"
+SEARCH_DIRNAME = "search"
+SEARCH_MANIFEST_VERSION = 3
+DETAILS_SHARD_SIZE = 200  # Entries per description shard
+
+# Fields search.js needs to match and display a result without descriptions.
+# Category titles are stored once per category rather than per entry.
+CORE_FIELDS = (
+    "name",
+    "url",
+    "category",
+    "type",
+    "tags",
+    "github_stars",
+    "is_boilerplate",
+)
+
+
+MIN_TERM_LENGTH = 2  # Shorter query tokens are ignored
+WORD_SEPARATOR = re.compile(r"[^a-z0-9]+")
+
+# Score of one query token per field; a field scores its best tier only.
+# name/tags tiers: [field equals token, field starts with token, field contains
+# token]. name_query is added when the whole query is the name.
+SEARCH_WEIGHTS = {
+    "name": [90, 60, 40],
+    "tags": [30, 15, 10],
+    "description": 20,
+    "category": 10,
+    "type": 10,
+    "name_query": 50,
+}
+
+
+def dumps_compact(value) -> str:
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def core_entry(entry: dict) -> dict:
+    """Core fields of an entry, leaving out empty ones (search.js treats
+    missing and empty alike)."""
+    return {
+        field: entry[field]
+        for field in CORE_FIELDS
+        if entry.get(field) not in (None, "", [], False)
+    }
+
+
+def split_terms(text: str | None) -> list[str]:
+    """Lowercase [a-z0-9] words of text, in order."""
+    return [
+        word
+        for word in WORD_SEPARATOR.split((text or "").lower())
+        if len(word) >= MIN_TERM_LENGTH
+    ]
+
+
+def core_terms(entry: dict) -> list[str]:
+    """Distinct terms of an entry's name, tags, category and type."""
+    fields = [entry["name"], *(entry.get("tags") or [])]
+    fields += [entry.get("category"), entry.get("type")]
+    return list(dict.fromkeys(term for field in fields for term in split_terms(field)))
+
+
+def delta_encode(entries: list[int]) -> list[int]:
+    """Sorted entry numbers as differences from the previous one."""
+    return [entry - previous for previous, entry in zip([0, *entries], entries)]
+
+
+def build_core_terms(entries: list[dict]) -> dict[str, list[int]]:
+    postings: dict[str, list[int]] = {}
+    for number, entry in enumerate(entries):
+        for term in core_terms(entry):
+            postings.setdefault(term, []).append(number)
+    return {term: delta_encode(postings[term]) for term in sorted(postings)}
+
+
+def build_description_terms(entries: list[dict], start: int) -> dict[str, list[int]]:
+    postings: dict[str, list[int]] = {}
+    for number, entry in enumerate(entries, start):
+        for term in dict.fromkeys(split_terms(entry["description"])):
+            postings.setdefault(term, []).append(number)
+    return {term: delta_encode(postings[term]) for term in sorted(postings)}
+
+
+def shard(stem: str, payload: dict) -> tuple[str, str, dict]:
+    """Serialize a shard; returns (filename, content, manifest entry)."""
+    content = dumps_compact(payload)
+    encoded = content.encode("utf-8")
+    digest = hashlib.sha256(encoded).hexdigest()
+    filename = f"{stem}.{digest[:12]}.json"
+    return filename, content, {"file": filename, "sha256": digest, "bytes": len(encoded)}
+
+
+def build_search_files(
+    entries: list[dict], shard_size: int = DETAILS_SHARD_SIZE
+) -> dict[str, str]:
+    """Build the manifest and every shard for the combined search entries.
+
+    Returns:
+        {path relative to the output directory: file content}
+    """
+    files: dict[str, str] = {}
+
+    category_titles: dict[str, dict[str, str]] = {"agent": {}, "boilerplate": {}}
+    for entry in entries:
+        kind = "boilerplate" if entry.get("is_boilerplate") else "agent"
+        category_titles[kind][entry["category"]] = entry["category_title"]
+
+    filename, content, core = shard(
+        "core",
+        {
+            "category_titles": category_titles,
+            "weights": SEARCH_WEIGHTS,
+            "entries": [core_entry(entry) for entry in entries],
+            "terms": build_core_terms(entries),
+        },
+    )
+    files[f"{SEARCH_DIRNAME}/{filename}"] = content
+
+    details = []
+    for number, start in enumerate(range(0, len(entries), shard_size)):
+        chunk = entries[start : start + shard_size]
+        filename, content, detail = shard(
+            f"details-{number}",
+            {
+                "start": start,
+                "descriptions": [entry["description"] for entry in chunk],
+                "terms": build_description_terms(chunk, start),
+            },
+        )
+        files[f"{SEARCH_DIRNAME}/{filename}"] = content
+        details.append({**detail, "start": start, "count": len(chunk)})
+
+    files[f"{SEARCH_DIRNAME}/manifest.json"] = dumps_compact(
+        {
+            "version": SEARCH_MANIFEST_VERSION,
+            "entries": len(entries),
+            "core": core,
+            "details": details,
+        }
+    )
+    return files
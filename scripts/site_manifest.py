@@ -0,0 +1,361 @@
+"""
+Output dependency manifest and change-aware writes for incremental site builds
+
+Records, for every generated file in _site/, the templates, catalog files and
+derived values it was built from, plus a fingerprint over all of them. On the
+next build an output whose fingerprint is unchanged (and which still exists)
+does not need to be rendered again.
+
+Outputs that are rendered are written only if their content differs from the
+file on disk, and static assets are synced file by file, so unchanged files
+keep their mtime and rsync/CDN diffs only see real changes. WriteSummary
+counts written, unchanged and deleted files.
+
+Usage:
+    from site_manifest import OutputDeps, SiteManifest
+
+    manifest = SiteManifest.load(path, output_dir, build_key)
+    deps = OutputDeps(templates=["category.html.jinja2"], records=records)
+    fingerprint = manifest.fingerprint(deps)
+    if not manifest.is_current("categories/x.html", fingerprint):
+        ...  # render and write
+        manifest.record("categories/x.html", "pages", fingerprint, deps)
+    manifest.save()
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from jinja2 import Environment, FileSystemLoader, meta
+
+from catalog import CatalogRecord, write_json_atomic
+from precompress import COMPRESSED_SUFFIXES
+
+
+SITE_MANIFEST_VERSION = 1
+SITE_MANIFEST_FILENAME = "site-manifest.json"
+DEFAULT_TEMPLATE_DIR = Path("templates")
+
+
+@dataclass
+class WriteSummary:
+    """Counts of output files written, left untouched and deleted."""
+
+    written: int = 0
+    unchanged: int = 0
+    deleted: int = 0
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def add(self, written: int = 0, unchanged: int = 0, deleted: int = 0) -> None:
+        with self._lock:
+            self.written += written
+            self.unchanged += unchanged
+            self.deleted += deleted
+
+    def __str__(self) -> str:
+        return (
+            f"{self.written} written, {self.unchanged} unchanged, "
+            f"{self.deleted} deleted"
+        )
+
+
+def file_digest(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def write_if_changed(
+    path: Path, content: str, summary: WriteSummary | None = None
+) -> bool:
+    """Write UTF-8 content unless the file already holds exactly that content.
+
+    Returns:
+        True if the file was written
+    """
+    data = content.encode("utf-8")
+    try:
+        unchanged = path.stat().st_size == len(data) and (
+            file_digest(path) == hashlib.sha256(data).hexdigest()
+        )
+    except OSError:
+        unchanged = False
+
+    if unchanged:
+        if summary is not None:
+            summary.add(unchanged=1)
+        return False
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    if summary is not None:
+        summary.add(written=1)
+    return True
+
+
+def same_file(source: Path, target: Path) -> bool:
+    """Quick size + mtime check (as rsync does), then a content hash."""
+    try:
+        source_stat = source.stat()
+        target_stat = target.stat()
+    except OSError:
+        return False
+    if source_stat.st_size != target_stat.st_size:
+        return False
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+        return True
+    return file_digest(source) == file_digest(target)
+
+
+def remove_empty_dirs(root: Path, start: Path) -> None:
+    """Remove start and its parents up to (not including) root while empty."""
+    current = start
+    while current != root and current.is_dir() and not any(current.iterdir()):
+        current.rmdir()
+        current = current.parent
+
+
+def sync_tree(source: Path, target: Path, summary: WriteSummary | None = None) -> None:
+    """Make target mirror source, copying only new or modified files and
+    deleting only files that no longer exist in source.
+
+    Precompressed siblings (app.js.gz) of files that still exist are kept.
+    """
+    summary = summary if summary is not None else WriteSummary()
+    wanted: set[Path] = set()
+
+    for dirpath, _, filenames in os.walk(source):
+        for filename in sorted(filenames):
+            source_file = Path(dirpath) / filename
+            relative = source_file.relative_to(source)
+            wanted.add(relative)
+            target_file = target / relative
+            if same_file(source_file, target_file):
+                summary.add(unchanged=1)
+                continue
+            target_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(source_file, target_file)
+            summary.add(written=1)
+
+    summary.add(deleted=prune_tree(target, wanted))
+
+
+def prune_tree(root: Path, keep: set[Path]) -> int:
+    """Delete files under root whose relative path is not in keep, then any
+    directories left empty. Precompressed siblings of kept files are kept.
+
+    Returns:
+        Number of files deleted
+    """
+    if not root.exists():
+        return 0
+    deleted = 0
+    for dirpath, _, filenames in os.walk(root, topdown=False):
+        for filename in filenames:
+            path = Path(dirpath) / filename
+            relative = path.relative_to(root)
+            if relative.suffix in COMPRESSED_SUFFIXES:
+                relative = relative.with_suffix("")
+            if relative not in keep:
+                path.unlink()
+                deleted += 1
+        remove_empty_dirs(root.parent, Path(dirpath))
+    return deleted
+
+
+@dataclass
+class OutputDeps:
+    """Inputs one output file is built from."""
+
+    templates: list[str] = field(default_factory=list)  # Entry templates
+    records: list[CatalogRecord] = field(default_factory=list)  # Catalog files read
+    values: dict = field(default_factory=dict)  # JSON-serializable derived inputs
+
+
+class SiteManifest:
+    """Fingerprints and recorded inputs of every output in an output directory.
+
+    Safe to share between threads (build.py writes pages, the search index,
+    sitemap and stats from concurrent stages).
+    """
+
+    def __init__(
+        self,
+        path: Path | None,
+        output_dir: Path,
+        build_key: str,
+        full: bool = False,
+        template_dir: Path = DEFAULT_TEMPLATE_DIR,
+        outputs: dict[str, dict] | None = None,
+    ):
+        self.path = path
+        self.output_dir = output_dir
+        self.build_key = build_key
+        self.full = full
+        self.template_dir = template_dir
+        self.outputs: dict[str, dict] = outputs or {}
+        self._env = Environment(loader=FileSystemLoader(str(template_dir)))
+        self._template_hashes: dict[str, str] = {}
+        self._template_closures: dict[str, list[str]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        output_dir: Path,
+        build_key: str,
+        full: bool = False,
+        template_dir: Path = DEFAULT_TEMPLATE_DIR,
+    ) -> "SiteManifest":
+        """Load a manifest, starting empty if it is missing, stale or unreadable.
+
+        The manifest is discarded when it was written for another output
+        directory or by a different build_key (generator code or schema).
+        """
+        outputs: dict[str, dict] = {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            payload = None
+
+        if (
+            isinstance(payload, dict)
+            and payload.get("version") == SITE_MANIFEST_VERSION
+            and payload.get("build_key") == build_key
+            and payload.get("output_dir") == output_dir.as_posix()
+            and isinstance(payload.get("outputs"), dict)
+        ):
+            outputs = payload["outputs"]
+
+        return cls(path, output_dir, build_key, full, template_dir, outputs)
+
+    def template_closure(self, name: str) -> list[str]:
+        """A template plus everything it extends, includes or imports."""
+        with self._lock:
+            cached = self._template_closures.get(name)
+        if cached is not None:
+            return cached
+
+        seen: list[str] = []
+        todo = [name]
+        while todo:
+            current = todo.pop()
+            if current in seen:
+                continue
+            seen.append(current)
+            source, _, _ = self._env.loader.get_source(self._env, current)  # type: ignore[union-attr]
+            for referenced in meta.find_referenced_templates(self._env.parse(source)):
+                if referenced is not None:
+                    todo.append(referenced)
+
+        closure = sorted(seen)
+        with self._lock:
+            self._template_closures[name] = closure
+        return closure
+
+    def template_hash(self, name: str) -> str:
+        with self._lock:
+            cached = self._template_hashes.get(name)
+        if cached is not None:
+            return cached
+        digest = hashlib.sha256((self.template_dir / name).read_bytes()).hexdigest()
+        with self._lock:
+            self._template_hashes[name] = digest
+        return digest
+
+    def inputs(self, deps: OutputDeps) -> list[str]:
+        """Repository-relative paths of the files an output depends on."""
+        templates = {
+            (self.template_dir / name).as_posix()
+            for entry in deps.templates
+            for name in self.template_closure(entry)
+        }
+        records = {f"data/{record.path}" for record in deps.records}
+        return sorted(templates) + sorted(records)
+
+    def fingerprint(self, deps: OutputDeps) -> str:
+        templates = {
+            name: self.template_hash(name)
+            for entry in deps.templates
+            for name in self.template_closure(entry)
+        }
+        payload = {
+            "templates": templates,
+            "records": {record.path: record.sha256 for record in deps.records},
+            "values": deps.values,
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def is_current(self, output: str, fingerprint: str) -> bool:
+        """True if the output exists and was built from the same inputs."""
+        if self.full:
+            return False
+        with self._lock:
+            entry = self.outputs.get(output)
+        return (
+            entry is not None
+            and entry.get("fingerprint") == fingerprint
+            and (self.output_dir / output).exists()
+        )
+
+    def record(
+        self, output: str, group: str, fingerprint: str, deps: OutputDeps
+    ) -> None:
+        entry = {
+            "group": group,
+            "fingerprint": fingerprint,
+            "inputs": self.inputs(deps),
+        }
+        with self._lock:
+            self.outputs[output] = entry
+
+    def group_outputs(self, group: str) -> list[str]:
+        with self._lock:
+            return sorted(
+                output
+                for output, entry in self.outputs.items()
+                if entry.get("group") == group
+            )
+
+    def remove_stale(self, group: str, keep: set[str]) -> list[str]:
+        """Delete outputs of a group that this build no longer produces."""
+        with self._lock:
+            stale = sorted(
+                output
+                for output, entry in self.outputs.items()
+                if entry.get("group") == group and output not in keep
+            )
+            for output in stale:
+                del self.outputs[output]
+
+        for output in stale:
+            target = self.output_dir / output
+            target.unlink(missing_ok=True)
+            for suffix in COMPRESSED_SUFFIXES:
+                target.with_name(target.name + suffix).unlink(missing_ok=True)
+            # Drop directories left empty (e.g. a removed boilerplate category)
+            remove_empty_dirs(self.output_dir, target.parent)
+        return stale
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        with self._lock:
+            payload = {
+                "version": SITE_MANIFEST_VERSION,
+                "build_key": self.build_key,
+                "output_dir": self.output_dir.as_posix(),
+                "outputs": dict(sorted(self.outputs.items())),
+            }
+            try:
+                write_json_atomic(self.path, payload)
+            except OSError:
+                pass  # The next build is simply a full one
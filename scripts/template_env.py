@@ -0,0 +1,158 @@
+"""
+Shared Jinja2 environment factory with a persistent bytecode cache
+
+Every generator renders templates from templates/ with the same options.
+Compiling a template to Python code is the expensive part of loading it, so
+compiled bytecode is kept in .cache/jinja/ and reused by later runs (and by
+page rendering workers) as long as the template source is unchanged.
+
+Cache entries are keyed on the template name, a checksum of its source and
+the environment options that affect compilation, so an edited template - or
+one compiled with different whitespace options - never reuses stale code.
+
+Usage:
+    from template_env import TEMPLATE_CACHE_STATS, create_environment
+
+    env = create_environment(filters={"slugify": slugify})
+    env.get_template("readme.jinja2").render(...)
+    print(f"Template cache: {TEMPLATE_CACHE_STATS}")
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Callable
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader
+from jinja2.bccache import Bucket
+
+
+TEMPLATE_DIR = Path("templates")
+BYTECODE_CACHE_DIR = Path(".cache") / "jinja"
+
+
+class CacheStats:
+    """Bytecode cache hits and misses; safe to share between threads."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def add(self, hits: int = 0, misses: int = 0) -> None:
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+
+    def drain(self) -> tuple[int, int]:
+        """Return (hits, misses) counted so far and reset them (for workers)."""
+        with self._lock:
+            counts = (self.hits, self.misses)
+            self.hits = self.misses = 0
+        return counts
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __str__(self) -> str:
+        if not self.lookups:
+            return "no templates compiled"
+        return (
+            f"{self.hits}/{self.lookups} templates loaded from bytecode cache "
+            f"({self.hit_rate:.0%} hit rate)"
+        )
+
+
+# Process-wide counters reported by the generators
+TEMPLATE_CACHE_STATS = CacheStats()
+
+
+def compile_options(environment: Environment) -> str:
+    """Environment settings that change the code a template compiles to."""
+    options = {
+        "syntax": [
+            environment.block_start_string,
+            environment.block_end_string,
+            environment.variable_start_string,
+            environment.variable_end_string,
+            environment.comment_start_string,
+            environment.comment_end_string,
+            environment.line_statement_prefix,
+            environment.line_comment_prefix,
+        ],
+        "trim_blocks": environment.trim_blocks,
+        "lstrip_blocks": environment.lstrip_blocks,
+        "newline_sequence": environment.newline_sequence,
+        "keep_trailing_newline": environment.keep_trailing_newline,
+        "optimized": environment.optimized,
+        "autoescape": repr(environment.autoescape),
+        "extensions": sorted(environment.extensions),
+    }
+    return json.dumps(options, sort_keys=True)
+
+
+class ContentBytecodeCache(FileSystemBytecodeCache):
+    """Filesystem bytecode cache keyed on template content and compile options."""
+
+    def __init__(self, directory: Path, stats: CacheStats = TEMPLATE_CACHE_STATS):
+        super().__init__(str(directory))
+        self.stats = stats
+
+    def get_bucket(
+        self,
+        environment: Environment,
+        name: str,
+        filename: str | None,
+        source: str,
+    ) -> Bucket:
+        checksum = self.get_source_checksum(source)
+        key = hashlib.sha256(
+            f"{name}\0{checksum}\0{compile_options(environment)}".encode("utf-8")
+        ).hexdigest()
+        bucket = Bucket(environment, key, checksum)
+        self.load_bytecode(bucket)
+        if bucket.code is not None:
+            self.stats.add(hits=1)
+        else:
+            self.stats.add(misses=1)
+        return bucket
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        try:
+            super().dump_bytecode(bucket)
+        except OSError:
+            pass  # Read-only checkout; the template is simply compiled next time
+
+
+def create_environment(
+    filters: dict[str, Callable] | None = None,
+    template_dir: Path = TEMPLATE_DIR,
+    cache_dir: Path | None = BYTECODE_CACHE_DIR,
+    stats: CacheStats = TEMPLATE_CACHE_STATS,
+) -> Environment:
+    """Jinja2 environment for templates/, with a bytecode cache in cache_dir.
+
+    Pass cache_dir=None to compile every template from source.
+    """
+    bytecode_cache = None
+    if cache_dir is not None:
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = ContentBytecodeCache(cache_dir, stats)
+        except OSError:
+            bytecode_cache = None
+
+    env = Environment(
+        loader=FileSystemLoader(str(template_dir)),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        bytecode_cache=bytecode_cache,
+    )
+    env.filters.update(filters or {})
+    return env
@@ -20,7 +20,9 @@ from pathlib import Path
 from typing import Optional
 
 import requests
-import yaml
+
+from catalog import CatalogSnapshot, load_snapshot
+from yaml_loader import safe_load
 
 
 @dataclass
@@ -152,7 +154,7 @@ def collect_entry_files(
 
 def load_yaml_data(filepath: Path) -> dict:
     with open(filepath, "r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle)
+        data = safe_load(handle)
     if data is None:
         raise ValueError("Empty YAML file")
     if not isinstance(data, dict):
@@ -160,6 +162,14 @@ def load_yaml_data(filepath: Path) -> dict:
     return data
 
 
+def load_entry_data(filepath: Path, snapshot: Optional[CatalogSnapshot]) -> dict:
+    """Return the parsed entry from the compiled catalog, reading the file otherwise."""
+    record = snapshot.get(filepath) if snapshot is not None else None
+    if record is not None and record.data is not None:
+        return record.data
+    return load_yaml_data(filepath)
+
+
 def normalize_repo(repo: str) -> str:
     repo = repo.strip()
     if repo.startswith("https://github.com/"):
@@ -355,6 +365,7 @@ def main() -> None:
         headers["Authorization"] = f"token {token}"
 
     session = requests.Session()
+    snapshot = load_snapshot(data_dir)
 
     repo_cache: dict[str, RepoMetadata] = {}
     processed = 0
@@ -366,7 +377,7 @@ def main() -> None:
         if args.limit and processed >= args.limit:
             break
         try:
-            data = load_yaml_data(filepath)
+            data = load_entry_data(filepath, snapshot)
         except Exception as exc:
             print(f"ERROR {filepath}: {exc}")
             errors += 1
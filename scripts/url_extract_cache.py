@@ -0,0 +1,102 @@
+"""
+Per-file URL extraction cache for check_links.py
+
+collect_all_urls() stores the URLs it extracted from every Markdown,
+template, static and uncataloged YAML file in a JSON file under
+.cache/links/, keyed by repository path and content hash. A file whose
+content is unchanged is not parsed again, so collecting the URLs of the
+whole repository on a warm run costs one read and hash per file. The cache
+also records a fingerprint of the extractor code and is discarded when that
+changes.
+
+(Cataloged YAML entries need no entry here: their parsed mappings already
+come from the catalog snapshot, which is keyed by content hash too.)
+
+Usage:
+    from url_extract_cache import UrlExtractCache
+
+    cache = UrlExtractCache(path, fingerprint)
+    urls = cache.get("docs/GUIDE.md", digest)
+    if urls is None:
+        cache.put("docs/GUIDE.md", digest, extract(file_path))
+    cache.save()
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from catalog import write_json_atomic
+from link_cache import CACHE_DIRNAME
+
+
+EXTRACT_CACHE_VERSION = 1
+EXTRACT_CACHE_FILENAME = "extracted-urls.json"
+
+
+def default_extract_cache_path(project_root: Path) -> Path:
+    return project_root / CACHE_DIRNAME / EXTRACT_CACHE_FILENAME
+
+
+class UrlExtractCache:
+    """(url, context) lists by repository path, valid for one content hash."""
+
+    def __init__(self, path: Path, fingerprint: str):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.files: Dict[str, Tuple[str, List[Tuple[str, str]]]] = {}
+        self.seen: Set[str] = set()
+        self.hits = 0
+        self.dirty = False
+        self._load()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                payload = json.load(f)
+        except (OSError, ValueError):
+            return
+        if (
+            not isinstance(payload, dict)
+            or payload.get("version") != EXTRACT_CACHE_VERSION
+            or payload.get("extractors") != self.fingerprint
+        ):
+            return
+        for path, (digest, urls) in payload.get("files", {}).items():
+            self.files[path] = (digest, [(url, context) for url, context in urls])
+
+    def get(self, path: str, digest: str) -> Optional[List[Tuple[str, str]]]:
+        """The URLs extracted from path when it had this content, if known."""
+        self.seen.add(path)
+        entry = self.files.get(path)
+        if entry is None or entry[0] != digest:
+            return None
+        self.hits += 1
+        return entry[1]
+
+    def put(self, path: str, digest: str, urls: List[Tuple[str, str]]) -> None:
+        self.seen.add(path)
+        self.files[path] = (digest, urls)
+        self.dirty = True
+
+    def save(self, prune: bool = False) -> None:
+        """Write the cache if anything changed.
+
+        prune drops files not looked up in this run; pass it only after a
+        run that scanned every file, so deleted files do not linger.
+        """
+        if prune and set(self.files) - self.seen:
+            self.files = {p: e for p, e in self.files.items() if p in self.seen}
+            self.dirty = True
+        if not self.dirty:
+            return
+        payload = {
+            "version": EXTRACT_CACHE_VERSION,
+            "extractors": self.fingerprint,
+            "files": {path: list(entry) for path, entry in sorted(self.files.items())},
+        }
+        try:
+            write_json_atomic(self.path, payload)
+        except OSError:
+            return  # A read-only checkout still works, just without caching
+        self.dirty = False
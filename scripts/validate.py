@@ -9,18 +9,40 @@ Usage:
     python scripts/validate.py data/agents --agents
     python scripts/validate.py --agents --categories
     python scripts/validate.py --boilerplates --boilerplate-categories
+    python scripts/validate.py --no-cache
+    python scripts/validate.py --incremental
+    python scripts/validate.py --no-cache --jobs 4
 """
 
 import argparse
+import json
+import os
 import sys
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
 from pathlib import Path
-from typing import Iterable
+from typing import Callable, Iterable
 from urllib.parse import urlparse, urlunparse
 
 import yaml
 
+from catalog import (
+    KIND_PATTERNS,
+    CatalogSnapshot,
+    collect_catalog_files,
+    compile_records,
+    default_cache_dir,
+    hash_content,
+    load_snapshot,
+    models_fingerprint,
+    write_json_atomic,
+)
 from models import AgentEntry, Category, BoilerplateEntry, BoilerplateCategory, TAG_PATTERN
+from yaml_loader import safe_load
+
+
+MANIFEST_FILENAME = "validate-manifest.json"
+MANIFEST_VERSION = 2
+CROSS_FILE_KEYS = ("id", "category", "url", "github_repo", "tags")
 
 
 @dataclass
@@ -30,6 +52,16 @@ class ValidatedEntry:
     kind: str
 
 
+@dataclass
+class ManifestEntry:
+    """Cached validation outcome and cross-file keys for one file."""
+
+    sha256: str
+    kind: str
+    error: str | None
+    keys: dict
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Validate YAML files against Pydantic schemas."
@@ -51,6 +83,22 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Validate boilerplate categories",
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore the compiled catalog snapshot and re-parse every file",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Re-validate only files changed since the last run (content-hash manifest)",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=0,
+        help="Worker processes for parsing and validation (default: one per CPU, 1 = serial)",
+    )
     return parser.parse_args()
 
 
@@ -146,7 +194,7 @@ def collect_files(
 
 def load_yaml_data(filepath: Path) -> dict:
     with open(filepath) as f:
-        data = yaml.safe_load(f)
+        data = safe_load(f)
     if data is None:
         raise ValueError("Empty YAML file")
     if not isinstance(data, dict):
@@ -170,15 +218,150 @@ def validate_yaml_file(filepath: Path, model) -> tuple[bool, str, dict | None]:
     return True, f"OK {filepath}", data
 
 
-def load_category_ids(category_dir: Path) -> set[str]:
+def validate_cataloged_file(
+    filepath: Path, model, snapshot: CatalogSnapshot | None
+) -> tuple[bool, str, dict | None]:
+    """Validate a file from the compiled snapshot, parsing it only if uncataloged."""
+    record = snapshot.get(filepath) if snapshot is not None else None
+    if record is None:
+        return validate_yaml_file(filepath, model)
+    if record.error:
+        return False, f"ERROR {filepath}: {record.error}", None
+    return True, f"OK {filepath}", record.data
+
+
+def extract_cross_file_keys(data: dict | None) -> dict:
+    """Keep only the fields that cross-file checks need."""
+    if not data:
+        return {}
+    return {key: data[key] for key in CROSS_FILE_KEYS if key in data}
+
+
+def load_validation_manifest(
+    manifest_path: Path, fingerprint: str
+) -> dict[str, ManifestEntry]:
+    """Read the incremental validation manifest, ignoring it if missing or stale."""
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("version") != MANIFEST_VERSION
+        or payload.get("models") != fingerprint
+    ):
+        return {}
+
+    try:
+        return {
+            path: ManifestEntry(**entry)
+            for path, entry in payload.get("files", {}).items()
+        }
+    except TypeError:
+        return {}
+
+
+def refresh_validation_manifest(
+    data_dir: Path, cache_dir: Path | None = None, jobs: int | None = None
+) -> tuple[dict[str, ManifestEntry], list[str]]:
+    """Hash every cataloged file and re-validate only the dirty ones.
+
+    Returns:
+        Tuple of (manifest keyed by data-relative path, dirty paths)
+    """
+    manifest_path = (cache_dir or default_cache_dir(data_dir)) / MANIFEST_FILENAME
+    fingerprint = models_fingerprint()
+    cached = load_validation_manifest(manifest_path, fingerprint)
+
+    manifest: dict[str, ManifestEntry] = {}
+    pending: list[tuple[str, str, bytes, str]] = []
+    for relative, kind, file_path in collect_catalog_files(data_dir):
+        content = file_path.read_bytes()
+        digest = hash_content(content)
+        previous = cached.get(relative)
+        if previous is not None and previous.sha256 == digest and previous.kind == kind:
+            manifest[relative] = previous
+        else:
+            pending.append((relative, kind, content, digest))
+
+    for record in compile_records(pending, jobs):
+        manifest[record.path] = ManifestEntry(
+            sha256=record.sha256,
+            kind=record.kind,
+            error=record.error,
+            keys=extract_cross_file_keys(record.data),
+        )
+    dirty = [relative for relative, _, _, _ in pending]
+
+    if dirty or set(cached) != set(manifest):
+        payload = {
+            "version": MANIFEST_VERSION,
+            "models": fingerprint,
+            "files": {path: asdict(entry) for path, entry in sorted(manifest.items())},
+        }
+        try:
+            write_json_atomic(manifest_path, payload)
+        except OSError:
+            pass
+
+    return manifest, dirty
+
+
+def manifest_key(filepath: Path, absolute_data_dir: Path) -> str | None:
+    # abspath avoids a resolve() syscall per file on the hot path
+    try:
+        return Path(os.path.abspath(filepath)).relative_to(absolute_data_dir).as_posix()
+    except ValueError:
+        return None
+
+
+def validate_manifest_file(
+    filepath: Path, model, entry: ManifestEntry | None
+) -> tuple[bool, str, dict | None]:
+    """Validate a file from its manifest entry, parsing it only if uncataloged."""
+    if entry is None:
+        return validate_yaml_file(filepath, model)
+    if entry.error:
+        return False, f"ERROR {filepath}: {entry.error}", None
+    return True, f"OK {filepath}", entry.keys
+
+
+def manifest_validated_entries(
+    manifest: dict[str, ManifestEntry], data_dir: Path, kind: str
+) -> list[ValidatedEntry]:
+    """Return the full cached key set for a kind, as used by cross-file checks."""
+    return [
+        ValidatedEntry(filepath=data_dir / path, data=entry.keys, kind=kind)
+        for path, entry in sorted(manifest.items())
+        if entry.kind == kind and entry.error is None and entry.keys
+    ]
+
+
+def manifest_category_ids(manifest: dict[str, ManifestEntry], kind: str) -> set[str]:
+    return {
+        str(entry.keys["id"])
+        for entry in manifest.values()
+        if entry.kind == kind and entry.keys.get("id")
+    }
+
+
+def load_category_ids(
+    category_dir: Path, snapshot: CatalogSnapshot | None = None
+) -> set[str]:
     ids: set[str] = set()
     if not category_dir.exists():
         return ids
     for filepath in category_dir.glob("*.yml"):
         if filepath.name == ".gitkeep":
             continue
+        record = snapshot.get(filepath) if snapshot is not None else None
         try:
-            data = load_yaml_data(filepath)
+            if record is not None and record.data is not None:
+                data = record.data
+            else:
+                data = load_yaml_data(filepath)
             category_id = data.get("id")
             if category_id:
                 ids.add(str(category_id))
@@ -325,39 +508,28 @@ def check_tag_registry(
     return errors
 
 
-def main() -> None:
-    data_dir = Path("data")
-    if not data_dir.exists():
-        print("ERROR: data/ directory not found")
-        sys.exit(1)
+def run_validation(
+    files_by_type: dict[str, list[Path]],
+    include: dict[str, bool],
+    data_dir: Path,
+    validate_file: Callable[[Path, type], tuple[bool, str, dict | None]],
+    snapshot: CatalogSnapshot | None = None,
+    manifest: dict[str, ManifestEntry] | None = None,
+    uncataloged: set[Path] | None = None,
+) -> tuple[list[str], list[str]]:
+    """Validate collected files and run the cross-file checks.
 
-    args = parse_args()
-    include = build_include_map(args)
-    files_by_type, path_errors = collect_files(args.paths, data_dir, include)
-
-    errors: list[str] = list(path_errors)
+    Returns:
+        (successes, errors) message lists
+    """
+    errors: list[str] = []
     successes: list[str] = []
     agent_entries: list[ValidatedEntry] = []
     boilerplate_entries: list[ValidatedEntry] = []
-
-    total_files = sum(len(files_by_type[key]) for key in files_by_type)
-    if total_files == 0:
-        if errors:
-            print("\n".join(errors))
-            sys.exit(1)
-        print("WARNING: No YAML files found to validate")
-        sys.exit(0)
-
-    print(
-        "Validating "
-        f"{len(files_by_type['agent'])} agent files, "
-        f"{len(files_by_type['category'])} category files, "
-        f"{len(files_by_type['boilerplate'])} boilerplate files, "
-        f"{len(files_by_type['boilerplate-category'])} boilerplate category files..."
-    )
+    uncataloged = uncataloged if uncataloged is not None else set()
 
     for filepath in files_by_type["agent"]:
-        success, message, data = validate_yaml_file(filepath, AgentEntry)
+        success, message, data = validate_file(filepath, AgentEntry)
         if success:
             successes.append(message)
             if data:
@@ -368,14 +540,14 @@ def main() -> None:
             errors.append(message)
 
     for filepath in files_by_type["category"]:
-        success, message, _ = validate_yaml_file(filepath, Category)
+        success, message, _ = validate_file(filepath, Category)
         if success:
             successes.append(message)
         else:
             errors.append(message)
 
     for filepath in files_by_type["boilerplate"]:
-        success, message, data = validate_yaml_file(filepath, BoilerplateEntry)
+        success, message, data = validate_file(filepath, BoilerplateEntry)
         if success:
             successes.append(message)
             if data:
@@ -386,22 +558,41 @@ def main() -> None:
             errors.append(message)
 
     for filepath in files_by_type["boilerplate-category"]:
-        success, message, _ = validate_yaml_file(filepath, BoilerplateCategory)
+        success, message, _ = validate_file(filepath, BoilerplateCategory)
         if success:
             successes.append(message)
         else:
             errors.append(message)
 
+    if manifest is not None:
+        # Cross-file checks always see the whole catalog, not just dirty files
+        agent_entries = manifest_validated_entries(manifest, data_dir, "agent") + [
+            entry for entry in agent_entries if entry.filepath in uncataloged
+        ]
+        boilerplate_entries = manifest_validated_entries(
+            manifest, data_dir, "boilerplate"
+        ) + [entry for entry in boilerplate_entries if entry.filepath in uncataloged]
+
     if include["agent"]:
-        valid_agent_categories = load_category_ids(data_dir / "categories")
+        if manifest is not None:
+            valid_agent_categories = manifest_category_ids(manifest, "category")
+        else:
+            valid_agent_categories = load_category_ids(
+                data_dir / "categories", snapshot
+            )
         errors.extend(
             check_category_references(agent_entries, valid_agent_categories, "agent")
         )
 
     if include["boilerplate"]:
-        valid_boilerplate_categories = load_category_ids(
-            data_dir / "boilerplate-categories"
-        )
+        if manifest is not None:
+            valid_boilerplate_categories = manifest_category_ids(
+                manifest, "boilerplate-category"
+            )
+        else:
+            valid_boilerplate_categories = load_category_ids(
+                data_dir / "boilerplate-categories", snapshot
+            )
         errors.extend(
             check_category_references(
                 boilerplate_entries, valid_boilerplate_categories, "boilerplate"
@@ -422,6 +613,83 @@ def main() -> None:
         if tag_registry:
             errors.extend(check_tag_registry(combined_entries, tag_registry))
 
+    return successes, errors
+
+
+def validate_snapshot(snapshot: CatalogSnapshot) -> tuple[list[str], list[str]]:
+    """Validate every file in an already loaded snapshot, including cross-file checks.
+
+    Returns:
+        (successes, errors) message lists
+    """
+    include = {kind: True for kind in KIND_PATTERNS}
+    files_by_type, errors = collect_files([], snapshot.data_dir, include)
+
+    def validate_file(filepath: Path, model) -> tuple[bool, str, dict | None]:
+        return validate_cataloged_file(filepath, model, snapshot)
+
+    successes, check_errors = run_validation(
+        files_by_type, include, snapshot.data_dir, validate_file, snapshot=snapshot
+    )
+    return successes, errors + check_errors
+
+
+def main() -> None:
+    data_dir = Path("data")
+    if not data_dir.exists():
+        print("ERROR: data/ directory not found")
+        sys.exit(1)
+
+    args = parse_args()
+    include = build_include_map(args)
+    files_by_type, path_errors = collect_files(args.paths, data_dir, include)
+
+    total_files = sum(len(files_by_type[key]) for key in files_by_type)
+    if total_files == 0:
+        if path_errors:
+            print("\n".join(path_errors))
+            sys.exit(1)
+        print("WARNING: No YAML files found to validate")
+        sys.exit(0)
+
+    print(
+        "Validating "
+        f"{len(files_by_type['agent'])} agent files, "
+        f"{len(files_by_type['category'])} category files, "
+        f"{len(files_by_type['boilerplate'])} boilerplate files, "
+        f"{len(files_by_type['boilerplate-category'])} boilerplate category files..."
+    )
+
+    snapshot: CatalogSnapshot | None = None
+    manifest: dict[str, ManifestEntry] | None = None
+    dirty: list[str] = []
+    uncataloged: set[Path] = set()
+    if args.incremental:
+        manifest, dirty = refresh_validation_manifest(data_dir, jobs=args.jobs)
+    else:
+        snapshot = load_snapshot(data_dir, use_cache=not args.no_cache, jobs=args.jobs)
+    absolute_data_dir = Path(os.path.abspath(data_dir))
+
+    def validate_file(filepath: Path, model) -> tuple[bool, str, dict | None]:
+        if manifest is None:
+            return validate_cataloged_file(filepath, model, snapshot)
+        key = manifest_key(filepath, absolute_data_dir)
+        entry = manifest.get(key) if key else None
+        if entry is None:
+            uncataloged.add(filepath)
+        return validate_manifest_file(filepath, model, entry)
+
+    successes, check_errors = run_validation(
+        files_by_type,
+        include,
+        data_dir,
+        validate_file,
+        snapshot=snapshot,
+        manifest=manifest,
+        uncataloged=uncataloged,
+    )
+    errors = path_errors + check_errors
+
     if successes:
         print("\n".join(successes))
 
@@ -434,6 +702,11 @@ def main() -> None:
         sys.exit(1)
 
     print(f"\nOK: All {len(successes)} files passed validation")
+    if manifest is not None:
+        print(
+            f"Incremental: {len(dirty)} file(s) re-validated, "
+            f"{len(manifest) - len(dirty)} unchanged"
+        )
 
 
 if __name__ == "__main__":
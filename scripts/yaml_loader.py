@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Shared YAML loading for Ultimate Agent Directory
+
+Uses PyYAML's libyaml-backed CSafeLoader when PyYAML was built with libyaml and
+falls back to the pure-Python SafeLoader otherwise. Both loaders resolve the
+same tags, so quoted values such as last_updated: '2026-06-12' stay strings and
+unquoted dates become datetime.date either way.
+
+Usage:
+    from yaml_loader import safe_load
+
+    python scripts/yaml_loader.py          # Compare loader timings over data/
+"""
+
+import argparse
+import time
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as FastSafeLoader
+
+    LIBYAML_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as FastSafeLoader  # type: ignore[assignment]
+
+    LIBYAML_AVAILABLE = False
+
+
+def safe_load(stream):
+    """Drop-in replacement for yaml.safe_load using the fastest safe loader."""
+    return yaml.load(stream, Loader=FastSafeLoader)
+
+
+def pure_python_load(stream):
+    """Load with the pure-Python SafeLoader (reference implementation)."""
+    return yaml.load(stream, Loader=yaml.SafeLoader)
+
+
+def time_loader(loader, sources: list[str]) -> float:
+    start = time.perf_counter()
+    for source in sources:
+        loader(source)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Compare pure-Python and libyaml loader timings."
+    )
+    parser.add_argument(
+        "data_dir", nargs="?", default="data", help="Directory to scan (default: data)"
+    )
+    args = parser.parse_args()
+
+    sources = [
+        path.read_text(encoding="utf-8")
+        for path in sorted(Path(args.data_dir).rglob("*.yml"))
+    ]
+    print(f"Loading {len(sources)} YAML files from {args.data_dir}/")
+
+    python_time = time_loader(pure_python_load, sources)
+    print(f"  SafeLoader (pure Python): {python_time * 1000:.1f} ms")
+
+    if not LIBYAML_AVAILABLE:
+        print("  CSafeLoader: unavailable (PyYAML built without libyaml)")
+        return
+
+    fast_time = time_loader(safe_load, sources)
+    print(f"  CSafeLoader (libyaml):    {fast_time * 1000:.1f} ms")
+    print(f"  Speedup: {python_time / fast_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
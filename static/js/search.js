@@ -1,38 +1,214 @@
 // Global Search for Homepage
 
-let searchIndex = null;
+let searchIndex = null;  // Entries, in index order
+let searchTerms = null;  // Inverted index (see scripts/search_index.py)
+
+const MIN_TERM_LENGTH = 2;
+
+// Used with search-index.json, which carries no weights of its own
+const DEFAULT_WEIGHTS = {
+    name: [90, 60, 40],
+    tags: [30, 15, 10],
+    description: 20,
+    category: 10,
+    type: 10,
+    name_query: 50
+};
+
+function splitTerms(text) {
+    return (text || '')
+        .toLowerCase()
+        .split(/[^a-z0-9]+/)
+        .filter(term => term.length >= MIN_TERM_LENGTH);
+}
 
 function tokenizeQuery(query) {
     return query
         .toLowerCase()
         .trim()
         .split(/\s+/)
-        .filter(token => token.length >= 2);
+        .filter(token => token.length >= MIN_TERM_LENGTH);
+}
+
+function createSearchTerms(weights) {
+    return {
+        weights,
+        core: new Map(),
+        coreKeys: [],
+        description: new Map(),
+        descriptionKeys: []
+    };
+}
+
+// Merge delta-encoded entry numbers into a Map of term -> entries
+function addPostings(target, terms) {
+    Object.entries(terms).forEach(([term, encoded]) => {
+        const postings = target.get(term) || [];
+        let entry = 0;
+        encoded.forEach(delta => {
+            entry += delta;
+            postings.push(entry);
+        });
+        target.set(term, postings);
+    });
+}
+
+function sortedKeys(map) {
+    return [...map.keys()].sort();
+}
+
+// Build the same inverted index as scripts/search_index.py from full entries
+function indexEntries(entries) {
+    const terms = createSearchTerms(DEFAULT_WEIGHTS);
+    const add = (map, text, number) => {
+        new Set(splitTerms(text)).forEach(term => {
+            if (!map.has(term)) map.set(term, []);
+            map.get(term).push(number);
+        });
+    };
+
+    entries.forEach((entry, number) => {
+        const core = [entry.name, ...(entry.tags || []), entry.category, entry.type];
+        add(terms.core, core.join(' '), number);
+        add(terms.description, entry.description, number);
+    });
+
+    terms.coreKeys = sortedKeys(terms.core);
+    terms.descriptionKeys = sortedKeys(terms.description);
+    return terms;
 }
 
-function tokenMatchesText(token, text) {
-    if (!text) return false;
-    const lower = text.toLowerCase();
-    if (lower.includes(token)) return true;
-    const words = lower.split(/[^a-z0-9]+/);
-    return words.some(word => word.startsWith(token));
+async function fetchJson(path) {
+    const response = await fetch(`${window.BASE_URL || ''}/${path}`);
+    if (!response.ok) {
+        throw new Error(`${path}: HTTP ${response.status}`);
+    }
+    return response.json();
+}
+
+// Load the small core shard (names, tags, categories and their terms) so search
+// works right away; descriptions and their terms arrive in the background.
+async function loadShardedIndex(onDetailsLoaded) {
+    const manifest = await fetchJson('search/manifest.json');
+    const core = await fetchJson(`search/${manifest.core.file}`);
+    const titles = core.category_titles;
+
+    searchIndex = core.entries.map(entry => ({
+        ...entry,
+        category_title: titles[entry.is_boilerplate ? 'boilerplate' : 'agent'][entry.category],
+        description: ''
+    }));
+    searchTerms = createSearchTerms(core.weights);
+    addPostings(searchTerms.core, core.terms);
+    searchTerms.coreKeys = sortedKeys(searchTerms.core);
+    console.log('Search index loaded:', searchIndex.length, 'entries');
+
+    Promise.all(manifest.details.map(async shard => {
+        const details = await fetchJson(`search/${shard.file}`);
+        details.descriptions.forEach((description, offset) => {
+            searchIndex[details.start + offset].description = description;
+        });
+        addPostings(searchTerms.description, details.terms);
+        searchTerms.descriptionKeys = sortedKeys(searchTerms.description);
+    }))
+        .then(onDetailsLoaded)
+        .catch(error => console.error('Failed to load search descriptions:', error));
 }
 
-// Load search index
-async function loadSearchIndex() {
+// Load search index, falling back to the single-file index
+async function loadSearchIndex(onDetailsLoaded = () => {}) {
+    try {
+        await loadShardedIndex(onDetailsLoaded);
+        return;
+    } catch (error) {
+        console.warn('Sharded search index unavailable, loading search-index.json:', error);
+    }
+
     try {
-        const response = await fetch(`${window.BASE_URL || ''}/search-index.json`);
-        searchIndex = await response.json();
+        searchIndex = await fetchJson('search-index.json');
         console.log('Search index loaded:', searchIndex.length, 'entries');
     } catch (error) {
         console.error('Failed to load search index:', error);
         searchIndex = [];
     }
+    searchTerms = indexEntries(searchIndex);
+}
+
+// Entries that can contain token in some field. A field containing the token
+// has an indexed word containing the token's longest [a-z0-9] run, so only the
+// entries of those words are candidates. Returns null when that run is too
+// short to be indexed and every entry has to be checked.
+function candidateEntries(token) {
+    const run = token
+        .split(/[^a-z0-9]+/)
+        .reduce((longest, part) => (part.length > longest.length ? part : longest), '');
+    if (run.length < MIN_TERM_LENGTH) {
+        return null;
+    }
+
+    const entries = new Set();
+    const collect = (map, keys) => keys.forEach(term => {
+        if (term.includes(run)) {
+            map.get(term).forEach(entry => entries.add(entry));
+        }
+    });
+    collect(searchTerms.core, searchTerms.coreKeys);
+    collect(searchTerms.description, searchTerms.descriptionKeys);
+    return entries;
+}
+
+// Lowercase searchable fields of an entry
+function entryFields(entry) {
+    return {
+        name: entry.name.toLowerCase(),
+        description: (entry.description || '').toLowerCase(),
+        tags: entry.tags ? entry.tags.map(tag => tag.toLowerCase()) : [],
+        category: entry.category ? entry.category.toLowerCase() : '',
+        type: entry.type ? entry.type.toLowerCase() : ''
+    };
+}
+
+// Score of one query token in an entry's fields (0 if it matches none); name
+// and tags score their best tier: equal to, starting with or containing it
+function scoreToken(fields, token) {
+    const weights = searchTerms.weights;
+    let score = 0;
+
+    if (fields.name === token) {
+        score += weights.name[0];
+    } else if (fields.name.startsWith(token)) {
+        score += weights.name[1];
+    } else if (fields.name.includes(token)) {
+        score += weights.name[2];
+    }
+
+    if (fields.description.includes(token)) {
+        score += weights.description;
+    }
+
+    if (fields.tags.some(tag => tag === token)) {
+        score += weights.tags[0];
+    } else if (fields.tags.some(tag => tag.startsWith(token))) {
+        score += weights.tags[1];
+    } else if (fields.tags.some(tag => tag.includes(token))) {
+        score += weights.tags[2];
+    }
+
+    if (fields.category.includes(token)) {
+        score += weights.category;
+    }
+
+    if (fields.type.includes(token)) {
+        score += weights.type;
+    }
+
+    return score;
 }
 
-// Perform search
+// Perform search: only candidates from the inverted index are scored, and an
+// entry must match every token
 function performSearch(query) {
-    if (!searchIndex || searchIndex.length === 0) {
+    if (!searchIndex || searchIndex.length === 0 || !searchTerms) {
         return [];
     }
 
@@ -46,66 +222,44 @@ function performSearch(query) {
         return [];
     }
 
-    const results = [];
+    let candidates = null;  // null: every entry
+    for (const token of tokens) {
+        const entries = candidateEntries(token);
+        if (entries !== null) {
+            candidates = candidates === null
+                ? entries
+                : new Set([...candidates].filter(entry => entries.has(entry)));
+        }
+        if (candidates !== null && candidates.size === 0) {
+            return [];
+        }
+    }
 
-    searchIndex.forEach(entry => {
+    const numbers = candidates === null
+        ? searchIndex.map((_, entry) => entry)
+        : [...candidates].sort((a, b) => a - b);
+    const results = [];
+    numbers.forEach(entry => {
+        const fields = entryFields(searchIndex[entry]);
         let score = 0;
-        let matchedTokens = 0;
-
-        const name = entry.name.toLowerCase();
-        const description = entry.description.toLowerCase();
-        const tags = entry.tags ? entry.tags.map(tag => tag.toLowerCase()) : [];
-        const category = entry.category ? entry.category.toLowerCase() : '';
-        const type = entry.type ? entry.type.toLowerCase() : '';
-
-        tokens.forEach(token => {
-            let tokenScore = 0;
-
-            if (name === token) {
-                tokenScore += 90;
-            } else if (name.startsWith(token)) {
-                tokenScore += 60;
-            } else if (name.includes(token)) {
-                tokenScore += 40;
-            }
-
-            if (tokenMatchesText(token, description)) {
-                tokenScore += 20;
-            }
-
-            if (tags.some(tag => tag === token)) {
-                tokenScore += 30;
-            } else if (tags.some(tag => tag.startsWith(token))) {
-                tokenScore += 15;
-            } else if (tags.some(tag => tag.includes(token))) {
-                tokenScore += 10;
-            }
-
-            if (tokenMatchesText(token, category)) {
-                tokenScore += 10;
-            }
-
-            if (tokenMatchesText(token, type)) {
-                tokenScore += 10;
-            }
-
-            if (tokenScore > 0) {
-                score += tokenScore;
-                matchedTokens += 1;
+        for (const token of tokens) {
+            const tokenScore = scoreToken(fields, token);
+            if (tokenScore === 0) {
+                return;
             }
-        });
-
-        if (name === searchTerm) {
-            score += 50;
+            score += tokenScore;
         }
-
-        if (score > 0 && matchedTokens === tokens.length) {
-            results.push({ ...entry, score });
+        if (fields.name === searchTerm) {
+            score += searchTerms.weights.name_query;
         }
+        results.push({ entry, score });
     });
 
-    // Sort by score (descending) and return top 10
-    return results.sort((a, b) => b.score - a.score).slice(0, 10);
+    // Sort by score (descending, ties in index order) and return top 10
+    return results
+        .sort((a, b) => b.score - a.score || a.entry - b.entry)
+        .slice(0, 10)
+        .map(({ entry, score }) => ({ ...searchIndex[entry], score }));
 }
 
 // Display search results
@@ -175,8 +329,14 @@ document.addEventListener('DOMContentLoaded', async function() {
 
     if (!searchInput) return;
 
-    // Load search index
-    await loadSearchIndex();
+    // Load search index; refresh open results once descriptions are in
+    await loadSearchIndex(() => {
+        const query = searchInput.value;
+        const resultsOpen = !document.getElementById('search-results').classList.contains('hidden');
+        if (resultsOpen && query.trim().length >= 2) {
+            displaySearchResults(performSearch(query), query);
+        }
+    });
 
     // Search input handler with debounce
     const debouncedSearch = window.Utils.debounce((query) => {
@@ -0,0 +1,243 @@
+"""
+Unit tests for scripts/build.py
+
+Tests for the stage DAG runner:
+- check_graph() and select_stages()
+- run_stages() ordering, concurrency and failure propagation
+- README.md and BOILERPLATES.md stages leaving unchanged files alone
+- the compress stage with --no-compress leaving no stale siblings
+"""
+
+import gzip
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import build
+from build import (
+    STAGES,
+    BuildContext,
+    BuildError,
+    Stage,
+    check_graph,
+    run_stages,
+    select_stages,
+)
+from precompress import precompress_tree
+from site_manifest import write_if_changed
+
+
+def returns(summary: str):
+    return lambda ctx: summary
+
+
+class TestCheckGraph:
+    """Tests for check_graph()"""
+
+    def test_builtin_stages_are_valid(self) -> None:
+        check_graph(STAGES)
+
+    def test_unknown_dependency(self) -> None:
+        with pytest.raises(ValueError, match="unknown or later stage 'missing'"):
+            check_graph([Stage("a", returns("a"), ("missing",))])
+
+    def test_dependency_declared_later(self) -> None:
+        stages = [Stage("a", returns("a"), ("b",)), Stage("b", returns("b"))]
+
+        with pytest.raises(ValueError, match="later stage 'b'"):
+            check_graph(stages)
+
+    def test_duplicate_name(self) -> None:
+        with pytest.raises(ValueError, match="Duplicate stage 'a'"):
+            check_graph([Stage("a", returns("a")), Stage("a", returns("a"))])
+
+
+class TestSelectStages:
+    """Tests for select_stages()"""
+
+    def test_includes_transitive_dependencies(self) -> None:
+        names = [stage.name for stage in select_stages(STAGES, ["site"])]
+
+        assert names == ["catalog", "validate", "models", "site"]
+
+    def test_links_skip_validation(self) -> None:
+        names = [stage.name for stage in select_stages(STAGES, ["links"])]
+
+        assert names == ["catalog", "links"]
+
+    def test_unknown_stage(self) -> None:
+        with pytest.raises(ValueError, match="Unknown stage 'nope'"):
+            select_stages(STAGES, ["nope"])
+
+
+class TestRunStages:
+    """Tests for run_stages()"""
+
+    def test_results_follow_graph_order(self) -> None:
+        stages = [
+            Stage("a", returns("first")),
+            Stage("b", returns("second"), ("a",)),
+            Stage("c", returns("third"), ("a",)),
+        ]
+
+        results = run_stages(stages, BuildContext())
+
+        assert [(r.name, r.status, r.summary) for r in results] == [
+            ("a", "ok", "first"),
+            ("b", "ok", "second"),
+            ("c", "ok", "third"),
+        ]
+
+    def test_dependencies_finish_first(self) -> None:
+        order: list[str] = []
+
+        def record(name: str):
+            return lambda ctx: order.append(name) or name
+
+        stages = [
+            Stage("load", record("load")),
+            Stage("left", record("left"), ("load",)),
+            Stage("right", record("right"), ("load",)),
+            Stage("join", record("join"), ("left", "right")),
+        ]
+
+        run_stages(stages, BuildContext())
+
+        assert order[0] == "load"
+        assert order[-1] == "join"
+
+    def test_independent_stages_run_concurrently(self) -> None:
+        barrier = threading.Barrier(2, timeout=5)
+
+        def meet(ctx: BuildContext) -> str:
+            barrier.wait()
+            return "met"
+
+        stages = [Stage("a", meet), Stage("b", meet)]
+
+        results = run_stages(stages, BuildContext())
+
+        assert [r.status for r in results] == ["ok", "ok"]
+
+    def test_serial_mode_runs_one_at_a_time(self) -> None:
+        active: list[int] = [0]
+        peak: list[int] = [0]
+        lock = threading.Lock()
+
+        def work(ctx: BuildContext) -> str:
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            with lock:
+                active[0] -= 1
+            return "done"
+
+        stages = [Stage(name, work) for name in ("a", "b", "c")]
+
+        run_stages(stages, BuildContext(), max_workers=1)
+
+        assert peak[0] == 1
+
+    def test_failure_skips_dependents(self) -> None:
+        def fail(ctx: BuildContext) -> str:
+            raise BuildError("2 error(s) found", ["bad one", "bad two"])
+
+        stages = [
+            Stage("validate", fail),
+            Stage("models", returns("models"), ("validate",)),
+            Stage("site", returns("site"), ("models",)),
+            Stage("links", returns("links")),
+        ]
+
+        results = {r.name: r for r in run_stages(stages, BuildContext())}
+
+        assert results["validate"].status == "failed"
+        assert results["validate"].details == ["bad one", "bad two"]
+        assert results["models"].status == "skipped"
+        assert results["site"].status == "skipped"
+        assert results["links"].status == "ok"
+
+    def test_unexpected_exception_fails_stage(self) -> None:
+        def crash(ctx: BuildContext) -> str:
+            raise RuntimeError("boom")
+
+        results = run_stages([Stage("a", crash)], BuildContext())
+
+        assert results[0].status == "failed"
+        assert results[0].summary == "RuntimeError: boom"
+
+    def test_on_done_sees_every_stage(self) -> None:
+        seen: list[str] = []
+        stages = [Stage("a", returns("a")), Stage("b", returns("b"), ("a",))]
+
+        run_stages(stages, BuildContext(), on_done=lambda r: seen.append(r.name))
+
+        assert sorted(seen) == ["a", "b"]
+
+
+class TestMarkdownStages:
+    """Tests for run_readme() and run_boilerplates()"""
+
+    def context(self) -> BuildContext:
+        data = SimpleNamespace(
+            site_config={},
+            categories=[],
+            agents=[],
+            boilerplate_categories=[],
+            boilerplates=[],
+        )
+        return BuildContext(snapshot=object(), site_data=data)  # type: ignore[arg-type]
+
+    def test_unchanged_readme_is_not_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(build, "build_readme", lambda *args: "# Agents\n")
+        monkeypatch.setattr(build, "count_boilerplates", lambda snapshot: 0)
+
+        assert build.run_readme(self.context()) == "README.md written (0 entries)"
+        mtime = (tmp_path / "README.md").stat().st_mtime_ns
+        assert build.run_readme(self.context()) == "README.md unchanged (0 entries)"
+        assert (tmp_path / "README.md").stat().st_mtime_ns == mtime
+
+    def test_changed_boilerplates_are_rewritten(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "BOILERPLATES.md").write_text("# Old\n")
+        monkeypatch.setattr(build, "build_boilerplates_readme", lambda *args: "# New\n")
+        monkeypatch.setattr(build, "count_agents", lambda snapshot: 0)
+
+        summary = build.run_boilerplates(self.context())
+
+        assert summary == "BOILERPLATES.md written (0 entries)"
+        assert (tmp_path / "BOILERPLATES.md").read_text() == "# New\n"
+
+
+class TestCompressStage:
+    """Tests for run_compress()"""
+
+    def test_no_compress_drops_siblings_of_rewritten_pages(self, tmp_path: Path) -> None:
+        page = tmp_path / "categories" / "autonomous-agents.html"
+        other = tmp_path / "index.html"
+        page.parent.mkdir()
+        page.write_text("<p>old</p>\n" * 200)
+        other.write_text("<p>home</p>\n" * 200)
+        build.run_compress(BuildContext(output_dir=tmp_path, jobs=1))
+        write_if_changed(page, "<p>new</p>\n" * 200)
+
+        summary = build.run_compress(
+            BuildContext(output_dir=tmp_path, jobs=1, compress=False)
+        )
+
+        assert summary == "disabled (--no-compress), 1 stale sibling(s) deleted"
+        assert not page.with_name(page.name + ".gz").exists()
+        assert gzip.decompress(other.with_name("index.html.gz").read_bytes()) == (
+            other.read_bytes()
+        )
@@ -0,0 +1,391 @@
+"""
+Unit tests for scripts/catalog.py
+
+Tests for the compiled catalog snapshot:
+- compile_record()
+- compile_records() parallel fan-out
+- load_snapshot() cache reuse and invalidation
+- models_fingerprint() covering the schema, YAML loader and pydantic version
+- CatalogSnapshot lookups and model loading
+- trusted model construction from validation stamps
+"""
+
+import json
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import catalog
+from catalog import (
+    SNAPSHOT_FILENAME,
+    CatalogError,
+    compile_record,
+    compile_records,
+    construct_trusted,
+    default_cache_dir,
+    load_agents,
+    load_boilerplates,
+    load_categories,
+    load_snapshot,
+    models_fingerprint,
+)
+from models import AgentEntry
+
+
+def write_yaml(path: Path, data: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump(data, default_flow_style=False, sort_keys=False))
+    return path
+
+
+def agent_data(name: str, url: str) -> dict:
+    return {
+        "name": name,
+        "url": url,
+        "description": "A test agent framework for unit testing purposes.",
+        "category": "test-category",
+        "tags": ["testing"],
+    }
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    """Create a small data directory with one category and two agents."""
+    data_dir = tmp_path / "data"
+    write_yaml(
+        data_dir / "categories" / "test-category.yml",
+        {
+            "id": "test-category",
+            "title": "Test Category",
+            "description": "A test category description.",
+            "order": 1,
+        },
+    )
+    write_yaml(
+        data_dir / "agents" / "test-category" / "alpha.yml",
+        agent_data("Alpha", "https://example.com/alpha"),
+    )
+    write_yaml(
+        data_dir / "agents" / "test-category" / "beta.yml",
+        agent_data("Beta", "https://example.com/beta"),
+    )
+    return data_dir
+
+
+class TestCompileRecord:
+    """Tests for compile_record()"""
+
+    def test_valid_entry(self) -> None:
+        content = yaml.dump(agent_data("Alpha", "https://example.com/alpha")).encode()
+        record = compile_record("agents/a.yml", "agent", content, "digest")
+
+        assert record.ok
+        assert record.data["name"] == "Alpha"
+
+    def test_validation_error_keeps_data(self) -> None:
+        data = agent_data("Alpha", "not-a-url")
+        record = compile_record("agents/a.yml", "agent", yaml.dump(data).encode(), "d")
+
+        assert not record.ok
+        assert record.error.startswith("Validation error:")
+        assert record.data["url"] == "not-a-url"
+
+    def test_syntax_error(self) -> None:
+        record = compile_record("agents/a.yml", "agent", b"name: [unclosed", "d")
+
+        assert record.data is None
+        assert record.error.startswith("YAML syntax error:")
+
+    def test_empty_file(self) -> None:
+        record = compile_record("agents/a.yml", "agent", b"", "d")
+
+        assert record.data is None
+        assert record.error == "Empty YAML file"
+
+    def test_dates_are_stored_as_iso_strings(self) -> None:
+        content = b"""
+name: Alpha
+url: https://example.com/alpha
+description: A test agent framework for unit testing purposes.
+category: test-category
+added_date: 2025-01-15
+"""
+        record = compile_record("agents/a.yml", "agent", content, "d")
+
+        assert record.ok
+        assert record.data["added_date"] == "2025-01-15"
+
+
+class TestCompileRecords:
+    """Tests for compile_records()"""
+
+    @staticmethod
+    def make_items(count: int) -> list[tuple[str, str, bytes, str]]:
+        items = []
+        for index in range(count):
+            data = agent_data(f"Agent {index}", f"https://example.com/{index}")
+            content = yaml.dump(data).encode()
+            items.append((f"agents/{index:03}.yml", "agent", content, str(index)))
+        return items
+
+    def test_parallel_matches_serial_order(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(catalog, "PARALLEL_THRESHOLD", 1)
+        items = self.make_items(12)
+
+        serial = compile_records(items, jobs=1)
+        parallel = compile_records(items, jobs=3)
+
+        assert parallel == serial
+        assert [record.path for record in parallel] == [item[0] for item in items]
+
+    def test_falls_back_to_serial_when_pool_unavailable(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        def broken_pool(*args, **kwargs):
+            raise OSError("no semaphores")
+
+        monkeypatch.setattr(catalog, "PARALLEL_THRESHOLD", 1)
+        monkeypatch.setattr(catalog, "ProcessPoolExecutor", broken_pool)
+
+        records = compile_records(self.make_items(4), jobs=2)
+
+        assert [record.data["name"] for record in records] == [
+            "Agent 0",
+            "Agent 1",
+            "Agent 2",
+            "Agent 3",
+        ]
+
+    def test_empty_input(self) -> None:
+        assert compile_records([], jobs=4) == []
+
+
+class TestLoadSnapshot:
+    """Tests for load_snapshot() caching"""
+
+    def test_cold_load_compiles_everything(self, data_dir: Path) -> None:
+        snapshot = load_snapshot(data_dir)
+
+        assert snapshot.compiled == 3
+        assert snapshot.reused == 0
+        assert (default_cache_dir(data_dir) / SNAPSHOT_FILENAME).exists()
+
+    def test_warm_load_reuses_unchanged_files(self, data_dir: Path) -> None:
+        load_snapshot(data_dir)
+        snapshot = load_snapshot(data_dir)
+
+        assert snapshot.compiled == 0
+        assert snapshot.reused == 3
+
+    def test_only_changed_file_is_recompiled(self, data_dir: Path) -> None:
+        load_snapshot(data_dir)
+        write_yaml(
+            data_dir / "agents" / "test-category" / "beta.yml",
+            agent_data("Beta Renamed", "https://example.com/beta"),
+        )
+
+        snapshot = load_snapshot(data_dir)
+
+        assert snapshot.compiled == 1
+        assert snapshot.reused == 2
+        assert {agent.name for agent in load_agents(snapshot)} == {
+            "Alpha",
+            "Beta Renamed",
+        }
+
+    def test_deleted_file_is_dropped(self, data_dir: Path) -> None:
+        load_snapshot(data_dir)
+        (data_dir / "agents" / "test-category" / "beta.yml").unlink()
+
+        snapshot = load_snapshot(data_dir)
+        cached = json.loads(
+            (default_cache_dir(data_dir) / SNAPSHOT_FILENAME).read_text()
+        )
+
+        assert [agent.name for agent in load_agents(snapshot)] == ["Alpha"]
+        assert "agents/test-category/beta.yml" not in cached["files"]
+
+    def test_schema_change_invalidates_cache(
+        self, data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        load_snapshot(data_dir)
+        monkeypatch.setattr(catalog, "models_fingerprint", lambda: "changed")
+
+        snapshot = load_snapshot(data_dir)
+
+        assert snapshot.compiled == 3
+
+    def test_corrupt_cache_is_rebuilt(self, data_dir: Path) -> None:
+        cache_file = default_cache_dir(data_dir) / SNAPSHOT_FILENAME
+        cache_file.parent.mkdir(parents=True)
+        cache_file.write_text("{not json")
+
+        snapshot = load_snapshot(data_dir)
+
+        assert snapshot.compiled == 3
+
+    def test_no_cache_skips_snapshot_file(self, data_dir: Path) -> None:
+        load_snapshot(data_dir, use_cache=False)
+
+        assert not (default_cache_dir(data_dir) / SNAPSHOT_FILENAME).exists()
+
+
+class TestModelsFingerprint:
+    """Tests for models_fingerprint()"""
+
+    def copy_sources(self, tmp_path: Path) -> Path:
+        copy = tmp_path / "scripts"
+        copy.mkdir()
+        for name in catalog.SCHEMA_SOURCES:
+            shutil.copy(Path(catalog.__file__).parent / name, copy / name)
+        return copy
+
+    @pytest.mark.parametrize("changed", catalog.SCHEMA_SOURCES)
+    def test_covers_schema_sources(self, tmp_path: Path, changed: str) -> None:
+        copy = self.copy_sources(tmp_path)
+        with open(copy / changed, "a") as f:
+            f.write("\n# changed\n")
+
+        assert models_fingerprint(copy) != models_fingerprint()
+
+    def test_covers_pydantic_version(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        copy = self.copy_sources(tmp_path)
+        before = models_fingerprint(copy)
+        models_fingerprint.cache_clear()
+        monkeypatch.setattr(catalog.pydantic, "VERSION", "0.0.0")
+        try:
+            assert models_fingerprint(copy) != before
+        finally:
+            models_fingerprint.cache_clear()
+
+
+class TestCatalogSnapshot:
+    """Tests for CatalogSnapshot helpers"""
+
+    def test_get_accepts_relative_and_absolute_paths(self, data_dir: Path) -> None:
+        snapshot = load_snapshot(data_dir)
+        path = data_dir / "agents" / "test-category" / "alpha.yml"
+
+        assert snapshot.get(path).data["name"] == "Alpha"
+        assert snapshot.get(path.resolve()).data["name"] == "Alpha"
+        assert snapshot.get(data_dir.parent / "outside.yml") is None
+
+    def test_records_are_in_path_order(self, data_dir: Path) -> None:
+        snapshot = load_snapshot(data_dir)
+
+        assert [record.path for record in snapshot.records_for("agent")] == [
+            "agents/test-category/alpha.yml",
+            "agents/test-category/beta.yml",
+        ]
+
+    def test_load_categories(self, data_dir: Path) -> None:
+        categories = load_categories(load_snapshot(data_dir))
+
+        assert [category.id for category in categories] == ["test-category"]
+
+    def test_unparsable_file_raises(self, data_dir: Path) -> None:
+        bad = data_dir / "agents" / "test-category" / "broken.yml"
+        bad.write_text("name: [unclosed")
+
+        with pytest.raises(CatalogError, match="broken.yml"):
+            load_agents(load_snapshot(data_dir))
+
+
+class TestTrustedConstruction:
+    """Tests for stamped records and construct_trusted()"""
+
+    def test_valid_record_is_stamped(self, data_dir: Path) -> None:
+        snapshot = load_snapshot(data_dir)
+        record = snapshot.records_for("agent")[0]
+
+        assert record.stamp is not None
+        assert record.validated["url"] == "https://example.com/alpha"
+        assert snapshot.is_trusted(record)
+
+    def test_invalid_record_is_not_stamped(self) -> None:
+        data = agent_data("Alpha", "not-a-url")
+        record = compile_record("agents/a.yml", "agent", yaml.dump(data).encode(), "d")
+
+        assert record.stamp is None
+        assert record.validated is None
+
+    def test_trusted_models_match_full_validation(self, data_dir: Path) -> None:
+        write_yaml(
+            data_dir / "agents" / "test-category" / "gamma.yml",
+            {
+                **agent_data("Gamma", "https://example.com"),
+                "tags": ["machine-learning", "testing"],
+                "documentation_url": "https://docs.example.com/gamma",
+                "added_date": "2025-01-15",
+            },
+        )
+        snapshot = load_snapshot(data_dir)
+
+        trusted = load_agents(snapshot, trusted=True)
+        validated = load_agents(snapshot, trusted=False)
+
+        assert trusted == validated
+        assert [a.model_fields_set for a in trusted] == [
+            a.model_fields_set for a in validated
+        ]
+        assert [a.model_dump_json() for a in trusted] == [
+            a.model_dump_json() for a in validated
+        ]
+
+    def test_nested_models_are_revived(self, tmp_path: Path) -> None:
+        data_dir = tmp_path / "data"
+        write_yaml(
+            data_dir / "boilerplates" / "python" / "starter.yml",
+            {
+                "name": "Starter",
+                "url": "https://github.com/example/starter",
+                "description": "A starter kit used for unit testing the catalog.",
+                "category": "python",
+                "technical_stack": [{"component": "Web", "technology": "FastAPI"}],
+                "last_updated": "2025-02-01",
+            },
+        )
+        snapshot = load_snapshot(data_dir)
+
+        trusted = load_boilerplates(snapshot, trusted=True)
+
+        assert trusted == load_boilerplates(snapshot, trusted=False)
+        assert trusted[0].technical_stack[0].technology == "FastAPI"
+        assert trusted[0].last_updated.year == 2025
+
+    def test_stale_stamp_falls_back_to_validation(
+        self, data_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        snapshot = load_snapshot(data_dir)
+        record = snapshot.records_for("agent")[0]
+        record.stamp = "stale"
+        calls = []
+        monkeypatch.setattr(
+            catalog,
+            "construct_trusted",
+            lambda *args: calls.append(args) or construct_trusted(*args),
+        )
+
+        agents = load_agents(snapshot)
+
+        assert not snapshot.is_trusted(record)
+        assert len(calls) == 1
+        assert [agent.name for agent in agents] == ["Alpha", "Beta"]
+
+    def test_construct_trusted_defaults_fields_set_to_dump(self) -> None:
+        agent = AgentEntry(**agent_data("Alpha", "https://example.com/alpha"))
+
+        rebuilt = construct_trusted(AgentEntry, agent.model_dump(mode="json"))
+
+        assert rebuilt == agent
+        assert rebuilt.model_fields_set == set(AgentEntry.model_fields)
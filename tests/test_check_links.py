@@ -0,0 +1,602 @@
+"""
+Tests for HTTP checking in check_links.py
+
+Requests go to a local aiohttp server, so no test touches the network.
+
+Tests for:
+- conditional revalidation with ETag / Last-Modified validators
+- the streaming worker pool in stream_checks()
+- retrying throttled URLs through the host limiter
+- token-bucket rate limiting and round-robin domain scheduling
+- the byte-capped, ranged GET fallback
+- short-circuiting URLs on hosts that refuse connections
+- partitioning URLs into shards by host and merging shard reports
+"""
+
+import asyncio
+import errno
+import json
+import socket
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from aiohttp import ClientConnectorError, ClientSession, web
+from aiohttp.test_utils import TestServer
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import check_links
+from check_links import (
+    CheckOutcome,
+    DomainScheduler,
+    HostHealth,
+    RateLimiter,
+    URLCheck,
+    assign_shards,
+    bytes_transferred,
+    cached_link,
+    check_url,
+    is_hard_failure,
+    load_shard_reports,
+    merge_reports,
+    not_modified_share,
+    parse_shard,
+    report_summary,
+    revalidation_headers,
+    save_report,
+    select_shard,
+    stream_checks,
+)
+from host_limiter import HostLimiter
+from link_cache import CachedLink
+
+ETAG = '"v1"'
+BODY = b"x" * 1_000_000
+LAST_MODIFIED = "Wed, 21 Oct 2015 07:28:00 GMT"
+
+
+def make_app(log: list) -> web.Application:
+    async def page(request: web.Request) -> web.Response:
+        log.append((request.method, dict(request.headers)))
+        if request.headers.get("If-None-Match") == ETAG:
+            return web.Response(status=304, headers={"ETag": ETAG})
+        return web.Response(
+            text="<p>hello</p>",
+            headers={"ETag": ETAG, "Last-Modified": LAST_MODIFIED},
+        )
+
+    async def throttled(request: web.Request) -> web.Response:
+        log.append((request.method, dict(request.headers)))
+        if len(log) <= 2:
+            return web.Response(status=429, headers={"Retry-After": "0"})
+        return web.Response(text="<p>finally</p>")
+
+    async def large(request: web.Request) -> web.StreamResponse:
+        # Rejects HEAD; honors Range only on /large/ranged
+        log.append((request.method, dict(request.headers)))
+        if request.method == "HEAD":
+            return web.Response(status=405)
+        if request.match_info["mode"] == "ranged" and "Range" in request.headers:
+            end = int(request.headers["Range"].split("-")[1])
+            return web.Response(status=206, body=BODY[: end + 1])
+        return web.Response(body=BODY)
+
+    async def empty(request: web.Request) -> web.Response:
+        log.append((request.method, dict(request.headers)))
+        if request.method == "HEAD":
+            return web.Response(status=405)
+        if "Range" in request.headers:
+            return web.Response(status=416)
+        return web.Response(status=200)
+
+    app = web.Application()
+    app.router.add_route("*", "/page", page)
+    app.router.add_route("*", "/throttled", throttled)
+    app.router.add_route("*", "/large/{mode}", large)
+    app.router.add_route("*", "/empty", empty)
+    return app
+
+
+def run_check(
+    path: str,
+    validators=None,
+    log=None,
+    retries: int = 1,
+    host_limiter=None,
+    max_get_bytes: int = 8192,
+) -> CheckOutcome:
+    async def go() -> CheckOutcome:
+        async with TestServer(make_app(log if log is not None else [])) as server:
+            async with ClientSession() as session:
+                return await check_url(
+                    session,
+                    str(server.make_url(path)),
+                    timeout=5,
+                    retries=retries,
+                    rate_limiter=RateLimiter(max_per_second=100),
+                    validators=validators,
+                    host_limiter=host_limiter,
+                    max_get_bytes=max_get_bytes,
+                )
+
+    return asyncio.run(go())
+
+
+def previous(status: str = "success", **fields) -> CachedLink:
+    link = CachedLink(
+        url="https://a.test",
+        status=status,
+        status_code=200,
+        error_message=None,
+        final_url="https://a.test/home",
+        checked_at=0.0,
+        etag=ETAG,
+        last_modified=LAST_MODIFIED,
+    )
+    for name, value in fields.items():
+        setattr(link, name, value)
+    return link
+
+
+def url_check(url: str, status_code: int, cached: bool = False) -> URLCheck:
+    return URLCheck(
+        url=url,
+        status="success",
+        status_code=status_code,
+        error_message=None,
+        source_file="docs/GUIDE.md",
+        source_type="markdown",
+        field_name="direct",
+        cached=cached,
+    )
+
+
+class TestConditionalRevalidation:
+    """Tests for If-None-Match / If-Modified-Since revalidation"""
+
+    def test_first_check_records_validators(self) -> None:
+        outcome = run_check("/page")
+
+        assert outcome.status_code == 200
+        assert (outcome.etag, outcome.last_modified) == (ETAG, LAST_MODIFIED)
+
+    def test_unchanged_resource_answers_304_with_head_only(self) -> None:
+        log: list = []
+        outcome = run_check("/page", revalidation_headers(previous()), log)
+
+        assert outcome.status_code == 304
+        assert [method for method, _ in log] == ["HEAD"]
+        assert log[0][1]["If-None-Match"] == ETAG
+        assert log[0][1]["If-Modified-Since"] == LAST_MODIFIED
+
+    def test_only_successful_results_are_revalidated(self) -> None:
+        assert revalidation_headers(None) == {}
+        assert revalidation_headers(previous("warning")) == {}
+        assert revalidation_headers(previous(last_modified=None)) == {
+            "If-None-Match": ETAG
+        }
+
+    def test_304_keeps_previous_final_url_and_validators(self) -> None:
+        outcome = CheckOutcome(304, None, final_url=None, etag=None)
+
+        link = cached_link("https://a.test", "success", outcome, previous())
+
+        assert link.status_code == 304
+        assert (link.final_url, link.etag, link.last_modified) == (
+            "https://a.test/home",
+            ETAG,
+            LAST_MODIFIED,
+        )
+
+    def test_not_modified_share_counts_requested_urls(self) -> None:
+        results = [
+            url_check("https://a.test", 304),
+            url_check("https://a.test", 304),  # Same URL found in another file
+            url_check("https://b.test", 200),
+            url_check("https://c.test", 304, cached=True),
+        ]
+
+        assert not_modified_share(results) == (1, 2)
+
+
+class TestStreamChecks:
+    """Tests for stream_checks()"""
+
+    def collect(self, urls: list[str], delays: dict[str, float], concurrency: int):
+        in_flight = 0
+        peak = 0
+
+        async def check(url: str) -> CheckOutcome:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(delays.get(url, 0.001))
+            in_flight -= 1
+            if url == "boom":
+                raise RuntimeError("exploded")
+            return CheckOutcome(200, None)
+
+        async def go() -> list:
+            return [item async for item in stream_checks(urls, check, concurrency)]
+
+        return asyncio.run(go()), peak
+
+    def test_slow_url_does_not_hold_up_the_others(self) -> None:
+        urls = ["slow"] + [f"u{i}" for i in range(10)]
+
+        results, peak = self.collect(urls, {"slow": 0.2}, concurrency=3)
+
+        assert [url for url, _ in results][-1] == "slow"
+        assert sorted(url for url, _ in results) == sorted(urls)
+        assert peak == 3
+
+    def test_exceptions_become_unexpected_errors(self) -> None:
+        results, _ = self.collect(["ok", "boom"], {}, concurrency=2)
+
+        outcomes = dict(results)
+        assert outcomes["ok"].status_code == 200
+        assert outcomes["boom"].status_code == 0
+        assert outcomes["boom"].error_message == "Unexpected error: exploded"
+
+    def test_no_urls(self) -> None:
+        results, peak = self.collect([], {}, concurrency=4)
+
+        assert (results, peak) == ([], 0)
+
+
+class TestThrottledRetries:
+    """check_url() retries 429/503 answers once Retry-After has passed"""
+
+    def test_throttled_url_is_retried(self) -> None:
+        log: list = []
+        limiter = HostLimiter(initial=4)
+
+        outcome = run_check("/throttled", log=log, retries=2, host_limiter=limiter)
+
+        assert outcome.status_code == 200
+        assert [method for method, _ in log] == ["HEAD", "GET", "HEAD"]
+        (row,) = limiter.report()
+        assert (row["requests"], row["throttled"]) == (3, 2)
+        assert row["final_limit"] < 4
+
+    def test_last_attempt_reports_the_throttling(self) -> None:
+        outcome = run_check("/throttled", retries=1)
+
+        assert outcome.status_code == 429
+        assert outcome.retry_after == 0.0
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 50.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestRateLimiter:
+    """Tests for the token-bucket RateLimiter"""
+
+    def test_bursts_then_refills(self) -> None:
+        clock = FakeClock()
+        limiter = RateLimiter(max_per_second=2, clock=clock)
+
+        assert limiter.try_acquire("a.test") == 0
+        assert limiter.try_acquire("a.test") == 0
+        assert limiter.try_acquire("a.test") == 0.5
+        assert limiter.try_acquire("b.test") == 0  # Separate bucket
+
+        clock.now += 0.5
+        assert limiter.try_acquire("a.test") == 0
+        assert limiter.try_acquire("a.test") > 0
+
+    def test_concurrent_waiters_are_spaced_out(self) -> None:
+        limiter = RateLimiter(max_per_second=50)
+        finished: list[float] = []
+
+        async def request() -> None:
+            await limiter.wait_if_needed("https://busy.test/page")
+            finished.append(time.monotonic())
+
+        async def go() -> float:
+            started = time.monotonic()
+            await asyncio.gather(*(request() for _ in range(60)))
+            return started
+
+        started = asyncio.run(go())
+
+        # 50 tokens are available at once; the other 10 follow at 50/s
+        assert sum(1 for t in finished if t - started < 0.01) == 50
+        assert 0.18 <= max(finished) - started < 0.5
+
+    def test_zero_means_unlimited(self) -> None:
+        limiter = RateLimiter(max_per_second=0)
+
+        assert all(limiter.try_acquire("a.test") == 0 for _ in range(100))
+
+
+class TestDomainScheduler:
+    """Tests for DomainScheduler"""
+
+    URLS = [f"https://github.com/repo{i}" for i in range(4)] + [
+        "https://a.test/",
+        "https://b.test/",
+    ]
+
+    def drain(self, scheduler: DomainScheduler) -> list:
+        order = []
+        while True:
+            url, _ = scheduler.take_ready()
+            if url is None:
+                return order
+            order.append(url)
+
+    def test_domains_take_turns(self) -> None:
+        scheduler = DomainScheduler(self.URLS, RateLimiter(max_per_second=0))
+
+        assert self.drain(scheduler) == [
+            "https://github.com/repo0",
+            "https://a.test/",
+            "https://b.test/",
+            "https://github.com/repo1",
+            "https://github.com/repo2",
+            "https://github.com/repo3",
+        ]
+        assert not scheduler.ring
+
+    def test_rate_limited_domain_does_not_block_others(self) -> None:
+        clock = FakeClock()
+        scheduler = DomainScheduler(
+            self.URLS, RateLimiter(max_per_second=1, clock=clock)
+        )
+
+        assert self.drain(scheduler) == [
+            "https://github.com/repo0",
+            "https://a.test/",
+            "https://b.test/",
+        ]
+        url, wait = scheduler.take_ready()
+        assert (url, wait) == (None, 1.0)
+
+        clock.now += 1
+        assert self.drain(scheduler) == ["https://github.com/repo1"]
+
+    def test_hosts_without_capacity_are_skipped(self) -> None:
+        host_limiter = HostLimiter(initial=1)
+        host_limiter.state("github.com").in_flight = 1
+        scheduler = DomainScheduler(
+            self.URLS, RateLimiter(max_per_second=0), host_limiter
+        )
+
+        assert self.drain(scheduler) == ["https://a.test/", "https://b.test/"]
+
+    def test_next_url_waits_for_tokens(self) -> None:
+        urls = [f"https://a.test/{i}" for i in range(5)]
+        scheduler = DomainScheduler(urls, RateLimiter(max_per_second=4))
+
+        async def go() -> list:
+            return [await scheduler.next_url() for _ in range(6)]
+
+        started = time.monotonic()
+        assert asyncio.run(go()) == urls + [None]
+        # The fifth URL needs a token 0.25s after the burst of four
+        assert 0.2 <= time.monotonic() - started < 0.6
+
+
+class TestCappedGet:
+    """The GET fallback requests a Range and reads at most max_get_bytes"""
+
+    def test_range_is_requested(self) -> None:
+        log: list = []
+
+        outcome = run_check("/large/ranged", log=log, max_get_bytes=1000)
+
+        assert outcome.status_code == 206
+        assert [method for method, _ in log] == ["HEAD", "GET"]
+        assert log[1][1]["Range"] == "bytes=0-999"
+        assert 1000 < outcome.bytes_received < 2000  # Body plus headers
+
+    def test_read_is_capped_when_range_is_ignored(self) -> None:
+        outcome = run_check("/large/ignored", max_get_bytes=1000)
+
+        assert outcome.status_code == 200
+        assert outcome.bytes_received < 2000
+
+    def test_unsatisfiable_range_is_retried_without_range(self) -> None:
+        log: list = []
+
+        outcome = run_check("/empty", log=log)
+
+        assert outcome.status_code == 200
+        assert ["Range" in headers for _, headers in log] == [False, True, False]
+
+    def test_bytes_transferred_counts_requested_urls_once(self) -> None:
+        results = [
+            url_check("https://a.test", 200),
+            url_check("https://a.test", 200),
+            url_check("https://b.test", 200),
+            url_check("https://c.test", 200, cached=True),
+        ]
+        for result, size in zip(results, [500, 500, 300, 999]):
+            result.bytes_received = size
+
+        assert bytes_transferred(results) == 800
+
+
+def closed_port() -> int:
+    """A local port with nothing listening on it."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def connector_error(os_error: OSError) -> ClientConnectorError:
+    key = SimpleNamespace(host="a.test", port=443, ssl=True)
+    return ClientConnectorError(key, os_error)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize(
+    "os_error, hard",
+    [
+        (socket.gaierror(socket.EAI_NONAME, "Name or service not known"), True),
+        (OSError(errno.ECONNREFUSED, "Connection refused"), True),
+        (socket.gaierror(socket.EAI_AGAIN, "Temporary failure"), False),
+        (OSError(errno.ECONNRESET, "Connection reset by peer"), False),
+    ],
+)
+def test_only_lasting_failures_mark_a_host_down(os_error: OSError, hard: bool) -> None:
+    assert is_hard_failure(connector_error(os_error)) is hard
+
+
+class TestHostHealth:
+    """A refused connection marks the host down for the rest of the run"""
+
+    def test_refused_host_is_not_retried_and_later_urls_short_circuit(self) -> None:
+        base = f"http://127.0.0.1:{closed_port()}"
+        health = HostHealth()
+
+        async def go() -> list:
+            async with ClientSession() as session:
+                return [
+                    await check_url(
+                        session,
+                        f"{base}/{i}",
+                        timeout=5,
+                        retries=3,
+                        rate_limiter=None,
+                        host_health=health,
+                    )
+                    for i in range(3)
+                ]
+
+        started = time.monotonic()
+        first, *rest = asyncio.run(go())
+
+        assert time.monotonic() - started < 1  # No 1s + 2s backoff
+        assert first.status_code == 0 and not first.short_circuited
+        assert all(outcome.short_circuited for outcome in rest)
+        assert "failed earlier" in (rest[0].error_message or "")
+        (row,) = health.report()
+        assert (row["host"], row["short_circuited"]) == ("127.0.0.1", 2)
+
+    def test_scheduler_hands_out_down_hosts_without_tokens(self) -> None:
+        clock = FakeClock()
+        health = HostHealth(down={"dead.test": "Connect call failed"})
+        urls = [f"https://dead.test/{i}" for i in range(3)] + ["https://a.test/"]
+        scheduler = DomainScheduler(
+            urls, RateLimiter(max_per_second=1, clock=clock), host_health=health
+        )
+
+        order = []
+        while (url := scheduler.take_ready()[0]) is not None:
+            order.append(url)
+
+        assert sorted(order) == sorted(urls)
+
+
+class TestSharding:
+    """Tests for --shard partitioning and --merge"""
+
+    URL_MAP = {
+        "data/agents/a.yml": [
+            ("https://github.com/a/a", "github_repo"),
+            ("https://a.test/", "url"),
+        ],
+        "docs/GUIDE.md": [(f"https://github.com/x/{i}", "direct") for i in range(5)]
+        + [(f"https://h{i}.test/", "direct") for i in range(6)],
+    }
+
+    def test_parse_shard(self) -> None:
+        assert parse_shard("2/4") == (2, 4)
+        for value in ["0/4", "5/4", "2", "a/b", "-1/4"]:
+            with pytest.raises(ValueError):
+                parse_shard(value)
+
+    def test_hosts_are_balanced_across_shards(self) -> None:
+        urls = [url for urls in self.URL_MAP.values() for url, _ in urls]
+
+        assignment = assign_shards(urls, 3)
+
+        # github.com (6 URLs) fills one shard; the 7 one-URL hosts share
+        # the other two
+        assert assignment["github.com"] == 1
+        loads = [0, 0, 0]
+        for url in urls:
+            loads[assignment[check_links.host_of(url)] - 1] += 1
+        assert loads == [6, 4, 3]
+        assert assign_shards(reversed(urls), 3) == assignment
+
+    def test_shards_partition_the_url_map(self) -> None:
+        shards = [select_shard(self.URL_MAP, i, 3) for i in (1, 2, 3)]
+
+        for file_path, urls in self.URL_MAP.items():
+            combined = [pair for shard in shards for pair in shard.get(file_path, [])]
+            assert sorted(combined) == sorted(urls)
+        hosts = [
+            {check_links.host_of(url) for urls in shard.values() for url, _ in urls}
+            for shard in shards
+        ]
+        assert not (hosts[0] & hosts[1] or hosts[0] & hosts[2] or hosts[1] & hosts[2])
+
+    def test_merged_report_matches_unsharded_report(self, tmp_path: Path) -> None:
+        results = [
+            url_check("https://a.test", 200),
+            url_check("https://a.test", 200),
+            url_check("https://b.test", 304),
+            url_check("https://c.test", 200, cached=True),
+        ]
+        results[1].source_file = "README.md"
+        results[2].bytes_received = 120
+        paths = [str(tmp_path / "1.json"), str(tmp_path / "2.json")]
+        save_report(results[:2], paths[0], host_report=[row("a.test", 2)], shard=(1, 2))
+        save_report(results[2:], paths[1], host_report=[row("b.test", 1)], shard=(2, 2))
+
+        merged, hosts, unreachable = load_shard_reports(paths)
+
+        assert merged == results
+        assert [h["host"] for h in hosts] == ["a.test", "b.test"]
+        assert unreachable == []
+        save_report(merged, str(tmp_path / "merged.json"))
+        report = json.loads((tmp_path / "merged.json").read_text())
+        assert report["summary"] == report_summary(results)
+        assert report["summary"]["bytes_transferred"] == 120
+
+    @pytest.mark.parametrize(
+        "shards, message",
+        [
+            ([(1, 3), (3, 3)], "missing shard reports: 2/3"),
+            ([(1, 2), (2, 2), (2, 2)], "shard 2/2 given twice"),
+            ([(1, 2), (2, 3)], "different shard counts"),
+            ([(1, 1), None], "not the report of a --shard run"),
+        ],
+    )
+    def test_merge_needs_every_shard_of_one_count(
+        self, tmp_path: Path, shards: list, message: str
+    ) -> None:
+        paths = []
+        for i, shard in enumerate(shards):
+            path = str(tmp_path / f"{i}.json")
+            save_report([url_check(f"https://{i}.test", 200)], path, shard=shard)
+            paths.append(path)
+
+        with pytest.raises(ValueError, match=message):
+            load_shard_reports(paths)
+        with pytest.raises(SystemExit) as exc:
+            merge_reports(paths, str(tmp_path / "merged.json"), create_issues=False)
+        assert exc.value.code == 2
+        assert not (tmp_path / "merged.json").exists()
+
+
+def row(host: str, requests: int) -> dict:
+    return {
+        "host": host,
+        "requests": requests,
+        "throttled": 0,
+        "final_limit": 4,
+        "peak_limit": 4,
+        "requests_per_second": None,
+    }
@@ -0,0 +1,190 @@
+"""
+Unit tests for scripts/host_limiter.py
+
+Tests for:
+- Retry-After parsing
+- additive increase on fast successes, multiplicative decrease on throttling
+- concurrency capped at the host limit and Retry-After blocking new requests
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from host_limiter import HostLimiter, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+async def finish(limiter: HostLimiter, url: str, status: int, seconds: float = 0.1):
+    clock = limiter.clock
+    assert isinstance(clock, FakeClock)
+    async with limiter.slot(url) as slot:
+        clock.now += seconds
+        slot.record(status)
+
+
+class TestParseRetryAfter:
+    """Tests for parse_retry_after()"""
+
+    def test_seconds(self) -> None:
+        assert parse_retry_after("120") == 120.0
+        assert parse_retry_after(" 5 ") == 5.0
+
+    def test_http_date(self) -> None:
+        now = 1445412480.0  # Wed, 21 Oct 2015 07:28:00 GMT
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:30 GMT", now=now) == 30.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:27:00 GMT", now=now) == 0.0
+
+    def test_missing_or_invalid(self) -> None:
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after("soon") is None
+
+
+class TestAimd:
+    """Tests for how HostLimiter adapts limits"""
+
+    def test_fast_successes_raise_the_limit(self) -> None:
+        limiter = HostLimiter(initial=2, clock=FakeClock())
+
+        async def go() -> None:
+            for _ in range(4):
+                await finish(limiter, "https://fast.test/x", 200)
+
+        asyncio.run(go())
+
+        # 2 -> 2.5 -> 2.9 -> 3.24... -> 3.55...
+        assert 3.5 < limiter.hosts["fast.test"].limit < 3.6
+        assert limiter.hosts["fast.test"].peak_limit == limiter.hosts["fast.test"].limit
+
+    def test_slow_successes_and_other_statuses_keep_the_limit(self) -> None:
+        limiter = HostLimiter(initial=2, fast_seconds=1, clock=FakeClock())
+
+        async def go() -> None:
+            await finish(limiter, "https://slow.test/", 200, seconds=5)
+            await finish(limiter, "https://slow.test/", 404)
+
+        asyncio.run(go())
+
+        assert limiter.hosts["slow.test"].limit == 2
+
+    def test_throttling_halves_once_per_round(self) -> None:
+        clock = FakeClock()
+        limiter = HostLimiter(initial=8, clock=clock)
+
+        async def go() -> None:
+            # Four requests in flight together all get 429
+            slots = [limiter.slot("https://busy.test/") for _ in range(4)]
+            for slot in slots:
+                await slot.__aenter__()
+            clock.now += 0.5
+            for slot in slots:
+                slot.record(429)
+                await slot.__aexit__(None, None, None)
+            # A request sent after the decrease halves it again
+            await finish(limiter, "https://busy.test/", 503)
+
+        asyncio.run(go())
+
+        state = limiter.hosts["busy.test"]
+        assert state.limit == 2
+        assert state.throttled == 5
+
+    def test_timeouts_count_as_throttling(self) -> None:
+        limiter = HostLimiter(initial=4, clock=FakeClock())
+
+        async def go() -> None:
+            try:
+                async with limiter.slot("https://hang.test/"):
+                    raise asyncio.TimeoutError
+            except asyncio.TimeoutError:
+                pass
+
+        asyncio.run(go())
+
+        assert limiter.hosts["hang.test"].limit == 2
+        assert limiter.hosts["hang.test"].in_flight == 0
+
+    def test_limit_never_drops_below_minimum(self) -> None:
+        limiter = HostLimiter(initial=1, minimum=1, clock=FakeClock())
+
+        async def go() -> None:
+            for _ in range(3):
+                await finish(limiter, "https://tiny.test/", 429)
+
+        asyncio.run(go())
+
+        assert limiter.hosts["tiny.test"].limit == 1
+
+
+class TestScheduling:
+    """Tests for HostLimiter.acquire() under concurrency"""
+
+    def test_in_flight_requests_stay_within_the_limit(self) -> None:
+        limiter = HostLimiter(initial=3, maximum=3)
+        in_flight = 0
+        peak = 0
+
+        async def request() -> None:
+            nonlocal in_flight, peak
+            async with limiter.slot("https://one.test/") as slot:
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0.005)
+                in_flight -= 1
+                slot.record(200)
+
+        async def go() -> None:
+            await asyncio.gather(*(request() for _ in range(12)))
+
+        asyncio.run(go())
+
+        assert peak == 3
+        assert limiter.report()[0]["requests"] == 12
+
+    def test_retry_after_blocks_the_host_only(self) -> None:
+        limiter = HostLimiter(initial=4)
+
+        async def go() -> tuple[float, float]:
+            async with limiter.slot("https://limited.test/") as slot:
+                slot.record(429)
+                slot.retry_after = 0.1
+            started = time.monotonic()
+            async with limiter.slot("https://other.test/"):
+                pass
+            other = time.monotonic() - started
+            async with limiter.slot("https://limited.test/"):
+                pass
+            return other, time.monotonic() - started
+
+        other, limited = asyncio.run(go())
+
+        assert other < 0.05
+        assert limited >= 0.09
+
+    def test_report_orders_busiest_hosts_first(self) -> None:
+        limiter = HostLimiter(clock=FakeClock())
+
+        async def go() -> None:
+            await finish(limiter, "https://b.test/", 200)
+            await finish(limiter, "https://a.test/", 200)
+            await finish(limiter, "https://a.test/", 429)
+
+        asyncio.run(go())
+
+        report = limiter.report()
+        assert [row["host"] for row in report] == ["a.test", "b.test"]
+        assert report[0]["requests"] == 2
+        assert report[0]["throttled"] == 1
+        assert report[0]["requests_per_second"] == 10.0
@@ -0,0 +1,204 @@
+"""
+Tests for scripts/link_cache.py and its use in check_links.check_all_urls()
+
+Tests for:
+- storing and reading back cached link results
+- per-status TTLs deciding which results are fresh
+- merging the caches of --shard runs, keeping the newer result of each URL
+- check_all_urls() reusing fresh results and re-checking stale ones
+"""
+
+import asyncio
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import check_links
+from check_links import CheckOutcome, check_all_urls, merge_link_caches
+from link_cache import LINK_CACHE_VERSION, CacheTTLs, CachedLink, LinkCache
+
+NOW = 1_800_000_000.0
+HOUR = 3600
+
+
+def cached(url: str, status: str, age_hours: float, now: float = NOW) -> CachedLink:
+    return CachedLink(
+        url=url,
+        status=status,
+        status_code={"success": 200, "warning": 429, "error": 404}[status],
+        error_message=None,
+        final_url=url + "/",
+        checked_at=now - age_hours * HOUR,
+        etag='"abc"',
+        last_modified="Wed, 21 Oct 2015 07:28:00 GMT",
+    )
+
+
+@pytest.fixture
+def cache(tmp_path: Path):
+    with LinkCache(tmp_path / "links.sqlite3") as link_cache:
+        yield link_cache
+
+
+class TestLinkCache:
+    """Tests for LinkCache"""
+
+    def test_round_trip(self, cache: LinkCache) -> None:
+        link = cached("https://a.test", "success", 1)
+        cache.store(link)
+
+        assert cache.get("https://a.test") == link
+        assert cache.get("https://missing.test") is None
+
+    def test_store_replaces_previous_result(self, cache: LinkCache) -> None:
+        cache.store(cached("https://a.test", "error", 5))
+        cache.store(cached("https://a.test", "success", 0))
+
+        assert cache.lookup(["https://a.test"])["https://a.test"].status == "success"
+
+    def test_results_survive_reopening(self, tmp_path: Path) -> None:
+        path = tmp_path / "links.sqlite3"
+        with LinkCache(path) as link_cache:
+            link_cache.store(cached("https://a.test", "success", 1))
+
+        with LinkCache(path) as link_cache:
+            assert link_cache.get("https://a.test") is not None
+
+    def test_other_versions_are_discarded(self, tmp_path: Path) -> None:
+        path = tmp_path / "links.sqlite3"
+        with LinkCache(path) as link_cache:
+            link_cache.store(cached("https://a.test", "success", 1))
+        connection = sqlite3.connect(path)
+        connection.execute(f"PRAGMA user_version = {LINK_CACHE_VERSION + 1}")
+        connection.close()
+
+        with LinkCache(path) as link_cache:
+            assert link_cache.get("https://a.test") is None
+
+    def test_merge_keeps_the_newer_result(
+        self, cache: LinkCache, tmp_path: Path
+    ) -> None:
+        cache.store(cached("https://a.test", "success", 1))
+        cache.store(cached("https://b.test", "error", 5))
+        with LinkCache(tmp_path / "shard.sqlite3") as shard:
+            shard.store(cached("https://a.test", "error", 3))
+            shard.store(cached("https://b.test", "success", 2))
+            shard.store(cached("https://c.test", "warning", 1))
+
+        assert cache.merge(tmp_path / "shard.sqlite3") == 2
+
+        assert cache.get("https://a.test") == cached("https://a.test", "success", 1)
+        assert cache.get("https://b.test") == cached("https://b.test", "success", 2)
+        assert cache.get("https://c.test") is not None
+
+    def test_merge_ignores_other_versions(
+        self, cache: LinkCache, tmp_path: Path
+    ) -> None:
+        path = tmp_path / "shard.sqlite3"
+        with LinkCache(path) as shard:
+            shard.store(cached("https://a.test", "success", 1))
+        connection = sqlite3.connect(path)
+        connection.execute(f"PRAGMA user_version = {LINK_CACHE_VERSION + 1}")
+        connection.close()
+
+        assert cache.merge(path) == 0
+        assert cache.get("https://a.test") is None
+
+    def test_merge_link_caches_skips_missing_files(self, tmp_path: Path) -> None:
+        with LinkCache(tmp_path / "1" / "link-results.sqlite3") as shard:
+            shard.store(cached("https://a.test", "success", 1))
+        paths = [str(tmp_path / n / "link-results.sqlite3") for n in ("1", "2")]
+
+        merge_link_caches(paths, tmp_path / "links.sqlite3")
+
+        with LinkCache(tmp_path / "links.sqlite3") as merged:
+            assert merged.get("https://a.test") is not None
+
+    def test_ttl_depends_on_status(self, cache: LinkCache) -> None:
+        ttls = CacheTTLs(success=24 * HOUR, warning=6 * HOUR, error=1 * HOUR)
+        for link in [
+            cached("https://ok.test", "success", 20),
+            cached("https://old.test", "success", 30),
+            cached("https://slow.test", "warning", 5),
+            cached("https://limited.test", "warning", 7),
+            cached("https://gone.test", "error", 2),
+        ]:
+            cache.store(link)
+
+        fresh = cache.fresh(
+            [
+                "https://ok.test",
+                "https://old.test",
+                "https://slow.test",
+                "https://limited.test",
+                "https://gone.test",
+                "https://new.test",
+            ],
+            ttls,
+            now=NOW,
+        )
+
+        assert sorted(fresh) == ["https://ok.test", "https://slow.test"]
+
+
+class TestCheckAllUrlsWithCache:
+    """check_all_urls() only requests URLs without a fresh cached result"""
+
+    def run(self, cache: LinkCache, monkeypatch: pytest.MonkeyPatch, ttls: CacheTTLs):
+        requested: list[str] = []
+
+        async def fake_check_url(session, url, *args, **kwargs) -> CheckOutcome:
+            requested.append(url)
+            return CheckOutcome(200, None, final_url=url, etag='"new"')
+
+        monkeypatch.setattr(check_links, "check_url", fake_check_url)
+        url_map = {
+            "data/agents/a.yml": [("https://fresh.test", "url")],
+            "docs/GUIDE.md": [
+                ("https://fresh.test", "direct"),
+                ("https://stale.test", "direct"),
+            ],
+        }
+        results = asyncio.run(
+            check_all_urls(
+                url_map,
+                timeout=1,
+                retries=1,
+                rate_limit=5,
+                skip_domains=set(),
+                skip_urls=set(),
+                cache=cache,
+                cache_ttls=ttls,
+            )
+        )
+        return requested, results
+
+    def test_fresh_results_are_reused(
+        self, cache: LinkCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        cache.store(cached("https://fresh.test", "warning", 0, time.time()))
+        cache.store(cached("https://stale.test", "success", 100, time.time()))
+
+        requested, results = self.run(cache, monkeypatch, CacheTTLs())
+
+        assert requested == ["https://stale.test"]
+        reused = [r for r in results if r.url == "https://fresh.test"]
+        assert len(reused) == 2
+        assert all(r.cached and r.status_code == 429 for r in reused)
+        assert {r.source_type for r in reused} == {"yaml", "markdown"}
+
+    def test_checked_results_are_stored(
+        self, cache: LinkCache, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        requested, _ = self.run(cache, monkeypatch, CacheTTLs())
+
+        assert sorted(requested) == ["https://fresh.test", "https://stale.test"]
+        stored = cache.get("https://stale.test")
+        assert stored is not None
+        assert (stored.status, stored.status_code, stored.etag) == ("success", 200, '"new"')
@@ -0,0 +1,194 @@
+"""
+Tests for scripts/link_checkpoint.py and checkpointed check_links runs
+
+Tests for:
+- appending and streaming checkpoint records, including after a killed run
+- not resuming checkpoints of another revision, too old, or without a header
+- check_all_urls() writing results to the checkpoint and resuming from it
+- save_report() building the same report from a checkpoint as from a list
+"""
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import check_links
+from check_links import CheckOutcome, CheckpointResults, check_all_urls, save_report
+from link_checkpoint import LinkCheckpoint
+
+URL_LINE = '{"url": "https://a.test"}\n'
+
+
+def header(revision: str | None = None, created_at: float | None = None) -> str:
+    stamp = {"revision": revision, "created_at": created_at or time.time()}
+    return json.dumps(stamp) + "\n"
+
+
+URL_MAP = {
+    "data/agents/a.yml": [("https://a.test", "url"), ("https://b.test", "demo_url")],
+    "docs/GUIDE.md": [("https://a.test", "direct"), ("https://gone.test", "direct")],
+}
+
+
+class TestLinkCheckpoint:
+    """Tests for LinkCheckpoint"""
+
+    def test_records_round_trip(self, tmp_path: Path) -> None:
+        with LinkCheckpoint(tmp_path / "c.jsonl") as checkpoint:
+            checkpoint.append({"url": "https://a.test", "status": "success"})
+            checkpoint.append({"url": "https://b.test", "status": "error"})
+
+            assert [r["url"] for r in checkpoint.records()] == [
+                "https://a.test",
+                "https://b.test",
+            ]
+            assert checkpoint.checked_urls() == {"https://a.test", "https://b.test"}
+
+    def test_new_run_starts_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.jsonl"
+        with LinkCheckpoint(path) as checkpoint:
+            checkpoint.append({"url": "https://a.test"})
+
+        with LinkCheckpoint(path) as checkpoint:
+            assert checkpoint.checked_urls() == set()
+
+    def test_resume_drops_a_line_cut_short(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.jsonl"
+        path.write_text(header() + '{"url": "https://a.test"}\n{"url": "https://b.te')
+
+        with LinkCheckpoint(path, resume=True) as checkpoint:
+            assert checkpoint.checked_urls() == {"https://a.test"}
+            checkpoint.append({"url": "https://c.test"})
+            assert checkpoint.checked_urls() == {"https://a.test", "https://c.test"}
+
+    def test_resume_same_revision(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.jsonl"
+        with LinkCheckpoint(path, revision="abc") as checkpoint:
+            checkpoint.append({"url": "https://a.test"})
+
+        with LinkCheckpoint(path, True, revision="abc", max_age=60) as checkpoint:
+            assert checkpoint.discarded is None
+            assert checkpoint.checked_urls() == {"https://a.test"}
+
+    def test_other_revision_is_not_resumed(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.jsonl"
+        path.write_text(header(revision="0123456789abcdef") + URL_LINE)
+
+        with LinkCheckpoint(path, resume=True, revision="fedcba9876543210") as c:
+            assert c.discarded == "it is for revision 0123456789ab, not fedcba987654"
+            assert c.checked_urls() == set()
+
+    def test_old_checkpoint_is_not_resumed(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.jsonl"
+        path.write_text(header(created_at=time.time() - 100 * 3600) + URL_LINE)
+
+        with LinkCheckpoint(path, resume=True, max_age=72 * 3600) as checkpoint:
+            assert checkpoint.discarded == "it is 100h old (limit 72h)"
+            assert checkpoint.checked_urls() == set()
+
+    def test_checkpoint_without_header_is_not_resumed(self, tmp_path: Path) -> None:
+        path = tmp_path / "c.jsonl"
+        path.write_text(URL_LINE)
+
+        with LinkCheckpoint(path, resume=True) as checkpoint:
+            assert checkpoint.discarded == "it has no header"
+            assert checkpoint.checked_urls() == set()
+
+    def test_remove(self, tmp_path: Path) -> None:
+        checkpoint = LinkCheckpoint(tmp_path / "c.jsonl")
+        checkpoint.remove()
+
+        assert not (tmp_path / "c.jsonl").exists()
+
+
+def run(checkpoint: LinkCheckpoint, monkeypatch: pytest.MonkeyPatch) -> tuple:
+    requested: list[str] = []
+
+    async def fake_check_url(session, url, *args, **kwargs) -> CheckOutcome:
+        requested.append(url)
+        return CheckOutcome(404 if "gone" in url else 200, None)
+
+    monkeypatch.setattr(check_links, "check_url", fake_check_url)
+    results = asyncio.run(
+        check_all_urls(
+            URL_MAP,
+            timeout=1,
+            retries=1,
+            rate_limit=0,
+            skip_domains=set(),
+            skip_urls=set(),
+            checkpoint=checkpoint,
+        )
+    )
+    return requested, results
+
+
+class TestCheckpointedRun:
+    """check_all_urls() with a checkpoint"""
+
+    def test_results_stream_from_the_checkpoint(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        with LinkCheckpoint(tmp_path / "c.jsonl") as checkpoint:
+            _, results = run(checkpoint, monkeypatch)
+
+            assert isinstance(results, CheckpointResults)
+            rows = sorted((r.url, r.source_file, r.status) for r in results)
+            # One line per URL, expanded to one result per source
+            assert len(list(checkpoint.records())) == 3
+
+        assert rows == [
+            ("https://a.test", "data/agents/a.yml", "success"),
+            ("https://a.test", "docs/GUIDE.md", "success"),
+            ("https://b.test", "data/agents/a.yml", "success"),
+            ("https://gone.test", "docs/GUIDE.md", "error"),
+        ]
+
+    def test_resume_skips_checked_urls(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        path = tmp_path / "c.jsonl"
+        with LinkCheckpoint(path) as checkpoint:
+            CheckpointResults(checkpoint).extend(
+                check_links.url_checks_for(
+                    "https://a.test",
+                    [("data/agents/a.yml", "url"), ("docs/GUIDE.md", "direct")],
+                    "success",
+                    200,
+                    None,
+                )
+            )
+
+        with LinkCheckpoint(path, resume=True) as checkpoint:
+            requested, results = run(checkpoint, monkeypatch)
+
+            assert sorted(requested) == ["https://b.test", "https://gone.test"]
+            assert sorted({r.url for r in results}) == [
+                "https://a.test",
+                "https://b.test",
+                "https://gone.test",
+            ]
+
+
+def test_report_from_checkpoint_matches_report_from_list(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    with LinkCheckpoint(tmp_path / "c.jsonl") as checkpoint:
+        _, results = run(checkpoint, monkeypatch)
+        save_report(results, str(tmp_path / "streamed.json"), host_report=[])
+        save_report(list(results), str(tmp_path / "listed.json"), host_report=[])
+
+    streamed = json.loads((tmp_path / "streamed.json").read_text())
+    listed = json.loads((tmp_path / "listed.json").read_text())
+    assert streamed["summary"] == listed["summary"]
+    assert streamed["results"] == listed["results"]
+    assert streamed["summary"]["total"] == 4
+    assert streamed["summary"]["errors"] == 1
+    assert streamed["hosts"] == []
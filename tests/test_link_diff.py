@@ -0,0 +1,133 @@
+"""
+Tests for scripts/link_diff.py and check_all_urls() in --since mode
+
+Tests for:
+- URLs added or changed since a revision, committed or not
+- files and URLs that did not change being left out
+- check_all_urls() requesting only changed URLs and reusing the cache otherwise
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import check_links
+from check_links import CheckOutcome, check_all_urls, extract_urls_from_file
+from link_cache import CachedLink, LinkCache
+from link_diff import GitDiffError, changed_urls
+
+AGENT = """name: Example
+url: https://example.org/{slug}
+description: An example agent
+category: frameworks
+"""
+
+
+def git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+    )
+
+
+def url_map(repo: Path) -> dict:
+    files = sorted(
+        path for path in repo.rglob("*") if path.is_file() and ".git" not in path.parts
+    )
+    return {
+        path.relative_to(repo).as_posix(): extract_urls_from_file(path)
+        for path in files
+    }
+
+
+@pytest.fixture
+def repo(tmp_path: Path) -> Path:
+    (tmp_path / "data" / "agents").mkdir(parents=True)
+    (tmp_path / "data" / "agents" / "a.yml").write_text(AGENT.format(slug="a"))
+    (tmp_path / "docs").mkdir()
+    (tmp_path / "docs" / "GUIDE.md").write_text(
+        "See [docs](https://docs.test/one) and https://docs.test/two\n"
+    )
+    git(tmp_path, "init", "-q", "-b", "main")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "base")
+    return tmp_path
+
+
+class TestChangedUrls:
+    """Tests for changed_urls()"""
+
+    def test_only_new_urls_in_changed_files(self, repo: Path) -> None:
+        git(repo, "checkout", "-q", "-b", "feature")
+        (repo / "docs" / "GUIDE.md").write_text(
+            "See [docs](https://docs.test/one) and https://docs.test/three\n"
+        )
+        git(repo, "commit", "-q", "-am", "change guide")
+        # Uncommitted and untracked files count too
+        (repo / "data" / "agents" / "b.yml").write_text(AGENT.format(slug="b"))
+
+        urls, files = changed_urls(repo, "main", url_map(repo), extract_urls_from_file)
+
+        assert urls == {"https://docs.test/three", "https://example.org/b"}
+        assert files == ["data/agents/b.yml", "docs/GUIDE.md"]
+
+    def test_nothing_changed(self, repo: Path) -> None:
+        assert changed_urls(repo, "HEAD", url_map(repo), extract_urls_from_file) == (
+            set(),
+            [],
+        )
+
+    def test_unknown_revision(self, repo: Path) -> None:
+        with pytest.raises(GitDiffError):
+            changed_urls(repo, "no-such-branch", url_map(repo), extract_urls_from_file)
+
+
+def test_check_all_urls_requests_only_changed_urls(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    requested: list[str] = []
+
+    async def fake_check_url(session, url, *args, **kwargs) -> CheckOutcome:
+        requested.append(url)
+        return CheckOutcome(200, None, final_url=url)
+
+    monkeypatch.setattr(check_links, "check_url", fake_check_url)
+    with LinkCache(tmp_path / "links.sqlite3") as cache:
+        for url in ["https://old.test", "https://changed.test"]:
+            # Long past every TTL; --since reuses it anyway
+            cache.store(CachedLink(url, "error", 404, None, None, 0.0))
+        results = asyncio.run(
+            check_all_urls(
+                {
+                    "docs/GUIDE.md": [
+                        ("https://old.test", "direct"),
+                        ("https://changed.test", "direct"),
+                        ("https://uncached.test", "direct"),
+                    ]
+                },
+                timeout=1,
+                retries=1,
+                rate_limit=0,
+                skip_domains=set(),
+                skip_urls=set(),
+                cache=cache,
+                changed={"https://changed.test"},
+            )
+        )
+        stored = cache.get("https://changed.test")
+
+    assert requested == ["https://changed.test"]
+    assert {r.url: (r.status, r.cached) for r in results} == {
+        "https://old.test": ("error", True),
+        "https://changed.test": ("success", False),
+    }
+    assert stored is not None and stored.checked_at > time.time() - 60
@@ -0,0 +1,152 @@
+"""
+Unit tests for scripts/precompress.py
+
+Tests for:
+- gzip siblings above the size threshold, byte-identical between builds
+- skipping outputs whose siblings are already current, by mtime and size
+- deleting siblings of removed outputs
+- pruning stale siblings when compression is off
+"""
+
+import gzip
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import precompress
+from precompress import BROTLI_AVAILABLE, precompress_tree, prune_stale_siblings
+from site_manifest import write_if_changed
+
+
+@pytest.fixture
+def output_dir(tmp_path: Path) -> Path:
+    site = tmp_path / "_site"
+    (site / "static" / "js").mkdir(parents=True)
+    (site / "index.html").write_text("<p>hello</p>\n" * 200)
+    (site / "static" / "js" / "main.js").write_text("console.log(1);\n" * 200)
+    (site / "tiny.json").write_text("{}")
+    (site / "logo.png").write_bytes(b"\x89PNG" * 500)
+    return site
+
+
+class TestPrecompressTree:
+    """Tests for precompress_tree()"""
+
+    def test_compresses_large_text_outputs_only(self, output_dir: Path) -> None:
+        report = precompress_tree(output_dir, jobs=1)
+
+        assert gzip.decompress((output_dir / "index.html.gz").read_bytes()) == (
+            output_dir / "index.html"
+        ).read_bytes()
+        assert (output_dir / "static" / "js" / "main.js.gz").exists()
+        assert not (output_dir / "tiny.json.gz").exists()
+        assert not (output_dir / "logo.png.gz").exists()
+        assert (report.compressed, report.unchanged, report.deleted) == (2, 0, 0)
+        assert report.gzip_bytes < report.original_bytes
+
+    def test_current_siblings_are_not_recompressed(self, output_dir: Path) -> None:
+        precompress_tree(output_dir, jobs=1)
+        sibling = output_dir / "index.html.gz"
+        before = sibling.read_bytes()
+
+        report = precompress_tree(output_dir, jobs=1)
+
+        assert (report.compressed, report.unchanged) == (0, 2)
+        assert sibling.read_bytes() == before
+
+    def test_changed_output_is_recompressed(self, output_dir: Path) -> None:
+        precompress_tree(output_dir, jobs=1)
+        page = output_dir / "index.html"
+        page.write_text("<p>changed</p>\n" * 200)
+        os.utime(page, ns=(2_000_000_000, 2_000_000_000))
+
+        report = precompress_tree(output_dir, jobs=1)
+
+        assert report.compressed == 1
+        assert gzip.decompress((output_dir / "index.html.gz").read_bytes()) == (
+            page.read_bytes()
+        )
+
+    def test_resized_output_with_same_mtime_is_recompressed(
+        self, output_dir: Path
+    ) -> None:
+        precompress_tree(output_dir, jobs=1)
+        page = output_dir / "index.html"
+        mtime = page.stat().st_mtime_ns
+        # A coarse-timestamp filesystem can leave a rewritten file's mtime as is
+        page.write_text("<p>changed</p>\n" * 300)
+        os.utime(page, ns=(mtime, mtime))
+
+        report = precompress_tree(output_dir, jobs=1)
+
+        assert report.compressed == 1
+        assert gzip.decompress((output_dir / "index.html.gz").read_bytes()) == (
+            page.read_bytes()
+        )
+
+    def test_output_is_deterministic(self, output_dir: Path) -> None:
+        precompress_tree(output_dir, jobs=1)
+        first = (output_dir / "index.html.gz").read_bytes()
+        (output_dir / "index.html.gz").unlink()
+
+        precompress_tree(output_dir, jobs=1)
+
+        assert (output_dir / "index.html.gz").read_bytes() == first
+
+    def test_orphaned_siblings_are_deleted(self, output_dir: Path) -> None:
+        precompress_tree(output_dir, jobs=1)
+        (output_dir / "index.html").unlink()
+
+        report = precompress_tree(output_dir, jobs=1)
+
+        assert not (output_dir / "index.html.gz").exists()
+        assert report.deleted == 1
+
+    def test_parallel_matches_serial(
+        self, output_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(precompress, "PARALLEL_THRESHOLD", 1)
+
+        report = precompress_tree(output_dir, jobs=2)
+
+        assert report.compressed == 2
+        assert gzip.decompress(
+            (output_dir / "static" / "js" / "main.js.gz").read_bytes()
+        ) == (output_dir / "static" / "js" / "main.js").read_bytes()
+
+    @pytest.mark.skipif(not BROTLI_AVAILABLE, reason="brotli is not installed")
+    def test_brotli_siblings(self, output_dir: Path) -> None:
+        import brotli
+
+        report = precompress_tree(output_dir, jobs=1)
+
+        assert brotli.decompress((output_dir / "index.html.br").read_bytes()) == (
+            output_dir / "index.html"
+        ).read_bytes()
+        assert report.brotli_bytes > 0
+
+
+class TestPruneStaleSiblings:
+    """Tests for prune_stale_siblings()"""
+
+    def test_rewritten_output_loses_its_siblings(self, output_dir: Path) -> None:
+        precompress_tree(output_dir, jobs=1)
+        (output_dir / "static" / "js" / "main.js").unlink()
+        assert write_if_changed(output_dir / "index.html", "<p>changed</p>\n" * 200)
+
+        assert prune_stale_siblings(output_dir) == 2
+
+        assert not (output_dir / "index.html.gz").exists()
+        assert not (output_dir / "static" / "js" / "main.js.gz").exists()
+
+    def test_current_siblings_are_kept(self, output_dir: Path) -> None:
+        precompress_tree(output_dir, jobs=1)
+        assert not write_if_changed(output_dir / "index.html", "<p>hello</p>\n" * 200)
+
+        assert prune_stale_siblings(output_dir) == 0
+        assert (output_dir / "index.html.gz").exists()
@@ -0,0 +1,366 @@
+"""
+Unit tests for scripts/search_engine.py
+
+Tests for:
+- field scoring and ranking of SearchEngine.search(), by substring
+- loading the sharded index and the full search-index.json alike
+- parity with performSearch() in static/js/search.js on a fixed query set
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from search_engine import SearchEngine, decode_postings
+from search_index import SEARCH_INDEX_FILENAME, build_search_files, delta_encode
+
+REPO_ROOT = Path(__file__).parent.parent
+
+# Exact names, prefixes, multi-word queries, punctuation and misses
+PARITY_QUERIES = [
+    "agent",
+    "ag",
+    "code review",
+    "Code Review",
+    "langchain",
+    "python web",
+    "browser",
+    "rag",
+    "next",
+    "Next.js",
+    "open source llm",
+    "devin",
+    "cursor",
+    "ai",
+    "c++",
+    "machine-learning",
+    "react native",
+    "fastapi",
+    "cli tool",
+    "test",
+    "docs",
+    "free",
+    "framework",
+    "  spaced   out  ",
+    "a",
+    "zz",
+    "qqqq",
+]
+
+NODE_HARNESS = r"""
+const fs = require('fs');
+const vm = require('vm');
+const [script, root, queriesPath] = process.argv.slice(2);
+const context = {
+    console: { log() {}, warn() {}, error: console.error },
+    window: { BASE_URL: '' },
+    document: { addEventListener() {} },
+    fetch: async (url) => {
+        const path = root + '/' + url.replace(/^\//, '');
+        if (!fs.existsSync(path)) return { ok: false, status: 404 };
+        const text = fs.readFileSync(path, 'utf8');
+        return { ok: true, json: async () => JSON.parse(text) };
+    },
+};
+vm.createContext(context);
+vm.runInContext(
+    fs.readFileSync(script, 'utf8') +
+        '\n;this.performSearch = performSearch; this.loadSearchIndex = loadSearchIndex;',
+    context
+);
+(async () => {
+    let detailsLoaded;
+    const details = new Promise(resolve => { detailsLoaded = resolve; });
+    await context.loadSearchIndex(detailsLoaded);
+    await details;
+    const queries = JSON.parse(fs.readFileSync(queriesPath, 'utf8'));
+    const results = queries.map(query =>
+        context.performSearch(query).map(result => [result.name, result.score])
+    );
+    process.stdout.write(JSON.stringify(results));
+})();
+"""
+
+# performSearch() as it was before the inverted index, the reference search.js
+# has to keep matching: whitespace tokens and substring matches on every field
+BASELINE_SEARCH_JS = r"""
+let searchIndex = null;
+
+function tokenizeQuery(query) {
+    return query.toLowerCase().trim().split(/\s+/).filter(token => token.length >= 2);
+}
+
+function tokenMatchesText(token, text) {
+    if (!text) return false;
+    const lower = text.toLowerCase();
+    if (lower.includes(token)) return true;
+    return lower.split(/[^a-z0-9]+/).some(word => word.startsWith(token));
+}
+
+async function loadSearchIndex(onDetailsLoaded) {
+    const response = await fetch('/search-index.json');
+    searchIndex = await response.json();
+    onDetailsLoaded();
+}
+
+function performSearch(query) {
+    if (!searchIndex || searchIndex.length === 0) return [];
+    if (!query || query.trim().length < 2) return [];
+    const searchTerm = query.toLowerCase().trim();
+    const tokens = tokenizeQuery(query);
+    if (tokens.length === 0) return [];
+    const results = [];
+    searchIndex.forEach(entry => {
+        let score = 0;
+        let matchedTokens = 0;
+        const name = entry.name.toLowerCase();
+        const description = entry.description.toLowerCase();
+        const tags = entry.tags ? entry.tags.map(tag => tag.toLowerCase()) : [];
+        const category = entry.category ? entry.category.toLowerCase() : '';
+        const type = entry.type ? entry.type.toLowerCase() : '';
+        tokens.forEach(token => {
+            let tokenScore = 0;
+            if (name === token) tokenScore += 90;
+            else if (name.startsWith(token)) tokenScore += 60;
+            else if (name.includes(token)) tokenScore += 40;
+            if (tokenMatchesText(token, description)) tokenScore += 20;
+            if (tags.some(tag => tag === token)) tokenScore += 30;
+            else if (tags.some(tag => tag.startsWith(token))) tokenScore += 15;
+            else if (tags.some(tag => tag.includes(token))) tokenScore += 10;
+            if (tokenMatchesText(token, category)) tokenScore += 10;
+            if (tokenMatchesText(token, type)) tokenScore += 10;
+            if (tokenScore > 0) {
+                score += tokenScore;
+                matchedTokens += 1;
+            }
+        });
+        if (name === searchTerm) score += 50;
+        if (score > 0 && matchedTokens === tokens.length) results.push({ ...entry, score });
+    });
+    return results.sort((a, b) => b.score - a.score).slice(0, 10);
+}
+"""
+
+# Substrings inside words, punctuation and one-letter parts that the baseline
+# matched and a prefix-only index would miss
+SUBSTRING_QUERIES = [
+    "chain",
+    "gpt",
+    "agent-e",
+    "index",
+    "llama index",
+    "node.js",
+    "c#",
+    "gpt-4",
+    "auto-gpt",
+    "e2e",
+    "ai/ml",
+    "open-source",
+    "(beta)",
+    "--",
+]
+
+
+def entry(name: str, **fields) -> dict:
+    data = {
+        "name": name,
+        "url": f"https://example.com/{name.lower().replace(' ', '-')}",
+        "description": f"{name} helps developers.",
+        "category": "coding",
+        "category_title": "Coding Agents",
+        "type": "assistant",
+        "tags": [],
+    }
+    data.update(fields)
+    return data
+
+
+ENTRIES = [
+    entry("Code Rabbit", tags=["code-review"], description="Reviews pull requests."),
+    entry("Review Bot", tags=["review"], type="code-review"),
+    entry("Coder", description="Writes code for you."),
+    entry("Starter", category="web", category_title="Web", is_boilerplate=True),
+]
+
+
+def ranked(engine: SearchEngine, query: str) -> list[tuple[str, int]]:
+    return [(result.entry["name"], result.score) for result in engine.search(query)]
+
+
+def write_site(output_dir: Path, entries: list[dict]) -> Path:
+    for relative, content in build_search_files(entries, shard_size=2).items():
+        path = output_dir / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content, encoding="utf-8")
+    return output_dir
+
+
+class TestSearch:
+    """Tests for SearchEngine.search()"""
+
+    def test_field_scores(self) -> None:
+        engine = SearchEngine.from_entries(ENTRIES)
+
+        # Coder: name prefix 60 + description 20; Code Rabbit: name prefix 60 +
+        # tag prefix 15; Review Bot: type 10
+        assert ranked(engine, "code") == [
+            ("Coder", 80),
+            ("Code Rabbit", 75),
+            ("Review Bot", 10),
+        ]
+
+    def test_exact_name_and_whole_query_bonus(self) -> None:
+        engine = SearchEngine.from_entries(ENTRIES)
+
+        # name 90 + name_query 50
+        assert ranked(engine, "Coder") == [("Coder", 140)]
+
+    def test_tokens_match_inside_words(self) -> None:
+        engine = SearchEngine.from_entries(ENTRIES)
+
+        assert ranked(engine, "abbi") == [("Code Rabbit", 40)]
+        # Review Bot: name 40 + description 20 + tag 10 + type 10;
+        # Code Rabbit: description 20 + tag 10
+        assert ranked(engine, "eview") == [("Review Bot", 80), ("Code Rabbit", 30)]
+
+    def test_punctuated_tokens_match_as_written(self) -> None:
+        engine = SearchEngine.from_entries(ENTRIES)
+
+        # One token, not "code" + "review": exact tag 30, type 10
+        assert ranked(engine, "code-review") == [
+            ("Code Rabbit", 30),
+            ("Review Bot", 10),
+        ]
+        # No run long enough for the index: every entry is checked
+        assert ranked(engine, "s.") == [
+            ("Code Rabbit", 20),
+            ("Review Bot", 20),
+            ("Starter", 20),
+        ]
+
+    def test_every_token_must_match(self) -> None:
+        engine = SearchEngine.from_entries(ENTRIES)
+
+        assert [name for name, _ in ranked(engine, "code rabbit")] == ["Code Rabbit"]
+        assert ranked(engine, "code zebra") == []
+
+    def test_short_and_empty_queries(self) -> None:
+        engine = SearchEngine.from_entries(ENTRIES)
+
+        assert engine.search("") == []
+        assert engine.search(" c ") == []
+        assert engine.search("c +") == []
+
+    def test_ties_keep_index_order_and_limit(self) -> None:
+        engine = SearchEngine.from_entries(ENTRIES)
+
+        results = engine.search("helps", limit=1)
+        assert [result.entry["name"] for result in results] == ["Review Bot"]
+
+    def test_decode_postings_inverts_delta_encode(self) -> None:
+        assert decode_postings(delta_encode([3, 10, 11])) == [3, 10, 11]
+
+
+class TestLoading:
+    """Tests for loading a generated site's index"""
+
+    def test_shards_match_full_index(self, tmp_path: Path) -> None:
+        sharded = SearchEngine.from_site(write_site(tmp_path / "sharded", ENTRIES))
+        full_dir = tmp_path / "full"
+        full_dir.mkdir()
+        (full_dir / SEARCH_INDEX_FILENAME).write_text(json.dumps(ENTRIES))
+        full = SearchEngine.from_site(full_dir)
+
+        for query in ("code", "review bot", "helps", "web", "starter"):
+            assert ranked(sharded, query) == ranked(full, query)
+        assert sharded.entries[3]["category_title"] == "Web"
+        assert sharded.entries[0]["description"] == "Reviews pull requests."
+
+    def test_corrupt_shard_is_rejected(self, tmp_path: Path) -> None:
+        site = write_site(tmp_path, ENTRIES)
+        shard = next((site / "search").glob("details-1.*.json"))
+        shard.write_text(shard.read_text().replace("helps", "hinders"))
+
+        with pytest.raises(ValueError, match="manifest hash"):
+            SearchEngine.from_site(site)
+
+
+def run_node(tmp_path: Path, script: Path, site: Path, queries: list[str]) -> list:
+    """performSearch() results of a search script for every query."""
+    queries_path = tmp_path / "queries.json"
+    queries_path.write_text(json.dumps(queries))
+    harness = tmp_path / "harness.js"
+    harness.write_text(NODE_HARNESS)
+    completed = subprocess.run(
+        ["node", str(harness), str(script), str(site), str(queries_path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(completed.stdout)
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+class TestSearchJsMatchesBaseline:
+    """The indexed search.js must rank exactly like the full-scan baseline"""
+
+    def test_query_corpus_matches(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(REPO_ROOT)
+        entries = SearchEngine.from_catalog(REPO_ROOT / "data").entries
+        site = write_site(tmp_path / "site", entries)
+        (site / SEARCH_INDEX_FILENAME).write_text(json.dumps(entries))
+        baseline = tmp_path / "baseline.js"
+        baseline.write_text(BASELINE_SEARCH_JS)
+        queries = PARITY_QUERIES + SUBSTRING_QUERIES
+        for item in entries[::7]:
+            queries += [item["name"], item["name"][1:5], *item.get("tags", [])[:1]]
+
+        indexed = run_node(
+            tmp_path, REPO_ROOT / "static" / "js" / "search.js", site, queries
+        )
+        expected = run_node(tmp_path, baseline, site, queries)
+
+        assert len(expected[queries.index("chain")]) == 10
+        for query, got, want in zip(queries, indexed, expected):
+            assert got == want, query
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="node is not installed")
+class TestParityWithSearchJs:
+    """SearchEngine must rank exactly like static/js/search.js"""
+
+    def test_fixed_queries_match(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(REPO_ROOT)
+        engine = SearchEngine.from_catalog(REPO_ROOT / "data")
+        site = write_site(tmp_path / "site", engine.entries)
+        (site / SEARCH_INDEX_FILENAME).write_text(json.dumps(engine.entries))
+        baseline = tmp_path / "baseline.js"
+        baseline.write_text(BASELINE_SEARCH_JS)
+        queries = (
+            PARITY_QUERIES
+            + SUBSTRING_QUERIES
+            + [item["name"] for item in engine.entries[::25]]
+        )
+
+        expected = run_node(
+            tmp_path, REPO_ROOT / "static" / "js" / "search.js", site, queries
+        )
+        original = run_node(tmp_path, baseline, site, queries)
+
+        assert any(expected), "search.js returned no results at all"
+        loaded = SearchEngine.from_site(site)
+        for query, js_results, baseline_results in zip(queries, expected, original):
+            results = ranked(loaded, query)
+            assert results == [tuple(item) for item in js_results], query
+            assert results == [tuple(item) for item in baseline_results], query
@@ -0,0 +1,158 @@
+"""
+Unit tests for scripts/search_index.py
+
+Tests for:
+- reassembling the combined index from the core and detail shards
+- manifest hashes and content-addressed shard filenames
+- inverted index terms and delta-encoded postings
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from search_index import (
+    CORE_FIELDS,
+    build_core_terms,
+    build_description_terms,
+    build_search_files,
+    core_terms,
+    delta_encode,
+    dumps_compact,
+    split_terms,
+)
+
+
+def entry(name: str, boilerplate: bool = False) -> dict:
+    data = {
+        "name": name,
+        "url": f"https://example.com/{name.lower()}",
+        "description": f"{name} does useful things.",
+        "category": "web" if boilerplate else "coding",
+        "category_title": "Web Boilerplates" if boilerplate else "Coding Agents",
+        "type": "framework",
+        "tags": ["testing"],
+        "github_stars": None,
+        "pricing": "free",
+    }
+    if boilerplate:
+        data["is_boilerplate"] = True
+    return data
+
+
+ENTRIES = [entry(f"Agent{i}") for i in range(5)] + [entry("Starter", True)]
+
+
+def load(files: dict[str, str], path: str) -> dict:
+    return json.loads(files[f"search/{path}"])
+
+
+class TestBuildSearchFiles:
+    """Tests for build_search_files()"""
+
+    def test_shards_reassemble_entries(self) -> None:
+        files = build_search_files(ENTRIES, shard_size=4)
+        manifest = load(files, "manifest.json")
+        core = load(files, manifest["core"]["file"])
+
+        rebuilt = [dict(item) for item in core["entries"]]
+        for shard in manifest["details"]:
+            details = load(files, shard["file"])
+            assert details["start"] == shard["start"]
+            assert len(details["descriptions"]) == shard["count"]
+            for offset, description in enumerate(details["descriptions"]):
+                rebuilt[shard["start"] + offset]["description"] = description
+
+        assert manifest["entries"] == len(ENTRIES)
+        assert [shard["count"] for shard in manifest["details"]] == [4, 2]
+        for original, item in zip(ENTRIES, rebuilt):
+            kind = "boilerplate" if item.get("is_boilerplate") else "agent"
+            assert core["category_titles"][kind][item["category"]] == (
+                original["category_title"]
+            )
+            assert item["description"] == original["description"]
+            for field in CORE_FIELDS:
+                assert item.get(field) == (original.get(field) or None)
+
+    def test_core_leaves_out_descriptions_and_empty_fields(self) -> None:
+        files = build_search_files(ENTRIES)
+        core = load(files, load(files, "manifest.json")["core"]["file"])
+
+        assert "description" not in core["entries"][0]
+        assert "pricing" not in core["entries"][0]
+        assert "github_stars" not in core["entries"][0]
+        assert "is_boilerplate" not in core["entries"][0]
+
+    def test_manifest_records_content_hashes(self) -> None:
+        files = build_search_files(ENTRIES, shard_size=4)
+        manifest = load(files, "manifest.json")
+
+        for shard in [manifest["core"], *manifest["details"]]:
+            content = files[f"search/{shard['file']}"].encode("utf-8")
+            assert shard["sha256"] == hashlib.sha256(content).hexdigest()
+            assert shard["bytes"] == len(content)
+            assert shard["sha256"][:12] in shard["file"]
+
+    def test_only_changed_shards_get_new_names(self) -> None:
+        changed = [dict(item) for item in ENTRIES]
+        changed[-1]["description"] = "Now with a different description."
+
+        before = set(build_search_files(ENTRIES, shard_size=4))
+        after = set(build_search_files(changed, shard_size=4))
+
+        assert [name.split(".")[0] for name in after - before] == ["search/details-1"]
+        assert any(name.startswith("search/details-0.") for name in before & after)
+        assert any(name.startswith("search/core.") for name in before & after)
+
+    def test_output_is_compact(self) -> None:
+        files = build_search_files(ENTRIES)
+
+        for content in files.values():
+            assert content == dumps_compact(json.loads(content))
+            assert "\n" not in content
+
+
+class TestInvertedIndex:
+    """Tests for the inverted index terms"""
+
+    def test_split_terms(self) -> None:
+        assert split_terms("Next.js + AI: a C++ starter") == [
+            "next",
+            "js",
+            "ai",
+            "starter",
+        ]
+        assert split_terms(None) == []
+
+    def test_core_terms(self) -> None:
+        terms = core_terms(
+            {
+                "name": "Code Rabbit",
+                "tags": ["code-review", "review"],
+                "category": "coding-assistants",
+                "type": "code-review",
+            }
+        )
+
+        assert terms == ["code", "rabbit", "review", "coding", "assistants"]
+
+    def test_delta_encode(self) -> None:
+        assert delta_encode([3, 10, 11]) == [3, 7, 1]
+        assert delta_encode([]) == []
+
+    def test_core_terms_are_sorted_postings(self) -> None:
+        terms = build_core_terms(ENTRIES)
+
+        assert list(terms) == sorted(terms)
+        assert terms["testing"] == [0, 1, 1, 1, 1, 1]
+        assert terms["agent0"] == [0]
+
+    def test_description_terms_use_global_entry_numbers(self) -> None:
+        terms = build_description_terms(ENTRIES[4:], start=4)
+
+        assert terms["starter"] == [5]
+        assert terms["useful"] == [4, 1]
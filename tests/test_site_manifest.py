@@ -0,0 +1,410 @@
+"""
+Unit tests for scripts/site_manifest.py and the incremental page plan in
+scripts/generate_site.py
+
+Tests for:
+- SiteManifest fingerprints, template closures and persistence
+- stale output removal
+- write_if_changed() and sync_tree() leaving identical files untouched
+- plan_pages() dependencies (featured agents, category pages)
+- render_html() parity between worker processes and serial rendering
+- write_search_index() writing only the files of the chosen format
+"""
+
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from catalog import CatalogRecord, load_snapshot
+from config import load_site_config
+from generate_site import (
+    load_site_data,
+    plan_pages,
+    render_html,
+    write_search_index,
+)
+from models import SiteConfig, SiteLinks
+from site_manifest import (
+    OutputDeps,
+    SiteManifest,
+    WriteSummary,
+    prune_tree,
+    sync_tree,
+    write_if_changed,
+)
+
+
+REPO_ROOT = Path(__file__).parent.parent
+
+
+def record(path: str, sha256: str) -> CatalogRecord:
+    return CatalogRecord(path, "agent", sha256, {}, None)
+
+
+@pytest.fixture
+def template_dir(tmp_path: Path) -> Path:
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "base.html.jinja2").write_text(
+        "<main>{% block content %}{% endblock %}</main>"
+    )
+    (templates / "page.html.jinja2").write_text(
+        '{% extends "base.html.jinja2" %}{% block content %}{{ x }}{% endblock %}'
+    )
+    (templates / "other.html.jinja2").write_text("other")
+    return templates
+
+
+@pytest.fixture
+def manifest(tmp_path: Path, template_dir: Path) -> SiteManifest:
+    output_dir = tmp_path / "_site"
+    output_dir.mkdir()
+    return SiteManifest(
+        tmp_path / "manifest.json", output_dir, "key", template_dir=template_dir
+    )
+
+
+class TestSiteManifest:
+    """Tests for SiteManifest"""
+
+    def test_template_closure_follows_extends(self, manifest: SiteManifest) -> None:
+        assert manifest.template_closure("page.html.jinja2") == [
+            "base.html.jinja2",
+            "page.html.jinja2",
+        ]
+
+    def test_fingerprint_tracks_base_template(
+        self, manifest: SiteManifest, template_dir: Path, tmp_path: Path
+    ) -> None:
+        deps = OutputDeps(templates=["page.html.jinja2"])
+        before = manifest.fingerprint(deps)
+        (template_dir / "base.html.jinja2").write_text("<body>changed</body>")
+        fresh = SiteManifest(None, tmp_path / "_site", "key", template_dir=template_dir)
+
+        assert fresh.fingerprint(deps) != before
+
+    def test_fingerprint_tracks_records_and_values(self, manifest: SiteManifest) -> None:
+        base = manifest.fingerprint(OutputDeps(records=[record("a.yml", "1")]))
+
+        assert manifest.fingerprint(OutputDeps(records=[record("a.yml", "2")])) != base
+        assert manifest.fingerprint(OutputDeps(records=[record("b.yml", "1")])) != base
+        assert (
+            manifest.fingerprint(
+                OutputDeps(records=[record("a.yml", "1")], values={"count": 1})
+            )
+            != base
+        )
+
+    def test_is_current_requires_output_file(self, manifest: SiteManifest) -> None:
+        deps = OutputDeps(values={"a": 1})
+        fingerprint = manifest.fingerprint(deps)
+        manifest.record("page.html", "pages", fingerprint, deps)
+
+        assert not manifest.is_current("page.html", fingerprint)
+        (manifest.output_dir / "page.html").write_text("x")
+        assert manifest.is_current("page.html", fingerprint)
+        assert not manifest.is_current("page.html", "other")
+
+    def test_full_mode_is_never_current(
+        self, tmp_path: Path, template_dir: Path
+    ) -> None:
+        output_dir = tmp_path / "_site"
+        output_dir.mkdir()
+        (output_dir / "page.html").write_text("x")
+        manifest = SiteManifest(
+            None, output_dir, "key", full=True, template_dir=template_dir
+        )
+        manifest.record("page.html", "pages", "fp", OutputDeps())
+
+        assert not manifest.is_current("page.html", "fp")
+
+    def test_record_lists_inputs(self, manifest: SiteManifest) -> None:
+        deps = OutputDeps(
+            templates=["page.html.jinja2"], records=[record("agents/a.yml", "1")]
+        )
+        manifest.record("page.html", "pages", manifest.fingerprint(deps), deps)
+
+        inputs = manifest.outputs["page.html"]["inputs"]
+        assert inputs[-1] == "data/agents/a.yml"
+        assert [Path(item).name for item in inputs[:2]] == [
+            "base.html.jinja2",
+            "page.html.jinja2",
+        ]
+
+    def test_save_and_load_round_trip(self, manifest: SiteManifest) -> None:
+        manifest.record("page.html", "pages", "fp", OutputDeps())
+        manifest.save()
+
+        loaded = SiteManifest.load(
+            manifest.path, manifest.output_dir, "key", template_dir=manifest.template_dir
+        )
+
+        assert loaded.outputs["page.html"]["fingerprint"] == "fp"
+
+    def test_load_discards_other_build_key(self, manifest: SiteManifest) -> None:
+        manifest.record("page.html", "pages", "fp", OutputDeps())
+        manifest.save()
+
+        loaded = SiteManifest.load(manifest.path, manifest.output_dir, "new-key")
+
+        assert loaded.outputs == {}
+
+    def test_remove_stale_deletes_unproduced_outputs(
+        self, manifest: SiteManifest
+    ) -> None:
+        stale = manifest.output_dir / "boilerplates" / "gone" / "index.html"
+        stale.parent.mkdir(parents=True)
+        stale.write_text("x")
+        (manifest.output_dir / "index.html").write_text("x")
+        manifest.record("boilerplates/gone/index.html", "pages", "fp", OutputDeps())
+        manifest.record("index.html", "pages", "fp", OutputDeps())
+        manifest.record("stats.json", "stats", "fp", OutputDeps())
+
+        removed = manifest.remove_stale("pages", {"index.html"})
+
+        assert removed == ["boilerplates/gone/index.html"]
+        assert not stale.exists()
+        assert not stale.parent.exists()
+        assert (manifest.output_dir / "index.html").exists()
+        assert "stats.json" in manifest.outputs
+
+    def test_remove_stale_deletes_compressed_siblings(
+        self, manifest: SiteManifest
+    ) -> None:
+        (manifest.output_dir / "old.html").write_text("x")
+        (manifest.output_dir / "old.html.gz").write_bytes(b"gz")
+        manifest.record("old.html", "pages", "fp", OutputDeps())
+
+        manifest.remove_stale("pages", set())
+
+        assert not (manifest.output_dir / "old.html.gz").exists()
+
+
+class TestWriteIfChanged:
+    """Tests for write_if_changed()"""
+
+    def test_writes_new_and_changed_files(self, tmp_path: Path) -> None:
+        target = tmp_path / "nested" / "page.html"
+        summary = WriteSummary()
+
+        assert write_if_changed(target, "one", summary)
+        assert write_if_changed(target, "two", summary)
+        assert target.read_text() == "two"
+        assert (summary.written, summary.unchanged) == (2, 0)
+
+    def test_identical_content_is_not_rewritten(self, tmp_path: Path) -> None:
+        target = tmp_path / "page.html"
+        target.write_text("same")
+        os.utime(target, ns=(1_000_000_000, 1_000_000_000))
+        summary = WriteSummary()
+
+        assert not write_if_changed(target, "same", summary)
+        assert target.stat().st_mtime_ns == 1_000_000_000
+        assert str(summary) == "0 written, 1 unchanged, 0 deleted"
+
+
+class TestSyncTree:
+    """Tests for sync_tree()"""
+
+    @pytest.fixture
+    def source(self, tmp_path: Path) -> Path:
+        source = tmp_path / "static"
+        (source / "css").mkdir(parents=True)
+        (source / "css" / "style.css").write_text("body {}")
+        (source / "app.js").write_text("run()")
+        return source
+
+    def test_initial_sync_copies_everything(self, source: Path, tmp_path: Path) -> None:
+        target = tmp_path / "_site" / "static"
+        summary = WriteSummary()
+
+        sync_tree(source, target, summary)
+
+        assert (target / "css" / "style.css").read_text() == "body {}"
+        assert (target / "app.js").read_text() == "run()"
+        assert (summary.written, summary.unchanged, summary.deleted) == (2, 0, 0)
+
+    def test_copies_only_modified_and_deletes_removed(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "_site" / "static"
+        sync_tree(source, target)
+        (source / "app.js").write_text("run(2)")
+        shutil.rmtree(source / "css")
+        (target / "css" / "style.css").touch()
+        summary = WriteSummary()
+
+        sync_tree(source, target, summary)
+
+        assert (target / "app.js").read_text() == "run(2)"
+        assert not (target / "css").exists()
+        assert (summary.written, summary.unchanged, summary.deleted) == (1, 0, 1)
+
+    def test_keeps_compressed_siblings_of_existing_files(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "_site" / "static"
+        sync_tree(source, target)
+        (target / "app.js.gz").write_bytes(b"gz")
+        (target / "gone.js.gz").write_bytes(b"gz")
+
+        sync_tree(source, target)
+
+        assert (target / "app.js.gz").exists()
+        assert not (target / "gone.js.gz").exists()
+
+    def test_prune_tree_removes_unlisted_files(self, tmp_path: Path) -> None:
+        root = tmp_path / "_site" / "search"
+        root.mkdir(parents=True)
+        for name in ("core.new.json", "core.old.json", "core.old.json.gz"):
+            (root / name).write_text("x")
+
+        assert prune_tree(root, {Path("core.new.json")}) == 2
+        assert sorted(path.name for path in root.iterdir()) == ["core.new.json"]
+        assert prune_tree(root, set()) == 1
+        assert not root.exists()
+
+    def test_same_content_with_new_mtime_is_left_alone(
+        self, source: Path, tmp_path: Path
+    ) -> None:
+        target = tmp_path / "_site" / "static"
+        sync_tree(source, target)
+        os.utime(target / "app.js", ns=(1_000_000_000, 1_000_000_000))
+        summary = WriteSummary()
+
+        sync_tree(source, target, summary)
+
+        assert (target / "app.js").stat().st_mtime_ns == 1_000_000_000
+        assert (summary.written, summary.unchanged) == (0, 2)
+
+
+def write_yaml(path: Path, data: dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(yaml.dump(data, sort_keys=False))
+
+
+def agent_data(name: str, featured: bool = False) -> dict:
+    return {
+        "name": name,
+        "url": f"https://example.com/{name.lower()}",
+        "description": "A test agent framework for unit testing purposes.",
+        "category": "test-category",
+        "tags": ["testing"],
+        "featured": featured,
+    }
+
+
+class TestPlanPages:
+    """Tests for plan_pages() dependencies"""
+
+    @pytest.fixture
+    def pages(self, tmp_path: Path) -> dict:
+        data_dir = tmp_path / "data"
+        write_yaml(
+            data_dir / "categories" / "test-category.yml",
+            {
+                "id": "test-category",
+                "title": "Test Category",
+                "description": "A test category description.",
+                "order": 1,
+            },
+        )
+        write_yaml(data_dir / "agents" / "test" / "alpha.yml", agent_data("Alpha", True))
+        write_yaml(data_dir / "agents" / "test" / "beta.yml", agent_data("Beta"))
+        site_config = SiteConfig(
+            links=SiteLinks(
+                github="https://example.com/repo",
+                issues="https://example.com/issues",
+                discussions="https://example.com/discussions",
+                contributing="https://example.com/contributing",
+                suggest="https://example.com/suggest",
+            )
+        )
+
+        data = load_site_data(load_snapshot(data_dir), site_config)
+        return {page.output: page for page in plan_pages(data)}
+
+    @staticmethod
+    def record_paths(page) -> list[str]:
+        return sorted(record.path for record in page.deps.records)
+
+    def test_homepage_depends_on_featured_agents_only(self, pages: dict) -> None:
+        assert self.record_paths(pages["index.html"]) == [
+            "agents/test/alpha.yml",
+            "categories/test-category.yml",
+        ]
+
+    def test_category_page_depends_on_its_agents(self, pages: dict) -> None:
+        assert self.record_paths(pages["categories/test-category.html"]) == [
+            "agents/test/alpha.yml",
+            "agents/test/beta.yml",
+            "categories/test-category.yml",
+        ]
+
+    def test_empty_boilerplate_categories_have_no_page(self, pages: dict) -> None:
+        assert sorted(pages) == [
+            "boilerplates/index.html",
+            "categories/test-category.html",
+            "index.html",
+        ]
+
+
+class TestRenderHtml:
+    """Tests for render_html()"""
+
+    def test_parallel_output_is_byte_identical_to_serial(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.chdir(REPO_ROOT)
+        data = load_site_data(load_snapshot(REPO_ROOT / "data"), load_site_config())
+        pages = plan_pages(data)
+
+        serial = [(page.output, html) for page, html in render_html(data, pages, 1)]
+        parallel = [(page.output, html) for page, html in render_html(data, pages, 3)]
+
+        assert len(serial) == len(pages)
+        assert parallel == serial
+
+
+class TestWriteSearchIndex:
+    """Tests for write_search_index()"""
+
+    @pytest.fixture
+    def data(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(REPO_ROOT)
+        return load_site_data(load_snapshot(REPO_ROOT / "data"), load_site_config())
+
+    def test_sharded_format_skips_single_file_index(self, data, tmp_path: Path) -> None:
+        output_dir = tmp_path / "_site"
+
+        written = write_search_index(data, output_dir, index_format="sharded")
+
+        assert written is not None
+        assert written[0] == output_dir / "search" / "manifest.json"
+        assert written[3] == len(list((output_dir / "search").iterdir()))
+        assert not (output_dir / "search-index.json").exists()
+
+    def test_switching_format_removes_the_other_files(
+        self, data, tmp_path: Path
+    ) -> None:
+        output_dir = tmp_path / "_site"
+        manifest = SiteManifest(tmp_path / "manifest.json", output_dir, "key")
+        write_search_index(data, output_dir, manifest, index_format="full")
+        assert (output_dir / "search-index.json").exists()
+
+        write_search_index(data, output_dir, manifest, index_format="sharded")
+
+        assert not (output_dir / "search-index.json").exists()
+        assert (output_dir / "search" / "manifest.json").exists()
+
+        write_search_index(data, output_dir, manifest, index_format="full")
+
+        assert (output_dir / "search-index.json").exists()
+        assert not (output_dir / "search").exists()
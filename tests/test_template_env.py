@@ -0,0 +1,111 @@
+"""
+Unit tests for scripts/template_env.py
+
+Tests for:
+- bytecode cache hits across environments and misses after template edits
+- cache keys that include compile options
+- rendering parity with and without the cache
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+from jinja2 import Environment, FileSystemLoader
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from template_env import CacheStats, ContentBytecodeCache, create_environment
+
+
+@pytest.fixture
+def template_dir(tmp_path: Path) -> Path:
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "base.html.jinja2").write_text(
+        "<main>\n{% block content %}{% endblock %}\n</main>\n"
+    )
+    (templates / "page.html.jinja2").write_text(
+        '{% extends "base.html.jinja2" %}\n'
+        "{% block content %}\n"
+        "  {% for item in items %}{{ item | shout }}{% endfor %}\n"
+        "{% endblock %}\n"
+    )
+    return templates
+
+
+def render(template_dir: Path, cache_dir: Path | None, stats: CacheStats) -> str:
+    env = create_environment(
+        filters={"shout": str.upper},
+        template_dir=template_dir,
+        cache_dir=cache_dir,
+        stats=stats,
+    )
+    return env.get_template("page.html.jinja2").render(items=["a", "b"])
+
+
+class TestCreateEnvironment:
+    """Tests for create_environment() and ContentBytecodeCache"""
+
+    def test_second_environment_hits_cache(
+        self, template_dir: Path, tmp_path: Path
+    ) -> None:
+        stats = CacheStats()
+        cache_dir = tmp_path / "cache"
+
+        render(template_dir, cache_dir, stats)
+        assert (stats.hits, stats.misses) == (0, 2)
+
+        render(template_dir, cache_dir, stats)
+        assert (stats.hits, stats.misses) == (2, 2)
+        assert str(stats) == "2/4 templates loaded from bytecode cache (50% hit rate)"
+
+    def test_edited_template_misses(self, template_dir: Path, tmp_path: Path) -> None:
+        stats = CacheStats()
+        cache_dir = tmp_path / "cache"
+        render(template_dir, cache_dir, stats)
+        (template_dir / "base.html.jinja2").write_text(
+            "<body>{% block content %}{% endblock %}</body>"
+        )
+        stats.drain()
+
+        html = render(template_dir, cache_dir, stats)
+
+        assert html.startswith("<body>")
+        assert (stats.hits, stats.misses) == (1, 1)
+
+    def test_compile_options_are_part_of_the_key(
+        self, template_dir: Path, tmp_path: Path
+    ) -> None:
+        stats = CacheStats()
+        cache_dir = tmp_path / "cache"
+        render(template_dir, cache_dir, stats)
+        stats.drain()
+        plain = Environment(
+            loader=FileSystemLoader(str(template_dir)),
+            bytecode_cache=ContentBytecodeCache(cache_dir, stats),
+        )
+        plain.filters["shout"] = str.upper
+
+        plain.get_template("page.html.jinja2").render(items=[])
+
+        assert (stats.hits, stats.misses) == (0, 2)
+
+    def test_cached_output_matches_uncached(
+        self, template_dir: Path, tmp_path: Path
+    ) -> None:
+        stats = CacheStats()
+        uncached = render(template_dir, None, stats)
+        render(template_dir, tmp_path / "cache", stats)
+
+        assert render(template_dir, tmp_path / "cache", stats) == uncached
+        assert stats.hits == 2
+
+    def test_no_cache_dir_counts_nothing(self, template_dir: Path) -> None:
+        stats = CacheStats()
+
+        render(template_dir, None, stats)
+
+        assert stats.lookups == 0
+        assert str(stats) == "no templates compiled"
@@ -0,0 +1,171 @@
+"""
+Tests for scripts/url_extract_cache.py and cached URL extraction
+
+Tests for:
+- storing and looking up extracted URLs by path and content hash
+- discarding the cache when the extractors change, and pruning deleted files
+- extractor_fingerprint() covering the modules the extractors depend on
+- extract_files() parsing only new or changed files
+- extract_urls_from_entry() matching the URLs of validated entries
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import check_links
+from check_links import (
+    EXTRACTOR_SOURCES,
+    extract_files,
+    extract_in_pool,
+    extract_urls_from_entry,
+    extractor_fingerprint,
+)
+from models import AgentEntry
+from url_extract_cache import UrlExtractCache
+
+URLS = [("https://docs.test/one", "direct")]
+
+
+class TestUrlExtractCache:
+    """Tests for UrlExtractCache"""
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        path = tmp_path / "urls.json"
+        cache = UrlExtractCache(path, "v1")
+        cache.put("docs/GUIDE.md", "abc", URLS)
+        cache.save()
+
+        cache = UrlExtractCache(path, "v1")
+        assert cache.get("docs/GUIDE.md", "abc") == URLS
+        assert cache.hits == 1
+
+    def test_changed_content_misses(self, tmp_path: Path) -> None:
+        cache = UrlExtractCache(tmp_path / "urls.json", "v1")
+        cache.put("docs/GUIDE.md", "abc", URLS)
+
+        assert cache.get("docs/GUIDE.md", "def") is None
+        assert cache.hits == 0
+
+    def test_changed_extractors_discard_the_cache(self, tmp_path: Path) -> None:
+        path = tmp_path / "urls.json"
+        cache = UrlExtractCache(path, "v1")
+        cache.put("docs/GUIDE.md", "abc", URLS)
+        cache.save()
+
+        assert UrlExtractCache(path, "v2").get("docs/GUIDE.md", "abc") is None
+
+    def test_prune_drops_files_not_seen(self, tmp_path: Path) -> None:
+        path = tmp_path / "urls.json"
+        cache = UrlExtractCache(path, "v1")
+        cache.put("docs/GUIDE.md", "abc", URLS)
+        cache.put("docs/GONE.md", "abc", URLS)
+        cache.save()
+
+        cache = UrlExtractCache(path, "v1")
+        cache.get("docs/GUIDE.md", "abc")
+        cache.save(prune=True)
+
+        assert set(UrlExtractCache(path, "v1").files) == {"docs/GUIDE.md"}
+
+    def test_unreadable_file_starts_empty(self, tmp_path: Path) -> None:
+        path = tmp_path / "urls.json"
+        path.write_text("{not json")
+
+        assert UrlExtractCache(path, "v1").files == {}
+
+
+@pytest.mark.parametrize("changed", EXTRACTOR_SOURCES)
+def test_fingerprint_covers_extractor_sources(tmp_path: Path, changed: str) -> None:
+    scripts_dir = Path(check_links.__file__).parent
+    copy = tmp_path / "scripts"
+    copy.mkdir()
+    for name in EXTRACTOR_SOURCES:
+        shutil.copy(scripts_dir / name, copy / name)
+    with open(copy / changed, "a") as f:
+        f.write("\n# changed\n")
+
+    assert extractor_fingerprint(copy) != extractor_fingerprint(scripts_dir)
+
+
+class TestExtractFiles:
+    """Tests for extract_files()"""
+
+    def test_only_changed_files_are_parsed(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        guide = tmp_path / "GUIDE.md"
+        readme = tmp_path / "README.md"
+        guide.write_text("See https://docs.test/one\n")
+        readme.write_text("See https://docs.test/two\n")
+        cache = UrlExtractCache(tmp_path / "urls.json", "v1")
+        first = extract_files([guide, readme], tmp_path, cache, jobs=1)
+
+        parsed: list[str] = []
+        extract = check_links.extract_urls_from_file
+
+        def counting_extract(file_path: Path) -> list:
+            parsed.append(file_path.name)
+            return extract(file_path)
+
+        monkeypatch.setattr(check_links, "extract_urls_from_file", counting_extract)
+        readme.write_text("See https://docs.test/three\n")
+        second = extract_files([guide, readme], tmp_path, cache, jobs=1)
+
+        assert parsed == ["README.md"]
+        assert second[guide] == first[guide]
+        assert [url for url, _ in second[readme]] == ["https://docs.test/three"]
+
+    def test_pool_keeps_input_order(self, tmp_path: Path) -> None:
+        paths = []
+        for i in range(80):
+            path = tmp_path / f"doc{i}.md"
+            path.write_text(f"See https://docs.test/{i}\n")
+            paths.append(str(path))
+
+        extracted = extract_in_pool(paths, jobs=2)
+
+        assert [urls[0][0] for urls in extracted] == [
+            f"https://docs.test/{i}" for i in range(80)
+        ]
+
+
+@pytest.mark.parametrize(
+    "url",
+    [
+        "https://example.org",
+        "https://example.org/docs",
+        "https://example.org?q=1",
+        "HTTPS://Example.ORG/Docs",
+        "https://bücher.de",
+        "https://BÜCHER.de/katalog?q=1",
+        "https://straße.de",
+        "https://example.org:443/docs",
+        "http://example.org:8080",
+        "https://example.com/a b",
+        "https://example.com/ü",
+        "https://example.com?q=a b",
+        "https://example.com?x=ü",
+        "https://example.com/a/../b",
+        "https://example.com/a/./b#Top",
+    ],
+)
+def test_entry_urls_match_validated_entry(url: str) -> None:
+    data = {
+        "name": "Example",
+        "url": url,
+        "description": "An example agent for testing URL extraction",
+        "category": "frameworks",
+        "github_repo": "example/agent",
+    }
+
+    expected = str(AgentEntry(**data).url)
+    assert extract_urls_from_entry(data) == [
+        (expected, "url"),
+        ("https://github.com/example/agent", "github_repo"),
+    ]
@@ -11,6 +11,7 @@ Tests for validation functions including:
 - check_category_references()
 - check_duplicates()
 - normalize_url()
+- refresh_validation_manifest() and incremental helpers
 """
 
 import argparse
@@ -36,7 +37,10 @@ from validate import (
     load_category_ids,
     load_tag_registry,
     load_yaml_data,
+    manifest_category_ids,
+    manifest_validated_entries,
     normalize_url,
+    refresh_validation_manifest,
     validate_yaml_file,
 )
 
@@ -1178,3 +1182,115 @@ class TestTagRegistry:
 
         assert len(errors) == 1
         assert "Unknown tag" in errors[0]
+
+
+class TestIncrementalManifest:
+    """Tests for the content-hash validation manifest."""
+
+    def test_first_run_validates_everything(
+        self,
+        tmp_data_dir: Path,
+        valid_agent_yaml: dict[str, Any],
+        valid_category_yaml: dict[str, Any],
+    ) -> None:
+        """Every file is dirty when no manifest exists yet."""
+        create_yaml_file(tmp_data_dir / "categories" / "osf.yml", valid_category_yaml)
+        create_yaml_file(
+            tmp_data_dir / "agents" / "open-source-frameworks" / "a.yml",
+            valid_agent_yaml,
+        )
+
+        manifest, dirty = refresh_validation_manifest(tmp_data_dir)
+
+        assert sorted(dirty) == [
+            "agents/open-source-frameworks/a.yml",
+            "categories/osf.yml",
+        ]
+        assert manifest["categories/osf.yml"].keys["id"] == "open-source-frameworks"
+
+    def test_only_changed_files_are_revalidated(
+        self, tmp_data_dir: Path, valid_agent_yaml: dict[str, Any]
+    ) -> None:
+        """Unchanged files are served from the manifest."""
+        agents_dir = tmp_data_dir / "agents" / "open-source-frameworks"
+        create_yaml_file(agents_dir / "a.yml", valid_agent_yaml)
+        create_yaml_file(
+            agents_dir / "b.yml", {**valid_agent_yaml, "url": "https://example.com/b"}
+        )
+        refresh_validation_manifest(tmp_data_dir)
+
+        create_yaml_file(agents_dir / "b.yml", {**valid_agent_yaml, "url": "bad"})
+        manifest, dirty = refresh_validation_manifest(tmp_data_dir)
+
+        assert dirty == ["agents/open-source-frameworks/b.yml"]
+        assert manifest["agents/open-source-frameworks/a.yml"].error is None
+        error = manifest["agents/open-source-frameworks/b.yml"].error
+        assert error is not None and "Validation error" in error
+
+    def test_nothing_dirty_on_second_run(
+        self, tmp_data_dir: Path, valid_agent_yaml: dict[str, Any]
+    ) -> None:
+        """A repeated run re-validates nothing."""
+        create_yaml_file(
+            tmp_data_dir / "agents" / "open-source-frameworks" / "a.yml",
+            valid_agent_yaml,
+        )
+        refresh_validation_manifest(tmp_data_dir)
+
+        _, dirty = refresh_validation_manifest(tmp_data_dir)
+
+        assert dirty == []
+
+    def test_manifest_stores_only_cross_file_keys(
+        self, tmp_data_dir: Path, valid_agent_yaml: dict[str, Any]
+    ) -> None:
+        """Only the keys needed for cross-file checks are cached."""
+        create_yaml_file(
+            tmp_data_dir / "agents" / "open-source-frameworks" / "a.yml",
+            valid_agent_yaml,
+        )
+
+        manifest, _ = refresh_validation_manifest(tmp_data_dir)
+        keys = manifest["agents/open-source-frameworks/a.yml"].keys
+
+        assert set(keys) == {"category", "url", "tags"}
+
+    def test_cross_file_checks_use_full_cached_key_set(
+        self, tmp_data_dir: Path, valid_agent_yaml: dict[str, Any]
+    ) -> None:
+        """A new duplicate is caught against an unchanged file."""
+        agents_dir = tmp_data_dir / "agents" / "open-source-frameworks"
+        create_yaml_file(agents_dir / "a.yml", valid_agent_yaml)
+        refresh_validation_manifest(tmp_data_dir)
+        create_yaml_file(agents_dir / "b.yml", valid_agent_yaml)
+
+        manifest, dirty = refresh_validation_manifest(tmp_data_dir)
+        entries = manifest_validated_entries(manifest, tmp_data_dir, "agent")
+        errors = check_duplicates(entries, "url")
+
+        assert dirty == ["agents/open-source-frameworks/b.yml"]
+        assert len(errors) == 1
+        assert "a.yml" in errors[0] and "b.yml" in errors[0]
+
+    def test_invalid_entries_excluded_from_cross_file_set(
+        self, tmp_data_dir: Path, valid_agent_yaml: dict[str, Any]
+    ) -> None:
+        """Entries that failed validation are not cross-checked."""
+        create_yaml_file(
+            tmp_data_dir / "agents" / "open-source-frameworks" / "a.yml",
+            {**valid_agent_yaml, "description": "short"},
+        )
+
+        manifest, _ = refresh_validation_manifest(tmp_data_dir)
+
+        assert manifest_validated_entries(manifest, tmp_data_dir, "agent") == []
+
+    def test_manifest_category_ids(
+        self, tmp_data_dir: Path, valid_category_yaml: dict[str, Any]
+    ) -> None:
+        """Category ids come from cached keys."""
+        create_yaml_file(tmp_data_dir / "categories" / "osf.yml", valid_category_yaml)
+
+        manifest, _ = refresh_validation_manifest(tmp_data_dir)
+
+        assert manifest_category_ids(manifest, "category") == {"open-source-frameworks"}
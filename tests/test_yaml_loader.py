@@ -0,0 +1,69 @@
+"""
+Tests for scripts/yaml_loader.py
+
+Checks that the libyaml fast path produces exactly the same data as the
+pure-Python SafeLoader for every file in data/.
+"""
+
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+import yaml
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from yaml_loader import LIBYAML_AVAILABLE, pure_python_load, safe_load
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+DATA_FILES = sorted(DATA_DIR.rglob("*.yml"))
+
+
+def typed(value):
+    """Pair every scalar with its type so True/1 or date/str mismatches fail."""
+    if isinstance(value, dict):
+        return {key: typed(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [typed(item) for item in value]
+    return (type(value).__name__, value)
+
+
+def test_data_tree_is_not_empty() -> None:
+    assert len(DATA_FILES) > 100
+
+
+@pytest.mark.skipif(not LIBYAML_AVAILABLE, reason="PyYAML built without libyaml")
+def test_fast_loader_matches_pure_python_over_data_tree() -> None:
+    mismatched = []
+    for path in DATA_FILES:
+        source = path.read_text(encoding="utf-8")
+        if typed(safe_load(source)) != typed(pure_python_load(source)):
+            mismatched.append(str(path.relative_to(DATA_DIR)))
+
+    assert mismatched == []
+
+
+def test_quoted_dates_stay_strings() -> None:
+    source = "last_updated: '2026-06-12'\nadded_date: 2025-01-15\n"
+    data = safe_load(source)
+
+    assert data == {"last_updated": "2026-06-12", "added_date": date(2025, 1, 15)}
+    assert typed(data) == typed(pure_python_load(source))
+
+
+def test_value_types_match() -> None:
+    source = "stars: 1200\narchived: false\nempty:\nratio: 1.5\ntags: [a, b]\n"
+
+    assert typed(safe_load(source)) == typed(pure_python_load(source))
+
+
+def test_rejects_unsafe_tags() -> None:
+    with pytest.raises(yaml.YAMLError):
+        safe_load("!!python/object/apply:os.system ['true']")
+
+
+def test_syntax_errors_raise_yaml_error() -> None:
+    with pytest.raises(yaml.YAMLError):
+        safe_load("name: [unclosed")